@@ -0,0 +1,66 @@
+"""
+Ambiente das migrações: usa o mesmo DATABASE_URL e os mesmos drivers
+assíncronos da aplicação (asyncpg/aiosqlite).
+
+    alembic upgrade head                              # aplica as migrações pendentes
+    alembic revision --autogenerate -m "descrição"    # gera uma nova migração a partir dos modelos
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import get_settings
+from app.core.database import Base, async_database_url
+# Todos os modelos precisam estar registrados no metadata (autogenerate)
+from app.models.user import User  # noqa: F401
+from app.models.team import Team, TeamDetail  # noqa: F401
+from app.models.competition import Competition, TeamCompetition  # noqa: F401
+from app.models.indicadores import IndicadoresSnapshot  # noqa: F401
+from app.models.match import Match  # noqa: F401
+from app.models.standing import Standing, StandingMatch  # noqa: F401
+from app.models.sync_state import SyncState  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+DATABASE_URL = async_database_url(get_settings().DATABASE_URL)
+
+
+def run_migrations_offline() -> None:
+    """Gera o SQL das migrações sem conectar no banco (alembic upgrade head --sql)"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    # render_as_batch: ALTER TABLE no SQLite é feito recriando a tabela
+    context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    connectable = create_async_engine(DATABASE_URL, poolclass=pool.NullPool)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_async_migrations())
@@ -0,0 +1,244 @@
+"""schema inicial
+
+Tabelas que antes eram criadas com Base.metadata.create_all no startup, mais
+a busca por trigramas do PostgreSQL (pg_trgm + unaccent) quando disponível.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 13:57:07.605714
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# identificadores da revisão, usados pelo Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Índice de busca aproximada de times (app.repositories.team.TRIGRAM_SEARCH_INDEX).
+# unaccent() não é IMMUTABLE, então o índice usa um wrapper que fixa o dicionário.
+TRIGRAM_SEARCH_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS "
+    "$$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$",
+    "CREATE INDEX IF NOT EXISTS ix_teams_search_trgm ON teams USING gin "
+    "((f_unaccent(lower(name || ' ' || coalesce(short_name, '') || ' ' || coalesce(tla, '')))) gin_trgm_ops)",
+)
+
+
+def upgrade() -> None:
+    """Cria o schema completo"""
+    op.create_table('competitions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('external_id', sa.Integer(), nullable=False),
+    sa.Column('code', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('type', sa.String(), nullable=True),
+    sa.Column('emblem', sa.String(), nullable=True),
+    sa.Column('season', sa.JSON(), nullable=True),
+    sa.Column('synced_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('competitions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_competitions_code'), ['code'], unique=True)
+        batch_op.create_index(batch_op.f('ix_competitions_external_id'), ['external_id'], unique=True)
+        batch_op.create_index(batch_op.f('ix_competitions_id'), ['id'], unique=False)
+
+    op.create_table('indicadores_snapshot',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('generated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('standing_matches',
+    sa.Column('match_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('competition_code', sa.String(), nullable=False),
+    sa.Column('season', sa.Integer(), nullable=False),
+    sa.Column('home_team_external_id', sa.Integer(), nullable=False),
+    sa.Column('away_team_external_id', sa.Integer(), nullable=False),
+    sa.Column('home_goals', sa.Integer(), nullable=False),
+    sa.Column('away_goals', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('match_id')
+    )
+    op.create_table('standings',
+    sa.Column('competition_code', sa.String(), nullable=False),
+    sa.Column('season', sa.Integer(), nullable=False),
+    sa.Column('team_external_id', sa.Integer(), nullable=False),
+    sa.Column('team', sa.JSON(), nullable=False),
+    sa.Column('played', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('draws', sa.Integer(), nullable=False),
+    sa.Column('losses', sa.Integer(), nullable=False),
+    sa.Column('goals_for', sa.Integer(), nullable=False),
+    sa.Column('goals_against', sa.Integer(), nullable=False),
+    sa.Column('points', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('competition_code', 'season', 'team_external_id')
+    )
+    op.create_table('sync_state',
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('synced_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_table('teams',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('external_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('short_name', sa.String(), nullable=True),
+    sa.Column('tla', sa.String(), nullable=True),
+    sa.Column('crest', sa.String(), nullable=True),
+    sa.Column('area', sa.String(), nullable=True),
+    sa.Column('founded', sa.Integer(), nullable=True),
+    sa.Column('club_colors', sa.String(), nullable=True),
+    sa.Column('venue', sa.String(), nullable=True),
+    sa.Column('website', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('teams', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_teams_external_id'), ['external_id'], unique=True)
+        batch_op.create_index(batch_op.f('ix_teams_id'), ['id'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('team_favorite', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_username'), ['username'], unique=True)
+
+    op.create_table('matches',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('utc_date', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('matchday', sa.Integer(), nullable=True),
+    sa.Column('stage', sa.String(), nullable=True),
+    sa.Column('group', sa.String(), nullable=True),
+    sa.Column('last_updated', sa.DateTime(), nullable=False),
+    sa.Column('competition_code', sa.String(), nullable=True),
+    sa.Column('competition', sa.JSON(), nullable=False),
+    sa.Column('season', sa.JSON(), nullable=True),
+    sa.Column('home_team_id', sa.Integer(), nullable=True),
+    sa.Column('away_team_id', sa.Integer(), nullable=True),
+    sa.Column('home_team_external_id', sa.Integer(), nullable=False),
+    sa.Column('away_team_external_id', sa.Integer(), nullable=False),
+    sa.Column('home_team', sa.JSON(), nullable=False),
+    sa.Column('away_team', sa.JSON(), nullable=False),
+    sa.Column('score', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['away_team_id'], ['teams.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['home_team_id'], ['teams.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.create_index('ix_matches_away_team_utc_date', ['away_team_external_id', 'utc_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_matches_competition_code'), ['competition_code'], unique=False)
+        batch_op.create_index('ix_matches_home_team_utc_date', ['home_team_external_id', 'utc_date'], unique=False)
+        batch_op.create_index(batch_op.f('ix_matches_status'), ['status'], unique=False)
+
+    op.create_table('team_competitions',
+    sa.Column('competition_id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['competition_id'], ['competitions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('competition_id', 'team_id')
+    )
+    with op.batch_alter_table('team_competitions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_team_competitions_team_id'), ['team_id'], unique=False)
+
+    op.create_table('team_details',
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('area', sa.JSON(), nullable=True),
+    sa.Column('coach', sa.JSON(), nullable=True),
+    sa.Column('squad', sa.JSON(), nullable=True),
+    sa.Column('etag', sa.String(), nullable=True),
+    sa.Column('last_modified', sa.String(), nullable=True),
+    sa.Column('synced_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('team_id')
+    )
+
+    install_trigram_search()
+
+
+def install_trigram_search() -> None:
+    """
+    Extensões e índice GIN da busca de times, só no PostgreSQL.
+
+    Sem permissão para criar as extensões (ex.: banco gerenciado) a migração
+    segue normalmente: o savepoint é desfeito e a busca usa o índice em memória.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    if context.is_offline_mode():
+        # alembic upgrade head --sql: o script gerado leva o DDL como está
+        for statement in TRIGRAM_SEARCH_DDL:
+            op.execute(statement)
+        return
+    savepoint = bind.begin_nested()
+    try:
+        for statement in TRIGRAM_SEARCH_DDL:
+            bind.exec_driver_sql(statement)
+        savepoint.commit()
+    except sa.exc.DBAPIError:
+        savepoint.rollback()
+
+
+def downgrade() -> None:
+    """Remove o schema completo (as extensões do PostgreSQL ficam instaladas)"""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_teams_search_trgm")
+        op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
+
+    op.drop_table('team_details')
+    with op.batch_alter_table('team_competitions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_team_competitions_team_id'))
+
+    op.drop_table('team_competitions')
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_matches_status'))
+        batch_op.drop_index('ix_matches_home_team_utc_date')
+        batch_op.drop_index(batch_op.f('ix_matches_competition_code'))
+        batch_op.drop_index('ix_matches_away_team_utc_date')
+
+    op.drop_table('matches')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_username'))
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+
+    op.drop_table('users')
+    with op.batch_alter_table('teams', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_teams_id'))
+        batch_op.drop_index(batch_op.f('ix_teams_external_id'))
+
+    op.drop_table('teams')
+    op.drop_table('sync_state')
+    op.drop_table('standings')
+    op.drop_table('standing_matches')
+    op.drop_table('indicadores_snapshot')
+    with op.batch_alter_table('competitions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_competitions_id'))
+        batch_op.drop_index(batch_op.f('ix_competitions_external_id'))
+        batch_op.drop_index(batch_op.f('ix_competitions_code'))
+
+    op.drop_table('competitions')
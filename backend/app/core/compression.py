@@ -0,0 +1,148 @@
+"""
+Compressão das respostas HTTP (gzip e, se o pacote brotli estiver instalado, br).
+
+A codificação é negociada pelo Accept-Encoding e aplicada apenas a tipos
+textuais/JSON acima de RESPONSE_COMPRESSION_MIN_SIZE. Respostas que já
+trazem Content-Encoding (ex.: corpos pré-comprimidos do cache de respostas)
+são repassadas sem alteração; respostas em streaming são comprimidas por chunk.
+"""
+import gzip
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele, apenas gzip
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Escolhe br ou gzip conforme o Accept-Encoding (respeitando q=0)"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    candidates = ("br", "gzip") if brotli is not None else ("gzip",)
+    for encoding in candidates:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Comprime o corpo inteiro na codificação escolhida"""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.RESPONSE_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.RESPONSE_GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class _StreamCompressor:
+    """Compressor incremental para respostas em streaming"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.RESPONSE_BROTLI_QUALITY)
+            self._finish = self._compressor.finish
+            self._compress = self._compressor.process
+        else:
+            # wbits=31: formato gzip (cabeçalho + trailer)
+            self._compressor = zlib.compressobj(settings.RESPONSE_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._finish = self._compressor.flush
+            self._compress = self._compressor.compress
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compress(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if "content-encoding" in headers or not is_compressible(headers.get("content-type", "")):
+                self.passthrough = True
+                await self._send(message)
+            else:
+                # Aguarda o primeiro chunk do corpo para decidir se comprime
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if not more_body:
+                # Corpo completo em uma única mensagem
+                if len(body) >= self.minimum_size:
+                    body = compress(body, self.encoding)
+                    headers["Content-Encoding"] = self.encoding
+                    headers["Content-Length"] = str(len(body))
+                    headers.add_vary_header("Accept-Encoding")
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            # Streaming: tamanho final desconhecido
+            self.compressor = _StreamCompressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            await self._send(self.start_message)
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
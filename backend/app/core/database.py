@@ -1,23 +1,108 @@
-import os
+import time
+from typing import AsyncIterator, Optional
 
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-load_dotenv()
+from app.core.config import settings
+from app.core.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_IN_USE
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+# Drivers assíncronos usados quando a URL informa apenas o banco
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-engine = create_engine(DATABASE_URL)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool que mede o tempo de espera por uma conexão (pool cheio ou conexão nova)"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def async_database_url(url: str) -> str:
+    """Converte postgresql://... e sqlite://... para os drivers assíncronos"""
+    parsed = make_url(url)
+    if parsed.drivername in ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=ASYNC_DRIVERS[parsed.drivername])
+    return parsed.render_as_string(hide_password=False)
+
+
+def _engine_options(url: str) -> dict:
+    """Opções do pool e do driver conforme o banco configurado"""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+        }
+    return options
+
+
+DATABASE_URL = async_database_url(settings.DATABASE_URL)
+
+_engine: Optional[AsyncEngine] = None
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_IN_USE.inc()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    DB_POOL_IN_USE.dec()
+
+
+def get_engine() -> AsyncEngine:
+    """
+    Engine do processo, criado no primeiro uso: importar a aplicação não
+    abre conexões nem carrega o driver do banco
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+        event.listen(_engine.sync_engine, "checkout", _on_checkout)
+        event.listen(_engine.sync_engine, "checkin", _on_checkin)
+    return _engine
+
+
+async def dispose_engine() -> None:
+    """Fecha as conexões do pool, se o engine chegou a ser criado (shutdown da aplicação)"""
+    if _engine is not None:
+        await _engine.dispose()
+
+
+class LazySessionMaker(async_sessionmaker):
+    """async_sessionmaker que se liga ao engine na primeira sessão criada"""
+
+    def __call__(self, **local_kw) -> AsyncSession:
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+# expire_on_commit=False: objetos continuam acessíveis após o commit sem novo SELECT
+# (lazy load implícito não é permitido em sessões assíncronas)
+SessionLocal = LazySessionMaker(autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,65 @@
+"""
+Cache HTTP das rotas de leitura (ETag, Cache-Control e 304).
+
+O ETag é derivado da versão dos dados (ex.: maior updated_at dos times ou a
+versão do snapshot de indicadores), calculada com uma query barata. Quando o
+cliente envia If-None-Match com o ETag atual, a rota responde 304 sem montar
+o corpo da resposta.
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Diretivas de Cache-Control de uma rota (respeitadas por navegadores e CDNs)"""
+    max_age: int
+    stale_while_revalidate: int = 0
+    public: bool = True
+
+    @property
+    def header(self) -> str:
+        directives = ["public" if self.public else "private", f"max-age={self.max_age}"]
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+
+def make_etag(*parts: Any) -> str:
+    """ETag forte a partir das partes que identificam a versão dos dados"""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha1(raw.encode()).hexdigest()[:32]}"'
+
+
+def is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """Verifica se o If-None-Match do cliente contém o ETag atual"""
+    if not etag:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match usa comparação fraca: W/"x" equivale a "x"
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return etag in candidates
+
+
+def not_modified(etag: str, policy: CachePolicy) -> Response:
+    """Resposta 304 com os mesmos cabeçalhos de cache da resposta completa"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    apply_cache_headers(response, etag, policy)
+    return response
+
+
+def apply_cache_headers(response: Response, etag: Optional[str], policy: CachePolicy) -> None:
+    """Define ETag e Cache-Control na resposta"""
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = policy.header
+    else:
+        # Sem versão conhecida: o cliente precisa revalidar sempre
+        response.headers["Cache-Control"] = "no-cache"
@@ -0,0 +1,74 @@
+"""
+Cliente HTTP assíncrono compartilhado para chamadas à API externa (football-data.org).
+O ciclo de vida é controlado pelo lifespan da aplicação em app/main.py.
+"""
+import asyncio
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.upstream_fixtures import build_transport
+
+_client: Optional[httpx.AsyncClient] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """
+    Cria o cliente com pool de conexões, keep-alive e timeouts.
+    O transporte depende de FOOTBALL_API_MODE (live, record ou replay).
+    """
+    limits = httpx.Limits(
+        max_connections=settings.FOOTBALL_API_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.FOOTBALL_API_MAX_KEEPALIVE,
+    )
+    return httpx.AsyncClient(
+        base_url=settings.FOOTBALL_API_BASE_URL,
+        headers={
+            "X-Auth-Token": settings.FOOTBALL_API_SECRET_KEY,
+            "Content-Type": "application/json"
+        },
+        timeout=httpx.Timeout(
+            settings.FOOTBALL_API_READ_TIMEOUT,
+            connect=settings.FOOTBALL_API_CONNECT_TIMEOUT
+        ),
+        limits=limits,
+        transport=build_transport(limits),
+    )
+
+
+async def start_http_client() -> None:
+    """Inicializa o cliente compartilhado (startup da aplicação)"""
+    global _client, _semaphore
+    if _client is None:
+        _client = _build_client()
+    _semaphore = asyncio.Semaphore(settings.FOOTBALL_API_MAX_CONCURRENCY)
+
+
+async def close_http_client() -> None:
+    """Fecha as conexões do pool (shutdown da aplicação)"""
+    global _client, _semaphore
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _semaphore = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Retorna o cliente compartilhado. Fora do lifespan (scripts, workers)
+    o cliente é criado sob demanda.
+    """
+    global _client
+    if _client is None:
+        _client = _build_client()
+    return _client
+
+
+def get_http_semaphore() -> asyncio.Semaphore:
+    """Limita o número de requisições simultâneas para a API externa"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.FOOTBALL_API_MAX_CONCURRENCY)
+    return _semaphore
@@ -0,0 +1,210 @@
+"""
+Estatísticas de partidas em arrays colunares (NumPy).
+
+As partidas encerradas são carregadas uma vez por versão dos dados em
+colunas (mandante, visitante, gols, data, competição) e todas as consultas
+são operações vetorizadas sobre essas colunas: máscaras booleanas para o
+histórico de um time e np.bincount para a tabela da liga inteira.
+
+Cada time tem as posições das suas partidas (já em ordem cronológica)
+pré-calculadas, então o histórico de um time é um fatiamento e não uma
+varredura da tabela.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Índice = sinal do saldo + 1 (derrota, empate, vitória)
+RESULT_LETTERS = np.array(["L", "D", "W"])
+RESULT_POINTS = np.array([0, 1, 3])
+
+
+def _summary(goals_for: np.ndarray, goals_against: np.ndarray) -> Dict[str, int]:
+    """Jogos, resultados, gols e pontos de um conjunto de partidas do ponto de vista do time"""
+    outcome = np.sign(goals_for - goals_against) + 1
+    counts = np.bincount(outcome, minlength=3)
+    scored = int(goals_for.sum())
+    conceded = int(goals_against.sum())
+    return {
+        "played": int(goals_for.size),
+        "wins": int(counts[2]),
+        "draws": int(counts[1]),
+        "losses": int(counts[0]),
+        "goals_for": scored,
+        "goals_against": conceded,
+        "goal_difference": scored - conceded,
+        "clean_sheets": int(np.count_nonzero(goals_against == 0)),
+        "points": int(3 * counts[2] + counts[1]),
+    }
+
+
+class MatchStatsTable:
+    def __init__(self, rows: Sequence[Any]):
+        """
+        rows: partidas encerradas em ordem cronológica, com id, utc_date,
+        competition_code, home_id, away_id, home_goals, away_goals,
+        home_name, away_name, home_tla e away_tla
+        """
+        size = len(rows)
+        self.match_ids = np.fromiter((row.id for row in rows), dtype=np.int64, count=size)
+        self.dates = np.array([row.utc_date for row in rows], dtype="datetime64[s]")
+        self.home = np.fromiter((row.home_id for row in rows), dtype=np.int64, count=size)
+        self.away = np.fromiter((row.away_id for row in rows), dtype=np.int64, count=size)
+        self.home_goals = np.fromiter((row.home_goals for row in rows), dtype=np.int32, count=size)
+        self.away_goals = np.fromiter((row.away_goals for row in rows), dtype=np.int32, count=size)
+
+        codes, self.competition = np.unique(
+            np.array([row.competition_code or "" for row in rows], dtype=object).astype(str),
+            return_inverse=True
+        )
+        self.competition_codes: List[str] = codes.tolist()
+
+        # Nome/sigla mais recentes de cada time (mandantes e visitantes)
+        self.teams: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            self.teams[row.home_id] = {"id": row.home_id, "name": row.home_name, "tla": row.home_tla}
+            self.teams[row.away_id] = {"id": row.away_id, "name": row.away_name, "tla": row.away_tla}
+
+        # Posições das partidas de cada time: ordena (time, posição) e guarda o início de cada grupo
+        sides = np.concatenate([self.home, self.away])
+        positions = np.concatenate([np.arange(size), np.arange(size)])
+        order = np.lexsort((positions, sides))
+        self._team_positions = positions[order]
+        self._team_ids, self._team_starts, self._team_counts = np.unique(
+            sides[order], return_index=True, return_counts=True
+        )
+        self._league_cache: Dict[Optional[str], Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return int(self.match_ids.size)
+
+    def team_positions(self, team_id: int, competitions: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Posições das partidas do time, em ordem cronológica"""
+        slot = int(np.searchsorted(self._team_ids, team_id))
+        if slot == self._team_ids.size or self._team_ids[slot] != team_id:
+            return np.empty(0, dtype=np.int64)
+        start = self._team_starts[slot]
+        positions = self._team_positions[start:start + self._team_counts[slot]]
+        return positions[self._competition_mask(positions, competitions)]
+
+    def team_stats(self, team_id: int, last: int, competitions: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Totais, divisão mandante/visitante e forma nas últimas `last` partidas"""
+        positions = self.team_positions(team_id, competitions)
+        is_home = self.home[positions] == team_id
+        goals_for = np.where(is_home, self.home_goals[positions], self.away_goals[positions])
+        goals_against = np.where(is_home, self.away_goals[positions], self.home_goals[positions])
+
+        recent = slice(max(positions.size - last, 0), None)
+        outcome = np.sign(goals_for[recent] - goals_against[recent]) + 1
+        return {
+            "team_id": team_id,
+            "overall": _summary(goals_for, goals_against),
+            "home": _summary(goals_for[is_home], goals_against[is_home]),
+            "away": _summary(goals_for[~is_home], goals_against[~is_home]),
+            "form": {
+                **_summary(goals_for[recent], goals_against[recent]),
+                "results": "".join(RESULT_LETTERS[outcome]),
+            },
+            "last_match_date": self._format_date(positions[-1]) if positions.size else None,
+        }
+
+    def head_to_head(
+        self, team_id: int, opponent_id: int, competitions: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """Confrontos diretos do ponto de vista de team_id (partidas da mais recente para a mais antiga)"""
+        positions = self.team_positions(team_id, competitions)
+        positions = positions[(self.home[positions] == opponent_id) | (self.away[positions] == opponent_id)]
+        is_home = self.home[positions] == team_id
+        goals_for = np.where(is_home, self.home_goals[positions], self.away_goals[positions])
+        goals_against = np.where(is_home, self.away_goals[positions], self.home_goals[positions])
+        summary = _summary(goals_for, goals_against)
+        return {
+            "team": self.teams.get(team_id, {"id": team_id, "name": None, "tla": None}),
+            "opponent": self.teams.get(opponent_id, {"id": opponent_id, "name": None, "tla": None}),
+            **{key: summary[key] for key in ("played", "wins", "draws", "losses", "goals_for", "goals_against")},
+            "matches": [
+                {
+                    "id": int(self.match_ids[position]),
+                    "utc_date": self._format_date(position),
+                    "competition": self.competition_codes[self.competition[position]] or None,
+                    "home_team_id": int(self.home[position]),
+                    "away_team_id": int(self.away[position]),
+                    "home_goals": int(self.home_goals[position]),
+                    "away_goals": int(self.away_goals[position]),
+                }
+                for position in positions[::-1]
+            ],
+        }
+
+    def league(self, competition: Optional[str] = None) -> Dict[str, Any]:
+        """Resumo da liga e classificação de todos os times (calculados uma vez por tabela)"""
+        if competition not in self._league_cache:
+            self._league_cache[competition] = self._compute_league(competition)
+        return self._league_cache[competition]
+
+    def _compute_league(self, competition: Optional[str]) -> Dict[str, Any]:
+        mask = self._competition_mask(np.arange(len(self)), [competition] if competition else None)
+        home, away = self.home[mask], self.away[mask]
+        home_goals, away_goals = self.home_goals[mask], self.away_goals[mask]
+        total = int(home.size)
+        if total == 0:
+            return {"partidas": 0, "competicao": competition, "classificacao": []}
+
+        team_ids, inverse = np.unique(np.concatenate([home, away]), return_inverse=True)
+        home_index, away_index = inverse[:total], inverse[total:]
+        size = team_ids.size
+
+        def side(index: np.ndarray, goals_for: np.ndarray, goals_against: np.ndarray) -> Dict[str, np.ndarray]:
+            outcome = np.sign(goals_for - goals_against) + 1
+            return {
+                "jogos": np.bincount(index, minlength=size),
+                "vitorias": np.bincount(index, weights=outcome == 2, minlength=size).astype(np.int64),
+                "empates": np.bincount(index, weights=outcome == 1, minlength=size).astype(np.int64),
+                "derrotas": np.bincount(index, weights=outcome == 0, minlength=size).astype(np.int64),
+                "gols_pro": np.bincount(index, weights=goals_for, minlength=size).astype(np.int64),
+                "gols_contra": np.bincount(index, weights=goals_against, minlength=size).astype(np.int64),
+                "sem_sofrer_gols": np.bincount(index, weights=goals_against == 0, minlength=size).astype(np.int64),
+                "pontos": np.bincount(index, weights=RESULT_POINTS[outcome], minlength=size).astype(np.int64),
+            }
+
+        as_home = side(home_index, home_goals, away_goals)
+        as_away = side(away_index, away_goals, home_goals)
+        overall = {key: as_home[key] + as_away[key] for key in as_home}
+        overall["saldo"] = overall["gols_pro"] - overall["gols_contra"]
+
+        # Pontos, saldo e gols pró (decrescentes); lexsort usa a última chave como principal
+        order = np.lexsort((-overall["gols_pro"], -overall["saldo"], -overall["pontos"]))
+        split_keys = ("jogos", "vitorias", "empates", "derrotas", "gols_pro", "gols_contra", "pontos")
+        classificacao = [
+            {
+                "posicao": position,
+                "time": self.teams[int(team_ids[slot])],
+                **{key: int(values[slot]) for key, values in overall.items()},
+                "mandante": {key: int(as_home[key][slot]) for key in split_keys},
+                "visitante": {key: int(as_away[key][slot]) for key in split_keys},
+            }
+            for position, slot in enumerate(order, start=1)
+        ]
+
+        goals = home_goals + away_goals
+        return {
+            "competicao": competition,
+            "partidas": total,
+            "gols": int(goals.sum()),
+            "media_gols": round(float(goals.mean()), 2),
+            "vitorias_mandante_pct": round(float(np.mean(home_goals > away_goals)) * 100, 1),
+            "empates_pct": round(float(np.mean(home_goals == away_goals)) * 100, 1),
+            "vitorias_visitante_pct": round(float(np.mean(home_goals < away_goals)) * 100, 1),
+            "ambos_marcam_pct": round(float(np.mean((home_goals > 0) & (away_goals > 0))) * 100, 1),
+            "sem_gols_pct": round(float(np.mean(goals == 0)) * 100, 1),
+            "classificacao": classificacao,
+        }
+
+    def _competition_mask(self, positions: np.ndarray, competitions: Optional[Sequence[str]]) -> np.ndarray:
+        if not competitions:
+            return np.ones(positions.size, dtype=bool)
+        wanted = [self.competition_codes.index(code) for code in competitions if code in self.competition_codes]
+        return np.isin(self.competition[positions], wanted)
+
+    def _format_date(self, position: int) -> str:
+        return f"{np.datetime_as_string(self.dates[position], unit='s')}Z"
@@ -0,0 +1,142 @@
+"""
+Métricas Prometheus da aplicação (expostas em GET /metrics).
+
+- Latência e status por rota (template da rota, não a URL, para limitar a cardinalidade)
+- Latência e status por endpoint da API externa
+- Espera por conexão e conexões em uso no pool do banco
+- Acertos/falhas dos caches (dados locais, respostas serializadas, usuários)
+
+Com vários workers do uvicorn, defina PROMETHEUS_MULTIPROC_DIR apontando para
+um diretório vazio a cada inicialização: cada processo grava suas métricas
+ali e /metrics agrega todos os processos.
+"""
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Latência das requisições HTTP por rota",
+    ["method", "route"], buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "Requisições HTTP por rota e status",
+    ["method", "route", "status"]
+)
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "upstream_request_duration_seconds", "Latência das requisições à API externa por endpoint",
+    ["endpoint"], buckets=LATENCY_BUCKETS
+)
+UPSTREAM_REQUESTS = Counter(
+    "upstream_requests_total", "Requisições à API externa por endpoint e status",
+    ["endpoint", "status"]
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "Tempo de espera por uma conexão do pool do banco",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Conexões do pool do banco em uso",
+    multiprocess_mode="livesum"
+)
+APP_STARTUP_DURATION = Gauge(
+    "app_startup_duration_seconds", "Duração do startup (lifespan) do processo",
+    multiprocess_mode="max"
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Consultas aos caches por resultado (hit, stale, miss)",
+    ["cache", "result"]
+)
+
+# Segmentos numéricos (IDs) viram {id} no label do endpoint externo
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def multiprocess_enabled() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def render_metrics() -> bytes:
+    """Métricas no formato texto do Prometheus (agregadas entre processos, se configurado)"""
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_process_dead() -> None:
+    """Remove as métricas "live" do processo que está encerrando"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def record_cache(cache: str, result: str) -> None:
+    CACHE_REQUESTS.labels(cache, result).inc()
+
+
+@contextmanager
+def track_upstream(endpoint: str) -> Iterator[dict]:
+    """
+    Mede uma requisição à API externa. O chamador informa o status HTTP em
+    result["status"]; exceções são registradas como timeout ou error.
+    """
+    # A query string (ex.: ?season=2025) fica fora do label: cada valor criaria uma série nova
+    label = _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+    result = {"status": "error"}
+    start = time.perf_counter()
+    try:
+        yield result
+    except httpx.TimeoutException:
+        result["status"] = "timeout"
+        raise
+    finally:
+        UPSTREAM_REQUEST_DURATION.labels(label).observe(time.perf_counter() - start)
+        UPSTREAM_REQUESTS.labels(label, str(result["status"])).inc()
+
+
+class MetricsMiddleware:
+    """Registra latência e status de cada requisição pelo template da rota"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_label = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.labels(method, route_label).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method, route_label, str(status_code)).inc()
+
@@ -0,0 +1,53 @@
+"""
+Paginação por cursor (keyset) e seleção de campos (sparse fieldsets) das
+rotas de listagem.
+
+O cursor é a chave da última linha retornada: a próxima página usa
+WHERE chave > cursor ORDER BY chave LIMIT n, que percorre o índice da chave
+sem OFFSET, com custo constante por página.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def parse_fields(value: Optional[str], allowed: Sequence[str], required: str) -> List[str]:
+    """
+    Converte "a,b" na lista de campos pedidos, na ordem de allowed.
+    O campo usado como cursor (required) é sempre incluído.
+    """
+    if not value:
+        return list(allowed)
+
+    requested = {item.strip() for item in value.split(",") if item.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    requested.add(required)
+    return [field for field in allowed if field in requested]
+
+
+def build_page(rows: Sequence[Any], fields: List[str], cursor_field: str, limit: int) -> Dict[str, Any]:
+    """
+    Monta a página a partir de até limit + 1 linhas: a linha extra indica que
+    existe uma próxima página e não é retornada.
+    """
+    has_more = len(rows) > limit
+    items = [dict(zip(fields, row)) for row in rows[:limit]]
+    return {
+        "items": items,
+        "count": len(items),
+        "limit": limit,
+        "next_cursor": items[-1][cursor_field] if has_more else None,
+    }
+
+
+def page_columns(fields: List[str], columns: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Colunas SQL correspondentes aos campos pedidos"""
+    return tuple(columns[field] for field in fields)
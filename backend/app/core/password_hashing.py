@@ -0,0 +1,89 @@
+"""
+Hash e verificação de senhas (bcrypt) em um pool de processos dedicado.
+
+O bcrypt consome ~250ms de CPU por chamada segurando o GIL; executá-lo em
+processos separados libera o event loop e as threads dos handlers e permite
+que o throughput de login escale com o número de núcleos.
+O ciclo de vida do pool é controlado pelo lifespan da aplicação em app/main.py.
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+@lru_cache(maxsize=None)
+def _crypt_context(rounds: int) -> CryptContext:
+    """
+    Contexto bcrypt com custo fixo: hashes com outro custo são sinalizados
+    para rehash por verify_and_update
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def _hash(password: str, rounds: int) -> str:
+    """Executado nos processos do pool"""
+    return _crypt_context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    """Executado nos processos do pool"""
+    return _crypt_context(rounds).verify_and_update(password, hashed_password)
+
+
+def start_hashing_pool() -> None:
+    """Cria o pool de processos (startup da aplicação)"""
+    global _executor
+    if _executor is None:
+        # spawn evita herdar threads/conexões do processo do servidor
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+
+def shutdown_hashing_pool() -> None:
+    """Encerra o pool de processos (shutdown da aplicação)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Retorna o pool; fora do lifespan (scripts) ele é criado sob demanda"""
+    if _executor is None:
+        start_hashing_pool()
+    return _executor
+
+
+async def hash_password(password: str) -> str:
+    """Gera o hash bcrypt da senha com o custo configurado"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), _hash, password, settings.BCRYPT_ROUNDS
+    )
+
+
+async def verify_password(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifica a senha. Retorna (válida, novo_hash): novo_hash é preenchido
+    quando o hash armazenado usa um custo diferente do configurado.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), _verify_and_update, password, hashed_password, settings.BCRYPT_ROUNDS
+    )
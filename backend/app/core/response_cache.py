@@ -0,0 +1,118 @@
+"""
+Corpos JSON pré-serializados das rotas de leitura, indexados por URL e ETag.
+
+Enquanto a versão dos dados (ETag) não muda, leituras repetidas devolvem os
+bytes já serializados (e já comprimidos, por codificação) sem passar pelo
+service, pelo Pydantic ou pelo encoder JSON. O cache é por processo.
+"""
+import threading
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.compression import choose_encoding, compress
+from app.core.config import settings
+from app.core.http_cache import CachePolicy, apply_cache_headers
+from app.core.metrics import record_cache
+from app.core.user_cache import TTLCache
+
+
+def serialize(content: Any) -> bytes:
+    """Serializa a resposta como o FastAPI faria (modelos por alias, dicts via orjson)"""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json(by_alias=True).encode()
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """Resposta padrão da aplicação: rotas que retornam dicts são serializadas com orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return serialize(content)
+
+
+class CachedBody:
+    """Corpo JSON de uma versão dos dados e suas variantes comprimidas"""
+
+    def __init__(self, etag: str, body: bytes):
+        self.etag = etag
+        self.body = body
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """Corpo na codificação pedida (comprimido uma única vez por codificação)"""
+        if encoding is None:
+            return self.body
+        with self._lock:
+            if encoding not in self._encoded:
+                self._encoded[encoding] = compress(self.body, encoding)
+            return self._encoded[encoding]
+
+    def to_response(self, request: Request, policy: CachePolicy) -> Response:
+        encoding = None
+        if len(self.body) >= settings.RESPONSE_COMPRESSION_MIN_SIZE:
+            encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+
+        response = Response(content=self.encoded(encoding), media_type="application/json")
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        apply_cache_headers(response, self.etag, policy)
+        return response
+
+
+class ResponseCache:
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._entries: TTLCache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def _key(request: Request) -> str:
+        return f"{request.url.path}?{request.url.query}"
+
+    def get(self, request: Request, etag: Optional[str]) -> Optional[CachedBody]:
+        """Corpo em cache para a URL, somente se for da versão atual (etag)"""
+        if not etag:
+            return None
+        cached = self._entries.get(self._key(request))
+        if cached is None or cached.etag != etag:
+            record_cache("response", "miss")
+            return None
+        record_cache("response", "hit")
+        return cached
+
+    def set(self, request: Request, etag: str, body: bytes) -> CachedBody:
+        cached = CachedBody(etag, body)
+        self._entries.set(self._key(request), cached)
+        return cached
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache = ResponseCache(
+    max_size=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+
+
+def cached_response(request: Request, etag: Optional[str], policy: CachePolicy) -> Optional[Response]:
+    """Resposta montada a partir dos bytes em cache, se a versão ainda é a atual"""
+    cached = response_cache.get(request, etag)
+    return cached.to_response(request, policy) if cached else None
+
+
+def json_response(request: Request, content: Any, etag: Optional[str], policy: CachePolicy) -> Response:
+    """
+    Serializa a resposta uma vez e guarda os bytes quando há uma versão (etag);
+    sem versão, responde sem cache (ex.: dados repassados da API externa)
+    """
+    body = serialize(content)
+    if not etag:
+        response = Response(content=body, media_type="application/json")
+        apply_cache_headers(response, None, policy)
+        return response
+    return response_cache.set(request, etag, body).to_response(request, policy)
@@ -0,0 +1,83 @@
+"""
+Índice de trigramas em memória para busca aproximada de times.
+
+Mesma ideia do pg_trgm: o texto é normalizado (minúsculas, sem acentos,
+apenas letras e números), cada palavra vira o conjunto de trigramas com
+dois espaços antes e um depois ("sao" -> "  s", " sa", "sao", "ao ") e os
+documentos são comparados pelos trigramas em comum com a busca.
+
+Pontuação (0 a 1), próxima do word_similarity do Postgres: fração dos
+trigramas da busca presentes no documento; o desempate usa a similaridade
+do conjunto inteiro (Jaccard), favorecendo nomes mais curtos/exatos.
+
+Listas invertidas (trigrama -> documentos) limitam o trabalho aos
+documentos que compartilham algum trigrama com a busca.
+"""
+import heapq
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Minúsculas, sem acentos e com apenas letras/números separados por espaço"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_ALNUM.sub(" ", stripped.lower()).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Trigramas de cada palavra do texto normalizado (padding como no pg_trgm)"""
+    result = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+class TrigramIndex:
+    def __init__(self, documents: Sequence[Dict[str, Any]], fields: Sequence[str]):
+        """
+        documents: linhas já prontas para a resposta
+        fields: campos usados na busca (ex.: name, short_name, tla)
+        """
+        self.documents = list(documents)
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for position, document in enumerate(self.documents):
+            grams = trigrams(" ".join(str(document.get(field) or "") for field in fields))
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query: str, limit: int, min_score: float) -> List[Tuple[float, Dict[str, Any]]]:
+        """Até limit documentos com pontuação >= min_score, do mais parecido ao menos parecido"""
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        shared = Counter()
+        for gram in query_grams:
+            postings = self._postings.get(gram)
+            if postings:
+                shared.update(postings)
+
+        total = len(query_grams)
+        minimum = min_score * total
+        candidates: Iterable[Tuple[float, float, int]] = (
+            (
+                count / total,
+                count / (total + self._sizes[position] - count),
+                -position,
+            )
+            for position, count in shared.items()
+            if count >= minimum
+        )
+        best = heapq.nlargest(limit, candidates)
+        return [(round(score, 4), self.documents[-negative]) for score, _, negative in best]
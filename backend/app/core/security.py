@@ -1,31 +1,22 @@
-import os
 from datetime import datetime, timedelta
 from jwt.exceptions import InvalidTokenError
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.metrics import record_cache
+from app.core.user_cache import user_cache
 from app.repositories.user import UserRepository
-from dotenv import load_dotenv
+from app.schemas.user import UserResponse
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-load_dotenv()
-
-SECRET_KEY = os.getenv("SECRET_KEY", "default_secret_key")
-ALGORITHM = "HS256"
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
@@ -38,7 +29,7 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> UserResponse:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -49,11 +40,28 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
-    except InvalidTokenError:
+    except (InvalidTokenError, JWTError):
         raise credentials_exception
 
-    user = UserRepository.get_by_username(db, username)
+    # Modo claims-only: os dados do usuário vêm do próprio token assinado
+    if settings.AUTH_CLAIMS_ONLY and payload.get("uid") is not None:
+        return UserResponse(
+            id=payload["uid"],
+            username=username,
+            email=payload.get("email"),
+            team_favorite=payload.get("team_favorite"),
+        )
+
+    cached_user = user_cache.get(username)
+    if cached_user is not None:
+        record_cache("user", "hit")
+        return cached_user
+    record_cache("user", "miss")
+
+    user = await UserRepository.get_by_username(db, username)
     if user is None:
         raise credentials_exception
-    return user
 
+    current_user = UserResponse.model_validate(user)
+    user_cache.set(username, current_user)
+    return current_user
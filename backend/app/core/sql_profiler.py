@@ -0,0 +1,130 @@
+"""
+Profiling de SQL por requisição (opt-in via SQL_PROFILING=true).
+
+Eventos do engine registram cada statement no perfil da requisição atual,
+guardado em um ContextVar. Com o engine assíncrono os eventos rodam no
+greenlet do SQLAlchemy, que herda o contexto da task: o perfil continua
+visível ali sem repassar nada explicitamente.
+
+Ao fim da requisição:
+- Server-Timing com quantidade de queries e tempo de banco (SQL_PROFILING_SERVER_TIMING)
+- warning quando a rota passa de SQL_QUERY_BUDGET queries
+- warning para statements idênticos repetidos (padrão N+1)
+"""
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("sql_profile", default=None)
+
+
+@dataclass
+class RequestProfile:
+    statements: List[Tuple[str, float]] = field(default_factory=list)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statements.append((statement, elapsed))
+
+    @property
+    def query_count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_time(self) -> float:
+        return sum(elapsed for _, elapsed in self.statements)
+
+    def slowest(self, limit: int) -> List[Tuple[str, float]]:
+        return sorted(self.statements, key=lambda item: item[1], reverse=True)[:limit]
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements com o mesmo SQL executados ao menos threshold vezes"""
+        counts = Counter(statement for statement, _ in self.statements)
+        return [(statement, count) for statement, count in counts.most_common() if count >= threshold]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        conn.info.setdefault("sql_profiler_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    starts = conn.info.get("sql_profiler_start")
+    if profile is not None and starts:
+        profile.record(statement, time.perf_counter() - starts.pop())
+
+
+def install_sql_profiler(engine: AsyncEngine) -> None:
+    """Registra os eventos de profiling no engine (uma vez, mesmo com vários lifespans)"""
+    if event.contains(engine.sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _one_line(statement: str, limit: int = 200) -> str:
+    text = " ".join(statement.split())
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+class SQLProfilerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.SQL_PROFILING_SERVER_TIMING:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={profile.total_time * 1000:.2f};desc="{profile.query_count} queries"'
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            self._report(scope, profile)
+
+    @staticmethod
+    def _report(scope: Scope, profile: RequestProfile) -> None:
+        if not profile.statements:
+            return
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        label = f"{scope['method']} {route}"
+
+        if profile.query_count > settings.SQL_QUERY_BUDGET:
+            slowest = "; ".join(
+                f"{elapsed * 1000:.1f}ms {_one_line(statement)}"
+                for statement, elapsed in profile.slowest(settings.SQL_PROFILING_SLOWEST)
+            )
+            logger.warning(
+                "%s executou %d queries (orçamento %d) em %.1fms. Mais lentas: %s",
+                label, profile.query_count, settings.SQL_QUERY_BUDGET, profile.total_time * 1000, slowest
+            )
+
+        for statement, count in profile.repeated(settings.SQL_REPEATED_STATEMENT_THRESHOLD):
+            logger.warning(
+                "%s repetiu o mesmo statement %d vezes (possível N+1): %s",
+                label, count, _one_line(statement)
+            )
@@ -0,0 +1,189 @@
+"""
+Gravação e reprodução das respostas da football-data.org (FOOTBALL_API_MODE).
+
+- live: requisições reais (padrão)
+- record: requisições reais; respostas 200 e 404 são gravadas no disco
+- replay: respostas servidas do disco, sem rede e sem a cota da API
+
+O armazenamento fica em FOOTBALL_API_FIXTURES_DIR:
+
+- responses.bin: registros comprimidos com zlib, gravados em sequência
+- index.json: chave -> [offset, tamanho] do registro em responses.bin
+
+A chave é o método + caminho + query string ordenada ("GET /v4/teams/1776").
+No replay o índice fica em um dict e responses.bin é mapeado em memória
+(mmap): cada requisição é uma consulta ao dict e a descompressão de um
+registro, sem abrir arquivos nem copiar o arquivo inteiro para a memória.
+
+Gravar de novo a mesma chave com conteúdo diferente acrescenta um registro
+e atualiza o índice; o registro antigo continua no arquivo, mas deixa de
+ser usado. Respostas idênticas à última gravada não são regravadas.
+"""
+import mmap
+import os
+import threading
+import zlib
+from typing import Dict, List, Optional
+
+import httpx
+import orjson
+
+from app.core.config import settings
+
+MODES = ("live", "record", "replay")
+INDEX_FILE = "index.json"
+DATA_FILE = "responses.bin"
+RECORDED_STATUSES = (200, 404)
+# Cabeçalhos guardados junto com o corpo (o restante não é usado pelo repositório)
+RECORDED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def fixture_key(request: httpx.Request) -> str:
+    """Chave do registro: método, caminho e query string ordenada (sem host)"""
+    query = "&".join(f"{name}={value}" for name, value in sorted(request.url.params.multi_items()))
+    path = request.url.path
+    return f"{request.method} {path}?{query}" if query else f"{request.method} {path}"
+
+
+class FixtureStore:
+    """Respostas gravadas em disco, indexadas pela chave da requisição"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.data_path = os.path.join(directory, DATA_FILE)
+        self._index: Dict[str, List[int]] = self._load_index()
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        # Checksum do último registro gravado por chave nesta execução
+        self._checksums: Dict[str, int] = {}
+
+    def _load_index(self) -> Dict[str, List[int]]:
+        try:
+            with open(self.index_path, "rb") as index_file:
+                return orjson.loads(index_file.read())
+        except FileNotFoundError:
+            return {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Registro gravado para a chave (status, headers e body) ou None"""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        raw = zlib.decompress(self._mapped()[offset:offset + length])
+        header, _, body = raw.partition(b"\n")
+        record = orjson.loads(header)
+        record["body"] = body
+        return record
+
+    def put(self, key: str, status_code: int, headers: Dict[str, str], body: bytes) -> None:
+        """Acrescenta o registro em responses.bin e regrava o índice"""
+        header = orjson.dumps({"status": status_code, "headers": headers})
+        record = zlib.compress(header + b"\n" + body, 6)
+        checksum = zlib.crc32(record)
+        with self._lock:
+            if self._checksums.get(key) == checksum:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.data_path, "ab") as data_file:
+                offset = data_file.seek(0, os.SEEK_END)
+                data_file.write(record)
+            self._index[key] = [offset, len(record)]
+            # Índice substituído de uma vez: um replay concorrente nunca lê um índice pela metade
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "wb") as index_file:
+                index_file.write(orjson.dumps(self._index, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self.index_path)
+            self._checksums[key] = checksum
+
+    def _mapped(self) -> mmap.mmap:
+        if self._mmap is None:
+            with self._lock:
+                if self._mmap is None:
+                    with open(self.data_path, "rb") as data_file:
+                        self._mmap = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Repassa as requisições para a API real e grava as respostas"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, store: FixtureStore):
+        self._transport = transport
+        self._store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        try:
+            # aread já devolve o corpo descomprimido (gzip/br do servidor)
+            body = await response.aread()
+        finally:
+            await response.aclose()
+
+        headers = {
+            name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers
+        }
+        if response.status_code in RECORDED_STATUSES:
+            self._store.put(fixture_key(request), response.status_code, headers, body)
+
+        passthrough = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(response.status_code, headers=passthrough, content=body, request=request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Responde a partir do armazenamento gravado, sem acessar a rede.
+    Requisições não gravadas falham como API indisponível.
+    """
+
+    def __init__(self, store: FixtureStore):
+        self._store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = fixture_key(request)
+        record = self._store.get(key)
+        if record is None:
+            raise httpx.ConnectError(
+                f"No recorded response for {key} in {self._store.directory}", request=request
+            )
+
+        headers = record["headers"]
+        etag = headers.get("etag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers, request=request)
+        return httpx.Response(record["status"], headers=headers, content=record["body"], request=request)
+
+    async def aclose(self) -> None:
+        self._store.close()
+
+
+def build_transport(limits: httpx.Limits) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Transporte do cliente da API externa conforme FOOTBALL_API_MODE.
+    None no modo live (transporte padrão do httpx).
+    """
+    mode = settings.FOOTBALL_API_MODE
+    if mode not in MODES:
+        raise ValueError(f"FOOTBALL_API_MODE inválido: {mode!r} (use {', '.join(MODES)})")
+    if mode == "live":
+        return None
+
+    store = FixtureStore(settings.FOOTBALL_API_FIXTURES_DIR)
+    if mode == "record":
+        return RecordingTransport(httpx.AsyncHTTPTransport(limits=limits), store)
+    return ReplayTransport(store)
@@ -0,0 +1,240 @@
+"""
+Agendador das requisições para a API externa (football-data.org).
+
+- Token bucket dimensionado pela cota do plano (requisições por minuto)
+- Single-flight: GETs idênticos em andamento compartilham a mesma resposta; a
+  chamada roda em uma task própria, então cancelar quem a iniciou não cancela
+  os demais, e quem entra com prioridade maior promove a chamada na fila
+- Fila de prioridade: leituras de usuários passam na frente de tarefas em background
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+class Priority(IntEnum):
+    USER = 0  # Requisições disparadas por um usuário esperando a resposta
+    BACKGROUND = 10  # Refresh em background, prefetch e importações agendadas
+
+
+class TokenBucket:
+    def __init__(self, rate_per_minute: float, capacity: int):
+        self.rate = rate_per_minute / 60.0  # Tokens por segundo
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def time_until_available(self) -> float:
+        """Segundos até existir um token disponível (só leitura: não altera o bucket)"""
+        now = time.monotonic()
+        if now < self.updated_at:
+            # Pausado (pause): o bucket volta a encher em updated_at
+            return (self.updated_at - now) + max(0.0, 1 - self.tokens) / self.rate
+        tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        if tokens >= 1:
+            return 0.0
+        return (1 - tokens) / self.rate
+
+    def consume(self) -> None:
+        self._refill()
+        self.tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Zera o bucket e adia o próximo token (ex.: após um 429 da API)"""
+        self.tokens = 0.0
+        self.updated_at = time.monotonic() + seconds
+
+
+class _Flight:
+    """Chamada à API externa em andamento, compartilhada pelos GETs com a mesma chave"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, priority: Priority):
+        self.result = loop.create_future()
+        self.priority = priority
+        self.waiters = 0
+        self.task: Optional[asyncio.Task] = None
+        # Entrada na fila do token bucket (criada quando a task começa a aguardar)
+        self.grant: Optional[asyncio.Future] = None
+        self.enqueued_at = 0.0
+
+
+class UpstreamScheduler:
+    def __init__(self, requests_per_minute: float, burst: int):
+        self._requests_per_minute = requests_per_minute
+        self._burst = burst
+        self._bucket = TokenBucket(requests_per_minute, burst)
+        self._queue: List[Tuple[int, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._inflight: Dict[str, _Flight] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Métricas
+        self._granted: Dict[str, int] = {priority.name: 0 for priority in Priority}
+        self._coalesced = 0
+        self._rate_limited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    async def run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        priority: Priority = Priority.USER
+    ) -> Any:
+        """
+        Executa a chamada respeitando a cota. Se já existe uma chamada com a
+        mesma chave em andamento, aguarda e reutiliza o resultado dela.
+
+        A chamada roda em uma task própria: quem for cancelado apenas deixa de
+        aguardar, e a chamada só é cancelada quando ninguém mais espera por ela.
+        """
+        self._ensure_dispatcher()
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(self._loop, priority)
+            self._inflight[key] = flight
+            flight.task = self._loop.create_task(self._execute(key, flight, call))
+        else:
+            self._coalesced += 1
+            if priority < flight.priority:
+                self._promote(flight, priority)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.result)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.result.done():
+                flight.task.cancel()
+
+    async def _execute(self, key: str, flight: _Flight, call: Callable[[], Awaitable[Any]]) -> None:
+        """Aguarda o token e executa a chamada, publicando o resultado para todos os interessados"""
+        try:
+            await self._acquire(flight)
+            flight.result.set_result(await call())
+        except asyncio.CancelledError:
+            flight.result.cancel()
+        except Exception as e:
+            flight.result.set_exception(e)
+            # Marca a exceção como consumida quando não há outras chamadas aguardando
+            flight.result.exception()
+        finally:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
+
+    def _promote(self, flight: _Flight, priority: Priority) -> None:
+        """
+        Sobe a prioridade de uma chamada em andamento (ex.: leitura de usuário
+        que reutiliza um refresh em background). A entrada antiga fica na fila
+        e é descartada pelo dispatcher, pois aponta para o mesmo grant.
+        """
+        flight.priority = priority
+        if flight.grant is not None and not flight.grant.done():
+            heapq.heappush(self._queue, (int(priority), next(self._sequence), flight.enqueued_at, flight.grant))
+            self._wakeup.set()
+
+    def backoff(self, seconds: float) -> None:
+        """Suspende o envio de novas requisições após um 429 da API externa"""
+        self._rate_limited += 1
+        self._bucket.pause(seconds)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Métricas da fila e do rate limit"""
+        granted = sum(self._granted.values())
+        # Um grant promovido aparece duas vezes na fila: vale a maior prioridade
+        pending: Dict[asyncio.Future, int] = {}
+        for priority, _, _, grant in self._queue:
+            if not grant.done():
+                pending[grant] = min(priority, pending.get(grant, priority))
+        return {
+            "requests_per_minute": self._requests_per_minute,
+            "burst": self._burst,
+            "queue_depth": len(pending),
+            "queue_depth_by_priority": {
+                priority.name: sum(1 for item in pending.values() if item == priority)
+                for priority in Priority
+            },
+            "inflight": len(self._inflight),
+            "granted": granted,
+            "granted_by_priority": dict(self._granted),
+            "coalesced": self._coalesced,
+            "rate_limited": self._rate_limited,
+            "wait_seconds_avg": round(self._wait_total / granted, 3) if granted else 0.0,
+            "wait_seconds_max": round(self._wait_max, 3),
+            "next_slot_in_seconds": round(self._bucket.time_until_available(), 3),
+        }
+
+    async def close(self) -> None:
+        """Encerra o dispatcher (shutdown da aplicação)"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+        for _, _, _, future in self._queue:
+            future.cancel()
+        self._queue.clear()
+        self._dispatcher = None
+        self._loop = None
+
+    async def _acquire(self, flight: _Flight) -> None:
+        """Entra na fila e aguarda a liberação de um token"""
+        flight.grant, flight.enqueued_at = self._loop.create_future(), time.monotonic()
+        heapq.heappush(self._queue, (int(flight.priority), next(self._sequence), flight.enqueued_at, flight.grant))
+        self._wakeup.set()
+        await flight.grant
+
+    def _ensure_dispatcher(self) -> None:
+        """Inicia o dispatcher no event loop atual (recriado se o loop mudou)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._dispatcher is not None and not self._dispatcher.done():
+            return
+        self._loop = loop
+        self._queue = []
+        self._inflight = {}
+        self._wakeup = asyncio.Event()
+        self._dispatcher = loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """Libera a fila por ordem de prioridade conforme os tokens ficam disponíveis"""
+        while True:
+            while not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            wait = self._bucket.time_until_available()
+            if wait > 0:
+                # Reavalia a fila depois da espera: um pedido mais prioritário pode ter chegado
+                await asyncio.sleep(wait)
+                continue
+
+            priority, _, enqueued_at, grant = heapq.heappop(self._queue)
+            if grant.done():
+                continue
+
+            self._bucket.consume()
+            waited = time.monotonic() - enqueued_at
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._granted[Priority(priority).name] += 1
+            grant.set_result(None)
+
+
+upstream_scheduler = UpstreamScheduler(
+    requests_per_minute=settings.FOOTBALL_API_REQUESTS_PER_MINUTE,
+    burst=settings.FOOTBALL_API_BURST
+)
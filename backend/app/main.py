@@ -1,12 +1,60 @@
-from app.core.database import Base, engine
-from app.routers import user, team, sistema
-from fastapi import FastAPI
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.metrics import (
+    APP_STARTUP_DURATION, CONTENT_TYPE_LATEST, MetricsMiddleware, mark_process_dead, render_metrics
+)
+from app.core.database import dispose_engine, get_engine
+from app.core.sql_profiler import SQLProfilerMiddleware, install_sql_profiler
+from app.core.http_client import close_http_client, start_http_client
+from app.core.password_hashing import shutdown_hashing_pool, start_hashing_pool
+from app.core.response_cache import ORJSONResponse
+from app.core.upstream_scheduler import upstream_scheduler
+from app.routers import user, team, competition, sistema, export
+from app.services.prefetch_services import prefetch_worker
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-# Cria tabelas no banco
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # O schema é criado/atualizado pelas migrações (alembic upgrade head) antes de
+    # subir os workers; o startup não abre conexões com o banco (engine criado no primeiro uso)
+    started = time.perf_counter()
+    # Profiling de SQL por requisição (opt-in)
+    if settings.SQL_PROFILING:
+        install_sql_profiler(get_engine())
+    # Pool de conexões HTTP compartilhado com a API externa
+    await start_http_client()
+    # Pool de processos para bcrypt (hash/verificação de senhas)
+    start_hashing_pool()
+    # Prefetch periódico dos dados da competição
+    if settings.PREFETCH_ENABLED:
+        prefetch_worker.start()
+    startup_duration = time.perf_counter() - started
+    APP_STARTUP_DURATION.set(startup_duration)
+    logger.info("Startup concluído em %.1fms", startup_duration * 1000)
+    yield
+    await prefetch_worker.stop()
+    await upstream_scheduler.close()
+    await close_http_client()
+    shutdown_hashing_pool()
+    await dispose_engine()
+    mark_process_dead()
 
-app = FastAPI(title="Teste Técnico PLSS")
+app = FastAPI(title="Teste Técnico PLSS", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Compressão gzip/brotli negociada pelo Accept-Encoding
+app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE)
+# Latência e status por rota (/metrics)
+app.add_middleware(MetricsMiddleware)
+# Profiling de SQL por requisição (opt-in; os eventos do engine são registrados no lifespan)
+if settings.SQL_PROFILING:
+    app.add_middleware(SQLProfilerMiddleware)
 
 # Configuração CORS 
 app.add_middleware(
@@ -26,7 +74,13 @@ app.add_middleware(
 def root():
     return {"message": "API online"}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
 app.include_router(user.router)
 app.include_router(team.router)
+app.include_router(competition.router)
 app.include_router(sistema.router)
+app.include_router(export.router)
 
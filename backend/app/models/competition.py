@@ -0,0 +1,27 @@
+from app.core.database import Base
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from datetime import datetime
+
+
+class Competition(Base):
+    __tablename__ = "competitions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    external_id = Column(Integer, unique=True, index=True, nullable=False)  # ID da API externa
+    code = Column(String, unique=True, index=True, nullable=False)  # BSA, PL, PD, ...
+    name = Column(String, nullable=False)
+    type = Column(String, nullable=True)  # LEAGUE, CUP
+    emblem = Column(String, nullable=True)  # URL do emblema
+    season = Column(JSON, nullable=True)  # Temporada atual (id, startDate, endDate)
+    synced_at = Column(DateTime, nullable=True)  # Última importação da lista de times
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class TeamCompetition(Base):
+    __tablename__ = "team_competitions"
+
+    # Um time pode disputar várias competições. A chave (competition_id, team_id)
+    # atende a listagem dos times de uma competição; team_id tem índice próprio
+    competition_id = Column(Integer, ForeignKey("competitions.id", ondelete="CASCADE"), primary_key=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True, index=True)
@@ -0,0 +1,12 @@
+from app.core.database import Base
+from sqlalchemy import Column, Integer, DateTime, JSON
+from datetime import datetime
+
+
+class IndicadoresSnapshot(Base):
+    __tablename__ = "indicadores_snapshot"
+
+    id = Column(Integer, primary_key=True)  # Linha única (SNAPSHOT_ID)
+    version = Column(Integer, nullable=False, default=1)  # Incrementada a cada rebuild
+    payload = Column(JSON, nullable=False)  # Resposta pronta de /indicadores
+    generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,34 @@
+from app.core.database import Base
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, JSON
+from datetime import datetime
+
+
+class Match(Base):
+    __tablename__ = "matches"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # ID da partida na API externa
+    utc_date = Column(DateTime, nullable=False)  # Data/hora da partida (UTC)
+    status = Column(String, nullable=False, index=True)  # SCHEDULED, FINISHED, ...
+    matchday = Column(Integer, nullable=True)  # Rodada
+    stage = Column(String, nullable=True)
+    group = Column(String, nullable=True)
+    last_updated = Column(DateTime, nullable=False)  # lastUpdated da API externa (sync incremental)
+    competition_code = Column(String, nullable=True, index=True)  # BSA, CLI, ...
+    competition = Column(JSON, nullable=False)  # Dados da competição como vieram da API
+    season = Column(JSON, nullable=True)  # id, startDate, endDate da temporada
+    # Times locais, quando já importados na tabela teams
+    home_team_id = Column(Integer, ForeignKey("teams.id", ondelete="SET NULL"), nullable=True)
+    away_team_id = Column(Integer, ForeignKey("teams.id", ondelete="SET NULL"), nullable=True)
+    # IDs externos dos times (adversários podem não existir na tabela teams)
+    home_team_external_id = Column(Integer, nullable=False)
+    away_team_external_id = Column(Integer, nullable=False)
+    home_team = Column(JSON, nullable=False)  # id, name, shortName, tla, crest
+    away_team = Column(JSON, nullable=False)
+    score = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_matches_home_team_utc_date", "home_team_external_id", "utc_date"),
+        Index("ix_matches_away_team_utc_date", "away_team_external_id", "utc_date"),
+    )
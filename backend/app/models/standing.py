@@ -0,0 +1,35 @@
+from app.core.database import Base
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from datetime import datetime
+
+
+class Standing(Base):
+    __tablename__ = "standings"
+
+    # Uma linha por time em cada temporada de uma competição
+    competition_code = Column(String, primary_key=True)  # BSA, PL, ...
+    season = Column(Integer, primary_key=True)  # Ano de início da temporada
+    team_external_id = Column(Integer, primary_key=True)
+    team = Column(JSON, nullable=False)  # id, name, shortName, tla, crest
+    played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    goals_for = Column(Integer, nullable=False, default=0)
+    goals_against = Column(Integer, nullable=False, default=0)
+    points = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class StandingMatch(Base):
+    __tablename__ = "standing_matches"
+
+    # Resultado de cada partida já somado em standings: ao regravar a partida
+    # (placar corrigido, status alterado) o resultado antigo é descontado
+    match_id = Column(Integer, primary_key=True, autoincrement=False)
+    competition_code = Column(String, nullable=False)
+    season = Column(Integer, nullable=False)
+    home_team_external_id = Column(Integer, nullable=False)
+    away_team_external_id = Column(Integer, nullable=False)
+    home_goals = Column(Integer, nullable=False)
+    away_goals = Column(Integer, nullable=False)
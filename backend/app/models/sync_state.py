@@ -0,0 +1,9 @@
+from app.core.database import Base
+from sqlalchemy import Column, String, DateTime
+
+
+class SyncState(Base):
+    __tablename__ = "sync_state"
+
+    key = Column(String, primary_key=True)  # Ex.: "matches:team:1776"
+    synced_at = Column(DateTime, nullable=False)  # Último sync concluído
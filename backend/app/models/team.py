@@ -1,5 +1,5 @@
 from app.core.database import Base
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
 from datetime import datetime
 
 
@@ -19,3 +19,16 @@ class Team(Base):
     website = Column(String, nullable=True) # Site do time
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class TeamDetail(Base):
+    __tablename__ = "team_details"
+
+    # Dados de GET /v4/teams/{id} que não cabem na tabela teams
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True)
+    area = Column(JSON, nullable=True)  # id, name, code, flag
+    coach = Column(JSON, nullable=True)  # Técnico
+    squad = Column(JSON, nullable=True)  # Elenco
+    etag = Column(String, nullable=True)  # Validadores para requisições condicionais
+    last_modified = Column(String, nullable=True)
+    synced_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Última validação com a API
@@ -0,0 +1,116 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.competition import Competition, TeamCompetition
+from app.models.team import Team
+
+
+class CompetitionRepository:
+    @staticmethod
+    async def get_by_code(db: AsyncSession, code: str) -> Optional[Competition]:
+        """Busca a competição no banco local pelo código (BSA, PL, ...)"""
+        return await db.scalar(
+            select(Competition)
+            .where(Competition.code == code)
+            .execution_options(populate_existing=True)
+            .limit(1)
+        )
+
+    @staticmethod
+    async def get_all(db: AsyncSession):
+        """Competições importadas com a quantidade de times de cada uma"""
+        return (await db.execute(
+            select(Competition, func.count(TeamCompetition.team_id).label("teams"))
+            .outerjoin(TeamCompetition, TeamCompetition.competition_id == Competition.id)
+            .group_by(Competition.id)
+            .order_by(Competition.code)
+            .execution_options(populate_existing=True)
+        )).all()
+
+    @staticmethod
+    async def get_teams(db: AsyncSession, competition_id: int) -> List[Team]:
+        """Times da competição ordenados por ID externo (chave primária de team_competitions)"""
+        return (await db.scalars(
+            select(Team)
+            .join(TeamCompetition, TeamCompetition.team_id == Team.id)
+            .where(TeamCompetition.competition_id == competition_id)
+            .order_by(Team.external_id)
+            .execution_options(populate_existing=True)
+        )).all()
+
+    @staticmethod
+    async def get_version(db: AsyncSession, code: str):
+        """
+        Quantidade de times, atualização mais recente dos times e último
+        sync da competição. None se a competição não foi importada.
+        """
+        return (await db.execute(
+            select(
+                Competition.synced_at,
+                func.count(Team.id).label("total"),
+                func.max(Team.updated_at).label("newest_update"),
+            )
+            .outerjoin(TeamCompetition, TeamCompetition.competition_id == Competition.id)
+            .outerjoin(Team, Team.id == TeamCompetition.team_id)
+            .where(Competition.code == code)
+            .group_by(Competition.id, Competition.synced_at)
+        )).first()
+
+    @staticmethod
+    async def save_teams(
+        db: AsyncSession,
+        competition_data: Dict[str, Any],
+        season: Optional[Dict[str, Any]],
+        team_external_ids: List[int],
+    ) -> int:
+        """
+        Grava a competição e substitui a lista de times dela em uma única
+        transação. Os times precisam existir no banco local. Retorna o ID local.
+        """
+        now = datetime.utcnow()
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        values = {
+            "external_id": competition_data["id"],
+            "code": competition_data["code"],
+            "name": competition_data["name"],
+            "type": competition_data.get("type"),
+            "emblem": competition_data.get("emblem"),
+            "season": season,
+            "synced_at": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+        try:
+            stmt = insert(Competition).values(**values)
+            competition_id = (await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[Competition.external_id],
+                    set_={column: stmt.excluded[column] for column in values if column not in ("external_id", "created_at")}
+                ).returning(Competition.id)
+            )).scalar_one()
+
+            team_ids = select(Team.id).where(Team.external_id.in_(team_external_ids))
+            await db.execute(
+                delete(TeamCompetition).where(
+                    TeamCompetition.competition_id == competition_id,
+                    TeamCompetition.team_id.not_in(team_ids),
+                )
+            )
+            await db.execute(
+                insert(TeamCompetition)
+                .from_select(
+                    ["competition_id", "team_id"],
+                    select(literal(competition_id), Team.id).where(Team.external_id.in_(team_external_ids))
+                )
+                .on_conflict_do_nothing()
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return competition_id
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.indicadores import IndicadoresSnapshot
+
+# O snapshot é sempre uma única linha
+SNAPSHOT_ID = 1
+
+
+class IndicadoresRepository:
+    @staticmethod
+    async def get_snapshot(db: AsyncSession) -> Optional[IndicadoresSnapshot]:
+        """Lê o snapshot de indicadores pela chave primária"""
+        return await db.get(IndicadoresSnapshot, SNAPSHOT_ID)
+
+    @staticmethod
+    async def get_version(db: AsyncSession):
+        """Lê apenas a versão e a data do snapshot (sem o payload)"""
+        return (await db.execute(
+            select(IndicadoresSnapshot.version, IndicadoresSnapshot.generated_at)
+            .where(IndicadoresSnapshot.id == SNAPSHOT_ID)
+        )).first()
+
+    @staticmethod
+    async def save_snapshot(db: AsyncSession, payload: Dict[str, Any]) -> IndicadoresSnapshot:
+        """Grava o snapshot incrementando a versão (upsert atômico)"""
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(IndicadoresSnapshot).values(
+            id=SNAPSHOT_ID,
+            version=1,
+            payload=payload,
+            generated_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IndicadoresSnapshot.id],
+            set_={
+                "version": IndicadoresSnapshot.version + 1,
+                "payload": stmt.excluded.payload,
+                "generated_at": stmt.excluded.generated_at,
+            }
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+        return await db.get(IndicadoresSnapshot, SNAPSHOT_ID, populate_existing=True)
@@ -0,0 +1,218 @@
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+from app.models.match import Match
+from app.models.team import Team
+from app.repositories.standings import StandingsRepository
+from app.schemas.team import Match as MatchSchema
+
+# Limite de linhas por INSERT (mantém os parâmetros abaixo do limite do driver)
+BULK_UPSERT_BATCH_SIZE = 500
+
+
+def parse_utc(value: str) -> datetime:
+    """Converte datas ISO da API externa ("...Z") em datetime UTC sem timezone"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.replace(tzinfo=None) - parsed.utcoffset()
+    return parsed
+
+
+class MatchRepository:
+    @staticmethod
+    async def get_team_matches(
+        db: AsyncSession,
+        team_external_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        status: Optional[List[str]] = None,
+        competition: Optional[List[str]] = None,
+    ) -> List[Match]:
+        """Busca as partidas de um time no banco local, ordenadas por data"""
+        stmt = select(Match).where(
+            or_(
+                Match.home_team_external_id == team_external_id,
+                Match.away_team_external_id == team_external_id
+            )
+        )
+        if date_from:
+            stmt = stmt.where(Match.utc_date >= datetime.combine(date_from, datetime.min.time()))
+        if date_to:
+            stmt = stmt.where(Match.utc_date < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+        if status:
+            stmt = stmt.where(Match.status.in_(status))
+        if competition:
+            stmt = stmt.where(Match.competition_code.in_(competition))
+
+        return (await db.scalars(stmt.order_by(Match.utc_date.asc(), Match.id.asc()))).all()
+
+    @staticmethod
+    async def stream_export(
+        db: AsyncSession,
+        since: Optional[datetime],
+        after: Optional[int],
+        competition: Optional[List[str]],
+        batch_size: int
+    ) -> AsyncResult:
+        """
+        Abre um cursor no servidor com as partidas ordenadas por ID,
+        trazendo batch_size linhas por vez
+        """
+        stmt = (
+            select(
+                Match.id,
+                Match.utc_date,
+                Match.status,
+                Match.matchday,
+                Match.stage,
+                Match.group,
+                Match.competition_code,
+                Match.home_team,
+                Match.away_team,
+                Match.score,
+                Match.last_updated,
+                Match.updated_at,
+            )
+            .order_by(Match.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if since is not None:
+            stmt = stmt.where(Match.updated_at >= since)
+        if after is not None:
+            stmt = stmt.where(Match.id > after)
+        if competition:
+            stmt = stmt.where(Match.competition_code.in_(competition))
+        return await db.stream(stmt)
+
+    @staticmethod
+    async def get_team_version(db: AsyncSession, team_external_id: int):
+        """Quantidade de partidas do time e data da última gravação"""
+        return (await db.execute(
+            select(func.count(Match.id).label("total"), func.max(Match.updated_at).label("newest_update"))
+            .where(
+                or_(
+                    Match.home_team_external_id == team_external_id,
+                    Match.away_team_external_id == team_external_id
+                )
+            )
+        )).one()
+
+    @staticmethod
+    async def get_version(db: AsyncSession):
+        """Quantidade de partidas e data da última gravação (versão de todas as partidas)"""
+        return (await db.execute(
+            select(func.count(Match.id).label("total"), func.max(Match.updated_at).label("newest_update"))
+        )).one()
+
+    @staticmethod
+    async def get_finished_columns(db: AsyncSession):
+        """
+        Partidas encerradas com placar, em ordem cronológica, apenas com as
+        colunas usadas nas estatísticas (placar e times extraídos do JSON)
+        """
+        full_time = Match.score["fullTime"]
+        home_goals = full_time["home"].as_integer()
+        away_goals = full_time["away"].as_integer()
+        return (await db.execute(
+            select(
+                Match.id,
+                Match.utc_date,
+                Match.competition_code,
+                Match.home_team_external_id.label("home_id"),
+                Match.away_team_external_id.label("away_id"),
+                home_goals.label("home_goals"),
+                away_goals.label("away_goals"),
+                Match.home_team["name"].as_string().label("home_name"),
+                Match.away_team["name"].as_string().label("away_name"),
+                Match.home_team["tla"].as_string().label("home_tla"),
+                Match.away_team["tla"].as_string().label("away_tla"),
+            )
+            .where(Match.status == "FINISHED", home_goals.is_not(None), away_goals.is_not(None))
+            .order_by(Match.utc_date.asc(), Match.id.asc())
+        )).all()
+
+    @staticmethod
+    async def upsert_newer(db: AsyncSession, matches: List[MatchSchema]) -> int:
+        """
+        Grava apenas as partidas novas ou com lastUpdated mais recente que o
+        armazenado. Retorna a quantidade de partidas gravadas.
+        """
+        if not matches:
+            return 0
+
+        incoming = {match.id: match for match in matches}
+        stored = dict((await db.execute(
+            select(Match.id, Match.last_updated).where(Match.id.in_(incoming))
+        )).all())
+
+        changed = [
+            match for match_id, match in incoming.items()
+            if match_id not in stored or parse_utc(match.last_updated) > stored[match_id]
+        ]
+        if not changed:
+            return 0
+
+        # Resolve as FKs para os times já existentes localmente
+        external_ids = {m.home_team.id for m in changed} | {m.away_team.id for m in changed}
+        local_ids = dict((await db.execute(
+            select(Team.external_id, Team.id).where(Team.external_id.in_(external_ids))
+        )).all())
+
+        now = datetime.utcnow()
+        rows = [MatchRepository._match_values(match, local_ids, now) for match in changed]
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+        written = set()
+        try:
+            for start in range(0, len(rows), BULK_UPSERT_BATCH_SIZE):
+                batch = rows[start:start + BULK_UPSERT_BATCH_SIZE]
+                stmt = insert(Match).values(batch)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Match.id],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in batch[0]
+                        if column not in ("id", "created_at")
+                    },
+                    # Protege contra sobrescrever um dado mais novo gravado em paralelo
+                    where=Match.last_updated < stmt.excluded.last_updated
+                )
+                written.update((await db.execute(stmt.returning(Match.id))).scalars())
+            # Na mesma transação: a classificação acompanha exatamente as partidas gravadas
+            await StandingsRepository.apply_matches(db, [row for row in rows if row["id"] in written])
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        return len(written)
+
+    @staticmethod
+    def _match_values(match: MatchSchema, local_ids: Dict[int, int], now: datetime) -> Dict[str, Any]:
+        """Converte uma partida validada nas colunas da tabela matches"""
+        return {
+            "id": match.id,
+            "utc_date": parse_utc(match.utc_date),
+            "status": match.status,
+            "matchday": match.matchday,
+            "stage": match.stage,
+            "group": match.group,
+            "last_updated": parse_utc(match.last_updated),
+            "competition_code": match.competition.code,
+            "competition": match.competition.model_dump(),
+            "season": match.season,
+            "home_team_id": local_ids.get(match.home_team.id),
+            "away_team_id": local_ids.get(match.away_team.id),
+            "home_team_external_id": match.home_team.id,
+            "away_team_external_id": match.away_team.id,
+            "home_team": match.home_team.model_dump(by_alias=True),
+            "away_team": match.away_team.model_dump(by_alias=True),
+            "score": match.score.model_dump(by_alias=True),
+            "created_at": now,
+            "updated_at": now,
+        }
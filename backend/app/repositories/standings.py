@@ -0,0 +1,292 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import Match
+from app.models.standing import Standing, StandingMatch
+
+# Limite de linhas/parâmetros por comando (como em MatchRepository)
+BATCH_SIZE = 500
+COUNTERS = ("played", "wins", "draws", "losses", "goals_for", "goals_against", "points")
+
+StandingKey = Tuple[str, int, int]  # (competição, temporada, time)
+
+
+def season_start_year(season: Optional[Dict[str, Any]]) -> Optional[int]:
+    """Ano de início da temporada ("2025-03-29" -> 2025), como no filtro ?season= da API externa"""
+    try:
+        return int(season["startDate"][:4])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def match_result(values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Resultado que a partida soma na classificação (colunas de standing_matches),
+    ou None se ela não conta: não encerrada, sem placar, competição ou temporada
+    """
+    full_time = (values.get("score") or {}).get("fullTime") or {}
+    season = season_start_year(values.get("season"))
+    if (
+        values["status"] != "FINISHED"
+        or full_time.get("home") is None
+        or full_time.get("away") is None
+        or season is None
+        or not values.get("competition_code")
+    ):
+        return None
+    return {
+        "match_id": values["id"],
+        "competition_code": values["competition_code"],
+        "season": season,
+        "home_team_external_id": values["home_team_external_id"],
+        "away_team_external_id": values["away_team_external_id"],
+        "home_goals": full_time["home"],
+        "away_goals": full_time["away"],
+    }
+
+
+def accumulate(totals: Dict[StandingKey, Dict[str, int]], result: Dict[str, Any], sign: int = 1) -> None:
+    """Soma (sign=1) ou desconta (sign=-1) o resultado da partida nos dois times"""
+    sides = (
+        (result["home_team_external_id"], result["home_goals"], result["away_goals"]),
+        (result["away_team_external_id"], result["away_goals"], result["home_goals"]),
+    )
+    for team_id, scored, conceded in sides:
+        entry = totals.setdefault(
+            (result["competition_code"], result["season"], team_id), dict.fromkeys(COUNTERS, 0)
+        )
+        entry["played"] += sign
+        entry["goals_for"] += sign * scored
+        entry["goals_against"] += sign * conceded
+        if scored > conceded:
+            entry["wins"] += sign
+            entry["points"] += 3 * sign
+        elif scored == conceded:
+            entry["draws"] += sign
+            entry["points"] += sign
+        else:
+            entry["losses"] += sign
+
+
+def _batches(items: List[Any]) -> Iterable[List[Any]]:
+    for start in range(0, len(items), BATCH_SIZE):
+        yield items[start:start + BATCH_SIZE]
+
+
+class StandingsRepository:
+    @staticmethod
+    async def get_table(db: AsyncSession, competition_code: str, season: int) -> List[Standing]:
+        """Classificação ordenada por pontos, saldo, gols pró e vitórias"""
+        return (await db.scalars(
+            select(Standing)
+            .where(Standing.competition_code == competition_code, Standing.season == season)
+            .order_by(
+                Standing.points.desc(),
+                (Standing.goals_for - Standing.goals_against).desc(),
+                Standing.goals_for.desc(),
+                Standing.wins.desc(),
+                Standing.team_external_id,
+            )
+            .execution_options(populate_existing=True)
+        )).all()
+
+    @staticmethod
+    async def get_latest_season(db: AsyncSession, competition_code: str) -> Optional[int]:
+        """Temporada mais recente com classificação no banco local"""
+        return await db.scalar(
+            select(func.max(Standing.season)).where(Standing.competition_code == competition_code)
+        )
+
+    @staticmethod
+    async def get_version(db: AsyncSession, competition_code: str, season: int):
+        """Quantidade de linhas e última atualização da classificação da temporada"""
+        return (await db.execute(
+            select(func.count().label("total"), func.max(Standing.updated_at).label("newest_update"))
+            .where(Standing.competition_code == competition_code, Standing.season == season)
+        )).one()
+
+    @staticmethod
+    async def apply_matches(db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        """
+        Atualiza a classificação com as partidas recém-gravadas (colunas da
+        tabela matches), sem commit: roda na transação do upsert das partidas.
+        Desconta o resultado aplicado anteriormente e soma o atual, então o
+        custo é proporcional às partidas alteradas. Retorna as linhas alteradas.
+        """
+        if not rows:
+            return 0
+
+        applied: Dict[int, Dict[str, Any]] = {}
+        for batch in _batches([row["id"] for row in rows]):
+            for previous in (await db.scalars(
+                select(StandingMatch).where(StandingMatch.match_id.in_(batch))
+            )).all():
+                applied[previous.match_id] = {
+                    column: getattr(previous, column) for column in StandingMatch.__table__.columns.keys()
+                }
+
+        deltas: Dict[StandingKey, Dict[str, int]] = {}
+        teams: Dict[int, Dict[str, Any]] = {}
+        upserts, removals = [], []
+        for row in rows:
+            previous, current = applied.get(row["id"]), match_result(row)
+            if previous == current:
+                continue
+            if previous is not None:
+                accumulate(deltas, previous, -1)
+            if current is not None:
+                accumulate(deltas, current)
+                upserts.append(current)
+            else:
+                removals.append(row["id"])
+            teams[row["home_team_external_id"]] = row["home_team"]
+            teams[row["away_team_external_id"]] = row["away_team"]
+
+        deltas = {key: delta for key, delta in deltas.items() if any(delta.values())}
+        await StandingsRepository._add_deltas(db, deltas, teams)
+        await StandingsRepository._save_results(db, upserts, removals)
+        return len(deltas)
+
+    @staticmethod
+    async def _add_deltas(
+        db: AsyncSession, deltas: Dict[StandingKey, Dict[str, int]], teams: Dict[int, Dict[str, Any]]
+    ) -> None:
+        if not deltas:
+            return
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        now = datetime.utcnow()
+        values = [
+            {
+                "competition_code": code,
+                "season": season,
+                "team_external_id": team_id,
+                "team": teams.get(team_id) or {"id": team_id},
+                **delta,
+                "updated_at": now,
+            }
+            for (code, season, team_id), delta in deltas.items()
+        ]
+        for batch in _batches(values):
+            stmt = insert(Standing).values(batch)
+            await db.execute(stmt.on_conflict_do_update(
+                index_elements=[Standing.competition_code, Standing.season, Standing.team_external_id],
+                set_={
+                    **{column: getattr(Standing, column) + stmt.excluded[column] for column in COUNTERS},
+                    "team": stmt.excluded.team,
+                    "updated_at": stmt.excluded.updated_at,
+                }
+            ))
+
+        # Times que ficaram sem partidas (resultado anulado) saem da tabela
+        keys = list(deltas)
+        for batch in _batches(keys):
+            await db.execute(
+                delete(Standing).where(
+                    tuple_(Standing.competition_code, Standing.season, Standing.team_external_id).in_(batch),
+                    Standing.played <= 0,
+                )
+            )
+
+    @staticmethod
+    async def _save_results(db: AsyncSession, upserts: List[Dict[str, Any]], removals: List[int]) -> None:
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        for batch in _batches(upserts):
+            stmt = insert(StandingMatch).values(batch)
+            await db.execute(stmt.on_conflict_do_update(
+                index_elements=[StandingMatch.match_id],
+                set_={column: stmt.excluded[column] for column in batch[0] if column != "match_id"}
+            ))
+        for batch in _batches(removals):
+            await db.execute(delete(StandingMatch).where(StandingMatch.match_id.in_(batch)))
+
+    @staticmethod
+    async def compute_full(db: AsyncSession) -> Tuple[Dict[StandingKey, Dict[str, int]], Dict[int, Dict[str, Any]]]:
+        """
+        Recalcula do zero, a partir de todas as partidas gravadas, os
+        totais de cada time e os resultados de cada partida
+        """
+        totals: Dict[StandingKey, Dict[str, int]] = {}
+        results: Dict[int, Dict[str, Any]] = {}
+        stream = await db.stream(
+            select(
+                Match.id,
+                Match.status,
+                Match.competition_code,
+                Match.season,
+                Match.score,
+                Match.home_team_external_id,
+                Match.away_team_external_id,
+            )
+            .order_by(Match.id)
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        async for row in stream.mappings():
+            result = match_result(row)
+            if result is not None:
+                accumulate(totals, result)
+                results[result["match_id"]] = result
+        return totals, results
+
+    @staticmethod
+    async def get_all(db: AsyncSession) -> Tuple[Dict[StandingKey, Dict[str, int]], Dict[int, Dict[str, Any]]]:
+        """Totais e resultados aplicados atualmente (mantidos de forma incremental)"""
+        totals = {
+            (row.competition_code, row.season, row.team_external_id): {column: getattr(row, column) for column in COUNTERS}
+            for row in (await db.scalars(select(Standing))).all()
+        }
+        columns = StandingMatch.__table__.columns.keys()
+        results = {
+            row.match_id: {column: getattr(row, column) for column in columns}
+            for row in (await db.scalars(select(StandingMatch))).all()
+        }
+        return totals, results
+
+    @staticmethod
+    async def replace_all(db: AsyncSession, results: Dict[int, Dict[str, Any]]) -> int:
+        """
+        Substitui a classificação inteira pelo recálculo a partir dos
+        resultados das partidas. Retorna a quantidade de linhas gravadas.
+        """
+        # Dados mais recentes de cada time (nome, sigla, escudo)
+        teams: Dict[int, Dict[str, Any]] = {}
+        stream = await db.stream(
+            select(Match.home_team_external_id, Match.away_team_external_id, Match.home_team, Match.away_team)
+            .order_by(Match.utc_date, Match.id)
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        async for home_id, away_id, home_team, away_team in stream:
+            teams[home_id], teams[away_id] = home_team, away_team
+
+        totals: Dict[StandingKey, Dict[str, int]] = {}
+        for result in results.values():
+            accumulate(totals, result)
+
+        try:
+            await db.execute(delete(Standing))
+            await db.execute(delete(StandingMatch))
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "competition_code": code,
+                    "season": season,
+                    "team_external_id": team_id,
+                    "team": teams.get(team_id) or {"id": team_id},
+                    **counters,
+                    "updated_at": now,
+                }
+                for (code, season, team_id), counters in totals.items()
+            ]
+            for batch in _batches(rows):
+                await db.execute(Standing.__table__.insert(), batch)
+            for batch in _batches(list(results.values())):
+                await db.execute(StandingMatch.__table__.insert(), batch)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return len(rows)
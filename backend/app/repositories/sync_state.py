@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sync_state import SyncState
+
+
+class SyncStateRepository:
+    @staticmethod
+    async def get_synced_at(db: AsyncSession, key: str) -> Optional[datetime]:
+        """Retorna a data do último sync concluído para a chave"""
+        state = await db.get(SyncState, key)
+        return state.synced_at if state else None
+
+    @staticmethod
+    async def mark_synced(db: AsyncSession, key: str, synced_at: Optional[datetime] = None) -> None:
+        """Registra um sync concluído para a chave (upsert atômico: syncs concorrentes não colidem)"""
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(SyncState).values(key=key, synced_at=synced_at or datetime.utcnow())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SyncState.key],
+            set_={"synced_at": stmt.excluded.synced_at},
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+    @staticmethod
+    async def try_claim(db: AsyncSession, key: str, stale_before: datetime) -> bool:
+        """
+        Marca a chave como sincronizada agora somente se o último sync for
+        anterior a stale_before. Permite que apenas um processo (worker do
+        uvicorn) execute a tarefa por janela.
+        """
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(SyncState)
+            .where(SyncState.key == key, SyncState.synced_at <= stale_before)
+            .values(synced_at=now)
+        )
+        if result.rowcount:
+            await db.commit()
+            return True
+
+        if await db.get(SyncState, key) is not None:
+            await db.rollback()
+            return False
+
+        db.add(SyncState(key=key, synced_at=now))
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return False
+        return True
@@ -1,27 +1,79 @@
-import requests
-from typing import List, Dict, Any
+import httpx
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from app.core.config import settings
-from sqlalchemy.orm import Session
-from app.models.team import Team
+from app.core.http_client import get_http_client, get_http_semaphore
+from app.core.metrics import track_upstream
+from app.core.upstream_scheduler import Priority, upstream_scheduler
+from sqlalchemy import case, func, literal_column, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from app.models.team import Team, TeamDetail
 from fastapi import HTTPException, status
 
+# Limite de linhas por INSERT (mantém os parâmetros abaixo do limite do driver)
+BULK_UPSERT_BATCH_SIZE = 1000
+
+# Texto pesquisado pela busca aproximada no Postgres; a query usa exatamente
+# a mesma expressão do índice GIN (criado pela migração inicial) para que o
+# planner consiga usá-lo
+SEARCH_DOCUMENT = "f_unaccent(lower(name || ' ' || coalesce(short_name, '') || ' ' || coalesce(tla, '')))"
+TRIGRAM_SEARCH_INDEX = "ix_teams_search_trgm"
+
+# Colunas lidas pelo snapshot de indicadores e pelo índice de busca
+SNAPSHOT_COLUMNS = ("name", "short_name", "tla", "founded")
+
 
 class TeamRepository:
-    def __init__(self):
-        self.base_url = settings.FOOTBALL_API_BASE_URL
-        self.headers = {
-            "X-Auth-Token": settings.FOOTBALL_API_SECRET_KEY,
-            "Content-Type": "application/json"
-        }
+    # Campos da listagem local; "id" é o ID externo, igual às demais rotas de times
+    LIST_COLUMNS = {
+        "id": Team.external_id,
+        "name": Team.name,
+        "short_name": Team.short_name,
+        "tla": Team.tla,
+        "crest": Team.crest,
+        "area": Team.area,
+        "founded": Team.founded,
+        "club_colors": Team.club_colors,
+        "venue": Team.venue,
+        "website": Team.website,
+    }
 
-    def _make_request(self, endpoint: str) -> Dict[Any, Any]:
-        """Faz requisição para a API externa"""
+    async def _make_request(self, endpoint: str, priority: Priority = Priority.USER) -> Dict[Any, Any]:
+        """Faz requisição para a API externa usando o cliente HTTP compartilhado"""
+        response = await self._send(endpoint, priority=priority)
+        return response.json()
+
+    async def _send(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        priority: Priority = Priority.USER
+    ) -> httpx.Response:
+        """
+        Executa o GET na API externa via agendador (cota, coalescing e prioridade)
+        e converte erros em HTTPException.
+        Respostas 200 e 304 (requisições condicionais) são retornadas.
+        No modo replay não há rede nem cota: o agendador é dispensado.
+        """
+        if settings.FOOTBALL_API_MODE == "replay":
+            return await self._execute(endpoint, headers)
+        key = f"GET {endpoint} {sorted((headers or {}).items())}"
+        return await upstream_scheduler.run(
+            key, lambda: self._execute(endpoint, headers), priority=priority
+        )
+
+    async def _execute(self, endpoint: str, headers: Optional[Dict[str, str]]) -> httpx.Response:
+        """Envia a requisição (já liberada pelo agendador)"""
         try:
-            url = f"{self.base_url}{endpoint}"
-            response = requests.get(url, headers=self.headers)
+            async with get_http_semaphore():
+                with track_upstream(endpoint) as observation:
+                    response = await get_http_client().get(endpoint, headers=headers)
+                    observation["status"] = response.status_code
             
-            if response.status_code == 200:
-                return response.json()
+            if response.status_code in (200, 304):
+                return response
             elif response.status_code == 404:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -32,84 +84,397 @@ class TeamRepository:
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Access forbidden - check API key"
                 )
+            elif response.status_code == 429:
+                # A cota foi excedida: pausa o agendador até a janela reiniciar
+                upstream_scheduler.backoff(self._retry_after(response))
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="External API rate limit exceeded"
+                )
             else:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"External API error: {response.status_code}"
                 )
-        except requests.exceptions.RequestException as e:
+        except httpx.TimeoutException as e:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"External API timeout: {str(e)}"
+            )
+        except httpx.HTTPError as e:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=f"External API unavailable: {str(e)}"
             )
 
-    def get_competition_teams(self, competition_code: str = "BSA") -> Dict[Any, Any]:
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        """Segundos até a cota da API externa reiniciar"""
+        for header in ("Retry-After", "X-RequestCounter-Reset"):
+            try:
+                return float(response.headers[header])
+            except (KeyError, ValueError):
+                continue
+        return 60.0
+
+    async def get_competition_teams(
+        self,
+        competition_code: str,
+        priority: Priority = Priority.USER
+    ) -> Dict[Any, Any]:
         """Busca times de uma competição específica"""
         endpoint = f"/v4/competitions/{competition_code}/teams"
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint, priority=priority)
 
-    def get_team_details(self, team_id: int) -> Dict[Any, Any]:
+    async def get_team_details(self, team_id: int, priority: Priority = Priority.USER) -> Dict[Any, Any]:
         """Busca detalhes de um time específico"""
         endpoint = f"/v4/teams/{team_id}"
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint, priority=priority)
 
-    def get_team_matches(self, team_id: int) -> Dict[Any, Any]:
+    async def get_team_details_conditional(
+        self,
+        team_id: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        priority: Priority = Priority.USER
+    ) -> Tuple[Optional[Dict[Any, Any]], Optional[str], Optional[str]]:
+        """
+        Busca detalhes de um time com If-None-Match/If-Modified-Since.
+        Retorna (dados, etag, last_modified); dados é None quando a API responde 304.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = await self._send(f"/v4/teams/{team_id}", headers=headers or None, priority=priority)
+        new_etag = response.headers.get("ETag", etag)
+        new_last_modified = response.headers.get("Last-Modified", last_modified)
+
+        if response.status_code == 304:
+            return None, new_etag, new_last_modified
+        return response.json(), new_etag, new_last_modified
+
+    async def get_team_matches(self, team_id: int, priority: Priority = Priority.USER) -> Dict[Any, Any]:
         """Busca partidas de um time específico"""
         endpoint = f"/v4/teams/{team_id}/matches"
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint, priority=priority)
+
+    async def get_competition_matches(
+        self,
+        competition_code: str,
+        season: Optional[int] = None,
+        priority: Priority = Priority.USER
+    ) -> Dict[Any, Any]:
+        """Busca todas as partidas de uma temporada da competição (padrão: temporada atual)"""
+        endpoint = f"/v4/competitions/{competition_code}/matches"
+        if season is not None:
+            endpoint = f"{endpoint}?season={season}"
+        return await self._make_request(endpoint, priority=priority)
 
     # Métodos para banco de dados local (cache)
     @staticmethod
-    def get_by_external_id(db: Session, external_id: int):
+    async def get_by_external_id(db: AsyncSession, external_id: int):
         """Busca time no banco local pelo ID externo"""
-        return db.query(Team).filter(Team.external_id == external_id).first()
+        return await db.scalar(select(Team).where(Team.external_id == external_id).limit(1))
 
     @staticmethod
-    def get_all_local(db: Session) -> List[Team]:
+    async def get_all_local(db: AsyncSession) -> List[Team]:
         """Busca todos os times no banco local"""
-        return db.query(Team).all()
-
-    @staticmethod
-    def create_or_update(db: Session, team_data: Dict[Any, Any]) -> Team:
-        """Cria ou atualiza um time no banco local"""
-        existing_team = TeamRepository.get_by_external_id(db, team_data["id"])
-        
-        if existing_team:
-            # Atualiza team existente
-            existing_team.name = team_data.get("name", existing_team.name)
-            existing_team.short_name = team_data.get("shortName")
-            existing_team.tla = team_data.get("tla")
-            existing_team.crest = team_data.get("crest")
-            existing_team.area = team_data.get("area", {}).get("name") if isinstance(team_data.get("area"), dict) else team_data.get("area")
-            existing_team.founded = team_data.get("founded")
-            existing_team.club_colors = team_data.get("clubColors")
-            existing_team.venue = team_data.get("venue")
-            existing_team.website = team_data.get("website")
-            db.commit()
-            db.refresh(existing_team)
-            return existing_team
-        else:
-            # Cria novo team
-            area_value = None
-            if team_data.get("area"):
-                if isinstance(team_data.get("area"), dict):
-                    area_value = team_data["area"].get("name")
-                else:
-                    area_value = team_data.get("area")
-            
-            db_team = Team(
-                external_id=team_data["id"],
-                name=team_data["name"],
-                short_name=team_data.get("shortName"),
-                tla=team_data.get("tla"),
-                crest=team_data.get("crest"),
-                area=area_value,
-                founded=team_data.get("founded"),
-                club_colors=team_data.get("clubColors"),
-                venue=team_data.get("venue"),
-                website=team_data.get("website")
+        # populate_existing: a sessão não expira objetos no commit, então as
+        # linhas já carregadas são relidas após um upsert
+        return (await db.scalars(
+            select(Team).execution_options(populate_existing=True)
+        )).all()
+
+    @staticmethod
+    async def get_page(db: AsyncSession, columns: Sequence[Any], after: Optional[int], limit: int):
+        """
+        Página de times por keyset sobre o índice único de external_id,
+        apenas com as colunas pedidas. Busca limit + 1 linhas.
+        """
+        stmt = select(*columns).order_by(Team.external_id).limit(limit + 1)
+        if after is not None:
+            stmt = stmt.where(Team.external_id > after)
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def stream_export(
+        db: AsyncSession,
+        since: Optional[datetime],
+        after: Optional[int],
+        batch_size: int
+    ) -> AsyncResult:
+        """
+        Abre um cursor no servidor com os times ordenados por ID externo,
+        trazendo batch_size linhas por vez (sem carregar a tabela em memória)
+        """
+        stmt = (
+            select(
+                *(column.label(name) for name, column in TeamRepository.LIST_COLUMNS.items()),
+                Team.updated_at,
+            )
+            .order_by(Team.external_id)
+            .execution_options(yield_per=batch_size)
+        )
+        if since is not None:
+            stmt = stmt.where(Team.updated_at >= since)
+        if after is not None:
+            stmt = stmt.where(Team.external_id > after)
+        return await db.stream(stmt)
+
+    @staticmethod
+    async def get_version(db: AsyncSession):
+        """Quantidade de times e datas da atualização mais antiga/mais recente"""
+        return (await db.execute(
+            select(
+                func.count(Team.id).label("total"),
+                func.min(Team.updated_at).label("oldest_update"),
+                func.max(Team.updated_at).label("newest_update"),
             )
-            db.add(db_team)
-            db.commit()
-            db.refresh(db_team)
-            return db_team
+        )).one()
+
+    @staticmethod
+    def _team_values(team_data: Dict[Any, Any], now: datetime) -> Dict[str, Any]:
+        """Converte o payload da API externa nas colunas da tabela teams"""
+        area_value = team_data.get("area")
+        if isinstance(area_value, dict):
+            area_value = area_value.get("name")
+
+        return {
+            "external_id": team_data["id"],
+            "name": team_data["name"],
+            "short_name": team_data.get("shortName"),
+            "tla": team_data.get("tla"),
+            "crest": team_data.get("crest"),
+            "area": area_value or None,
+            "founded": team_data.get("founded"),
+            "club_colors": team_data.get("clubColors"),
+            "venue": team_data.get("venue"),
+            "website": team_data.get("website"),
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    @staticmethod
+    async def bulk_upsert(db: AsyncSession, teams_data: List[Dict[Any, Any]]) -> Tuple[int, int]:
+        """
+        Cria ou atualiza vários times em uma única transação usando
+        INSERT ... ON CONFLICT (external_id) DO UPDATE.
+        Retorna (novos, atualizados).
+        """
+        now = datetime.utcnow()
+        # Remove duplicados do payload: o mesmo external_id não pode aparecer
+        # duas vezes no mesmo ON CONFLICT DO UPDATE
+        rows = list({
+            team_data["id"]: TeamRepository._team_values(team_data, now)
+            for team_data in teams_data
+        }.values())
+        if not rows:
+            return 0, 0
+
+        dialect = db.get_bind().dialect.name
+        novos = 0
+
+        try:
+            for start in range(0, len(rows), BULK_UPSERT_BATCH_SIZE):
+                batch = rows[start:start + BULK_UPSERT_BATCH_SIZE]
+                stmt = TeamRepository._upsert_statement(db, batch)
+
+                if dialect == "postgresql":
+                    # xmax = 0 indica linha inserida (e não atualizada) pelo statement
+                    stmt = stmt.returning(literal_column("(xmax = 0)").label("inserted"))
+                    novos += sum(1 for inserted in (await db.scalars(stmt)) if inserted)
+                else:
+                    external_ids = [row["external_id"] for row in batch]
+                    existentes = await db.scalar(
+                        select(func.count()).where(Team.external_id.in_(external_ids))
+                    )
+                    await db.execute(stmt)
+                    novos += len(batch) - existentes
+
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        return novos, len(rows) - novos
+
+    @staticmethod
+    def _upsert_statement(db: AsyncSession, rows: List[Dict[str, Any]]):
+        """Monta o INSERT ... ON CONFLICT (external_id) DO UPDATE para as linhas"""
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(Team).values(rows)
+        # created_at é preservado; o restante vem do payload novo
+        update_columns = {
+            column: stmt.excluded[column]
+            for column in rows[0]
+            if column not in ("external_id", "created_at")
+        }
+        return stmt.on_conflict_do_update(
+            index_elements=[Team.external_id],
+            set_=update_columns
+        )
+
+    @staticmethod
+    async def get_with_details(db: AsyncSession, external_id: int) -> Optional[Tuple[Team, Optional[TeamDetail]]]:
+        """Busca o time local e seus detalhes (elenco, técnico) em uma única query"""
+        row = (await db.execute(
+            select(Team, TeamDetail)
+            .outerjoin(TeamDetail, TeamDetail.team_id == Team.id)
+            .where(Team.external_id == external_id)
+            .execution_options(populate_existing=True)
+        )).first()
+        return (row[0], row[1]) if row else None
+
+    @staticmethod
+    async def get_details_version(db: AsyncSession, external_id: int):
+        """Versão dos dados do time (updated_at) e do último sync dos detalhes, sem carregar o elenco"""
+        return (await db.execute(
+            select(Team.updated_at, TeamDetail.synced_at)
+            .outerjoin(TeamDetail, TeamDetail.team_id == Team.id)
+            .where(Team.external_id == external_id)
+        )).first()
+
+    @staticmethod
+    async def save_details(
+        db: AsyncSession,
+        team_data: Dict[Any, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> bool:
+        """
+        Atualiza o time e grava elenco/técnico em uma única transação.
+        O time precisa existir no banco local.
+        Retorna True se alguma coluna de SNAPSHOT_COLUMNS mudou (ou o time é novo).
+        """
+        now = datetime.utcnow()
+        team_values = TeamRepository._team_values(team_data, now)
+        try:
+            previous = (await db.execute(
+                select(*(getattr(Team, column) for column in SNAPSHOT_COLUMNS))
+                .where(Team.external_id == team_values["external_id"])
+            )).first()
+            team_id = (await db.execute(
+                TeamRepository._upsert_statement(db, [team_values]).returning(Team.id)
+            )).scalar_one()
+
+            insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+            values = {
+                "team_id": team_id,
+                "area": team_data.get("area") if isinstance(team_data.get("area"), dict) else None,
+                "coach": team_data.get("coach"),
+                "squad": team_data.get("squad"),
+                "etag": etag,
+                "last_modified": last_modified,
+                "synced_at": now,
+            }
+            stmt = insert(TeamDetail).values(**values)
+            await db.execute(stmt.on_conflict_do_update(
+                index_elements=[TeamDetail.team_id],
+                set_={column: stmt.excluded[column] for column in values if column != "team_id"}
+            ))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return previous is None or tuple(previous) != tuple(team_values[column] for column in SNAPSHOT_COLUMNS)
+
+    @staticmethod
+    async def touch_details(
+        db: AsyncSession,
+        team_id: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Registra uma revalidação sem mudanças (304) dos detalhes do time"""
+        await db.execute(
+            update(TeamDetail)
+            .where(TeamDetail.team_id == team_id)
+            .values(synced_at=datetime.utcnow(), etag=etag, last_modified=last_modified)
+        )
+        await db.commit()
+
+    # Busca aproximada (/teams/search)
+    @staticmethod
+    async def has_trigram_search(db: AsyncSession) -> bool:
+        """Verifica se o índice GIN de trigramas existe (Postgres com pg_trgm/unaccent)"""
+        return bool(await db.scalar(
+            text("SELECT to_regclass(:index_name) IS NOT NULL"), {"index_name": TRIGRAM_SEARCH_INDEX}
+        ))
+
+    @staticmethod
+    async def search_trigram(db: AsyncSession, query: str, limit: int, min_score: float):
+        """
+        Times mais parecidos com a busca via pg_trgm (word_similarity sobre
+        nome, nome curto e sigla sem acentos), usando o índice GIN
+        """
+        # O operador <% usa o limite da sessão; set_config(..., true) vale só para esta transação
+        await db.execute(
+            select(func.set_config("pg_trgm.word_similarity_threshold", str(min_score), True))
+        )
+        return (await db.execute(
+            text(
+                "SELECT external_id AS id, name, short_name, tla, crest, "
+                f"word_similarity(f_unaccent(lower(:query)), {SEARCH_DOCUMENT}) AS score "
+                f"FROM teams WHERE f_unaccent(lower(:query)) <% {SEARCH_DOCUMENT} "
+                "ORDER BY score DESC, external_id LIMIT :limit"
+            ),
+            {"query": query, "limit": limit},
+        )).all()
+
+    @staticmethod
+    async def get_search_documents(db: AsyncSession) -> List[Dict[str, Any]]:
+        """Campos da busca para o índice em memória, ordenados por ID externo"""
+        rows = await db.execute(
+            select(Team.external_id.label("id"), Team.name, Team.short_name, Team.tla, Team.crest)
+            .order_by(Team.external_id)
+        )
+        return [dict(row._mapping) for row in rows]
+
+    # Agregações para /indicadores (quantidade fixa de queries, independente do volume)
+    @staticmethod
+    async def get_foundation_summary(db: AsyncSession):
+        """Totais e agregados de fundação em uma única query"""
+        stmt = select(
+            func.count(Team.id).label("total_teams"),
+            func.count(Team.founded).label("teams_with_founded"),
+            func.min(Team.founded).label("oldest_year"),
+            func.max(Team.founded).label("newest_year"),
+            func.avg(Team.founded).label("avg_year"),
+            func.sum(case((Team.founded <= 1924, 1), else_=0)).label("centenarios"),
+            func.sum(case((Team.founded >= 1990, 1), else_=0)).label("modernos"),
+        )
+        return (await db.execute(stmt)).one()
+
+    @staticmethod
+    async def get_foundation_rankings(db: AsyncSession, limit: int = 5):
+        """
+        Times mais antigos e mais novos em uma única query (window functions).
+        Retorna apenas nome, tla, fundação e as posições em cada ranking.
+        """
+        ranked = select(
+            Team.name,
+            Team.tla,
+            Team.founded,
+            func.row_number().over(order_by=(Team.founded.asc(), Team.id.asc())).label("rank_oldest"),
+            func.row_number().over(order_by=(Team.founded.desc(), Team.id.asc())).label("rank_newest"),
+        ).where(Team.founded.isnot(None)).cte("ranked")
+
+        stmt = select(ranked).where(
+            or_(ranked.c.rank_oldest <= limit, ranked.c.rank_newest <= limit)
+        )
+        return (await db.execute(stmt)).all()
+
+    @staticmethod
+    async def get_foundation_decades(db: AsyncSession):
+        """Distribuição de times por década de fundação"""
+        decade = (func.floor(Team.founded / 10) * 10).label("decade")
+        stmt = (
+            select(decade, func.count(Team.id).label("quantidade"))
+            .where(Team.founded.isnot(None))
+            .group_by("decade")
+            .order_by("decade")
+        )
+        return (await db.execute(stmt)).all()
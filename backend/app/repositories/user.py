@@ -1,37 +1,59 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
-from typing import List
+from typing import Any, Optional, Sequence
 
 class UserRepository:
+    # Campos públicos da listagem (hashed_password nunca é exposto)
+    LIST_COLUMNS = {
+        "id": User.id,
+        "username": User.username,
+        "email": User.email,
+        "team_favorite": User.team_favorite,
+    }
+
     @staticmethod
-    def get_by_username(db: Session, username: str):
-        return db.query(User).filter(User.username == username).first()
+    async def get_by_username(db: AsyncSession, username: str):
+        return await db.scalar(select(User).where(User.username == username).limit(1))
 
     @staticmethod
-    def get_by_email(db: Session, email: str):
-        return db.query(User).filter(User.email == email).first()
+    async def get_by_email(db: AsyncSession, email: str):
+        return await db.scalar(select(User).where(User.email == email).limit(1))
 
     @staticmethod
-    def get_by_id(db: Session, user_id: int):
-        return db.query(User).filter(User.id == user_id).first()
+    async def get_by_id(db: AsyncSession, user_id: int):
+        return await db.get(User, user_id)
 
     @staticmethod
-    def get_all(db: Session) -> List[User]:
-        return db.query(User).all()
+    async def get_page(db: AsyncSession, columns: Sequence[Any], after: Optional[int], limit: int):
+        """
+        Página de usuários por keyset (id > after), apenas com as colunas pedidas.
+        Busca limit + 1 linhas para saber se existe próxima página.
+        """
+        stmt = select(*columns).order_by(User.id).limit(limit + 1)
+        if after is not None:
+            stmt = stmt.where(User.id > after)
+        return (await db.execute(stmt)).all()
 
     @staticmethod
-    def create(db: Session, username: str, email: str, team_favorite: str,hashed_password: str):
+    async def create(db: AsyncSession, username: str, email: str, team_favorite: str,hashed_password: str):
         db_user = User(username=username, email=email, team_favorite=team_favorite,hashed_password=hashed_password)
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
+        return db_user
+
+    @staticmethod
+    async def update_password(db: AsyncSession, db_user: User, hashed_password: str):
+        db_user.hashed_password = hashed_password
+        await db.commit()
         return db_user
 
     @staticmethod
-    def delete(db: Session, user_id: int):
-        db_user = db.query(User).filter(User.id == user_id).first()
+    async def delete(db: AsyncSession, user_id: int):
+        db_user = await db.get(User, user_id)
         if db_user:
-            db.delete(db_user)
-            db.commit()
+            await db.delete(db_user)
+            await db.commit()
             return True
         return False
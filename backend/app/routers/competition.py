@@ -0,0 +1,82 @@
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.http_cache import is_not_modified, not_modified
+from app.core.response_cache import cached_response, json_response
+from app.routers.team import TEAM_MATCHES_CACHE, TEAMS_LIST_CACHE
+from app.schemas.competition import CompetitionsResponse, StandingsResponse
+from app.schemas.team import TeamsListResponse
+from app.services.match_services import MatchService
+from app.services.standings_services import StandingsService
+from app.services.team_services import TeamService
+
+router = APIRouter(prefix="/competitions", tags=["competitions"])
+
+
+@router.get("", response_model=CompetitionsResponse)
+async def list_competitions(db: AsyncSession = Depends(get_db)):
+    """
+    Lista as competições importadas e a quantidade de times de cada uma
+    """
+    return await TeamService().list_competitions(db)
+
+
+@router.get("/{code}/teams", response_model=TeamsListResponse)
+async def get_competition_teams(
+    code: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    refresh: bool = Query(False, description="Ignora o cache local e busca na API externa"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Busca os times de uma competição (BSA, PL, PD, ...).
+    Serve do banco local; competições ainda não importadas são buscadas
+    na API externa e gravadas. Responde 304 quando o If-None-Match
+    corresponde à versão do cache local.
+    """
+    code = code.upper()
+    team_service = TeamService()
+    etag = None if refresh else await team_service.get_competition_etag(db, code, background_tasks)
+    if is_not_modified(request, etag):
+        return not_modified(etag, TEAMS_LIST_CACHE)
+    cached = cached_response(request, etag, TEAMS_LIST_CACHE)
+    if cached is not None:
+        return cached
+
+    result = await team_service.get_competition_teams(
+        db, code, force_refresh=refresh, background_tasks=background_tasks
+    )
+    etag = etag or await team_service.get_competition_etag(db, code)
+    return json_response(request, result, etag, TEAMS_LIST_CACHE)
+
+
+@router.get("/{code}/standings", response_model=StandingsResponse)
+async def get_competition_standings(
+    code: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    season: Optional[int] = Query(None, description="Ano de início da temporada (padrão: atual)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Classificação da competição calculada a partir das partidas gravadas
+    e atualizada a cada partida encerrada que chega no sync.
+    Na primeira consulta as partidas da temporada são buscadas na API externa.
+    """
+    code = code.upper()
+    await MatchService().ensure_competition_synced(db, code, season, background_tasks)
+    season = await StandingsService.resolve_season(db, code, season)
+
+    etag = await StandingsService.get_etag(db, code, season)
+    if is_not_modified(request, etag):
+        return not_modified(etag, TEAM_MATCHES_CACHE)
+    cached = cached_response(request, etag, TEAM_MATCHES_CACHE)
+    if cached is not None:
+        return cached
+
+    result = await StandingsService.get_standings(db, code, season)
+    return json_response(request, result, etag, TEAM_MATCHES_CACHE)
@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from app.services.export_services import MEDIA_TYPES, ExportService
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+ExportFormat = Literal["ndjson", "csv"]
+
+
+def _streaming_response(body, export_format: str, name: str) -> StreamingResponse:
+    headers = {"Cache-Control": "no-store"}
+    if export_format == "csv":
+        headers["Content-Disposition"] = f'attachment; filename="{name}.csv"'
+    return StreamingResponse(body, media_type=MEDIA_TYPES[export_format], headers=headers)
+
+
+@router.get("/teams")
+async def export_teams(
+    since: Optional[datetime] = Query(None, description="Apenas times com updated_at >= since (ISO 8601)"),
+    after: Optional[int] = Query(None, description="Retoma a exportação após este ID externo"),
+    format: ExportFormat = Query("ndjson", description="ndjson ou csv"),
+):
+    """
+    Exporta os times do banco local em streaming, ordenados por ID externo.
+    A memória usada independe da quantidade de linhas.
+    """
+    return _streaming_response(ExportService.stream_teams(since, after, format), format, "teams")
+
+
+@router.get("/matches")
+async def export_matches(
+    since: Optional[datetime] = Query(None, description="Apenas partidas com updated_at >= since (ISO 8601)"),
+    after: Optional[int] = Query(None, description="Retoma a exportação após este ID de partida"),
+    competition: Optional[str] = Query(None, description="Códigos de competição separados por vírgula (ex.: BSA)"),
+    format: ExportFormat = Query("ndjson", description="ndjson ou csv"),
+):
+    """
+    Exporta as partidas do banco local em streaming, ordenadas por ID
+    """
+    competitions = [code.strip().upper() for code in competition.split(",") if code.strip()] if competition else None
+    return _streaming_response(
+        ExportService.stream_matches(since, after, competitions, format), format, "matches"
+    )
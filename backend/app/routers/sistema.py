@@ -1,22 +1,37 @@
-from sqlalchemy import func
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
+from app.core.http_cache import CachePolicy, is_not_modified, not_modified
+from app.core.response_cache import cached_response, json_response
+from app.core.upstream_scheduler import upstream_scheduler
+from app.services.indicadores_services import IndicadoresService
+from app.services.prefetch_services import prefetch_worker
+from app.services.stats_services import MatchStatsService
 from app.services.team_services import TeamService
-from app.models.team import Team
 from datetime import datetime
+from typing import Optional
 
 router = APIRouter(tags=["sistema"])
 
+# O snapshot só muda a cada importação
+INDICADORES_CACHE = CachePolicy(max_age=60, stale_while_revalidate=600)
+
 @router.post("/importar")
-def importar_dados(db: Session = Depends(get_db)):
+async def importar_dados(
+    competitions: Optional[str] = Query(
+        None, description="Códigos separados por vírgula (ex.: BSA,PL,PD). Padrão: FOOTBALL_API_COMPETITIONS"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Força importação de dados frescos da football-data.org para o banco local.
     Use este endpoint para atualizar o cache com dados mais recentes.
+    As competições são buscadas em paralelo, dentro da cota da API.
     """
     try:
         team_service = TeamService()
-        result = team_service.import_fresh_data(db)
+        codes = [code.strip().upper() for code in competitions.split(",") if code.strip()] if competitions else None
+        result = await team_service.import_fresh_data(db, codes)
         return result
         
     except Exception as e:
@@ -27,117 +42,73 @@ def importar_dados(db: Session = Depends(get_db)):
         }
 
 @router.get("/indicadores")
-def obter_indicadores(db: Session = Depends(get_db)):
+async def obter_indicadores(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Retorna indicadores e estatísticas dos times do Brasileirão
-    baseado nos dados importados da football-data.org
+    baseado nos dados importados da football-data.org.
+    Os valores vêm do snapshot recalculado a cada importação.
     """
     try:
-        # Estatísticas básicas
-        total_teams = db.query(Team).count()
-        
-        if total_teams == 0:
-            return {
-                "message": "Nenhum dado encontrado. Execute POST /importar primeiro.",
-                "total_teams": 0,
-                "timestamp": datetime.now().isoformat()
-            }
-        
-        # Agregações de fundação
-        teams_with_founded = db.query(Team).filter(Team.founded.isnot(None)).count()
-        
-        if teams_with_founded > 0:
-            oldest_team_year = db.query(func.min(Team.founded)).filter(Team.founded.isnot(None)).scalar()
-            newest_team_year = db.query(func.max(Team.founded)).filter(Team.founded.isnot(None)).scalar()
-            avg_foundation_year = db.query(func.avg(Team.founded)).filter(Team.founded.isnot(None)).scalar()
-            
-            # Time mais antigo e mais novo (com nomes)
-            oldest_team = db.query(Team).filter(Team.founded == oldest_team_year).first()
-            newest_team = db.query(Team).filter(Team.founded == newest_team_year).first()
-        else:
-            oldest_team_year = newest_team_year = avg_foundation_year = None
-            oldest_team = newest_team = None
-        
-        # Distribuição por década de fundação
-        if teams_with_founded > 0:
-            decades_query = db.query(
-                func.floor(Team.founded / 10) * 10,
-                func.count(Team.id)
-            ).filter(Team.founded.isnot(None)).group_by(
-                func.floor(Team.founded / 10) * 10
-            ).all()
-            
-            decades_distribution = [
-                {
-                    "decada": f"{int(decade)}s",
-                    "quantidade": count,
-                    "percentual": round((count / teams_with_founded) * 100, 1)
-                }
-                for decade, count in decades_query
-            ]
-        else:
-            decades_distribution = []
-                                
-        # Top 5 times mais antigos
-        oldest_teams = db.query(Team).filter(
-            Team.founded.isnot(None)
-        ).order_by(Team.founded.asc()).limit(5).all()
-        
-        oldest_teams_list = [
-            {
-                "nome": team.name,
-                "tla": team.tla,
-                "fundacao": team.founded,
-            }
-            for team in oldest_teams
-        ]
-        
-        # Top 5 times mais novos  
-        newest_teams = db.query(Team).filter(
-            Team.founded.isnot(None)
-        ).order_by(Team.founded.desc()).limit(5).all()
-        
-        newest_teams_list = [
-            {
-                "nome": team.name,
-                "tla": team.tla,
-                "fundacao": team.founded,
-            }
-            for team in newest_teams
-        ]
+        etag = await IndicadoresService.get_etag(db)
+        if is_not_modified(request, etag):
+            return not_modified(etag, INDICADORES_CACHE)
+        cached = cached_response(request, etag, INDICADORES_CACHE)
+        if cached is not None:
+            return cached
+
+        result = await IndicadoresService.obter_indicadores(db)
+        etag = etag or await IndicadoresService.get_etag(db)
+        return json_response(request, result, etag, INDICADORES_CACHE)
         
+    except Exception as e:
         return {
-            "estatisticas_historicas": {
-                "time_mais_antigo": {
-                    "nome": oldest_team.name if oldest_team else None,
-                    "tla": oldest_team.tla if oldest_team else None,
-                    "ano_fundacao": oldest_team_year,
-                } if oldest_team else None,
-                
-                "time_mais_recente": {
-                    "nome": newest_team.name if newest_team else None,
-                    "tla": newest_team.tla if newest_team else None,
-                    "ano_fundacao": newest_team_year,
-                } if newest_team else None,
-                
-                "media_ano_fundacao": round(avg_foundation_year, 1) if avg_foundation_year else None,
-                "periodo_fundacao": f"{oldest_team_year}-{newest_team_year}" if oldest_team_year and newest_team_year else None,
-            },
-            
-            "distribuicao_temporal": {
-                "por_decada": decades_distribution,
-                "times_centenarios": db.query(Team).filter(Team.founded <= 1924).count(),
-                "times_modernos": db.query(Team).filter(Team.founded >= 1990).count()
-            },            
-            "rankings": {
-                "times_mais_antigos": oldest_teams_list,
-                "times_mais_novos": newest_teams_list
-            },
+            "error": "Erro ao calcular indicadores",
+            "detail": str(e),
+            "timestamp": datetime.now().isoformat()
         }
-        
+
+@router.get("/indicadores/partidas")
+async def obter_indicadores_partidas(
+    request: Request,
+    competition: Optional[str] = Query(None, description="Código da competição (ex.: BSA)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retorna os indicadores das partidas encerradas no banco local:
+    médias de gols, mandante/visitante/empate e a classificação
+    (pontos, saldo, jogos sem sofrer gols) de todos os times.
+    """
+    try:
+        competition = competition.strip().upper() if competition else None
+        etag = await MatchStatsService.get_etag(db, "liga", competition)
+        if is_not_modified(request, etag):
+            return not_modified(etag, INDICADORES_CACHE)
+        cached = cached_response(request, etag, INDICADORES_CACHE)
+        if cached is not None:
+            return cached
+
+        result = await MatchStatsService.league(db, competition)
+        return json_response(request, result, etag, INDICADORES_CACHE)
+
     except Exception as e:
         return {
-            "error": "Erro ao calcular indicadores",
+            "error": "Erro ao calcular indicadores de partidas",
             "detail": str(e),
             "timestamp": datetime.now().isoformat()
-        }
\ No newline at end of file
+        }
+
+@router.get("/upstream/status")
+async def status_upstream():
+    """
+    Retorna as métricas do agendador de requisições para a football-data.org
+    (fila, tempo de espera, requisições coalescidas e limites de cota)
+    """
+    return upstream_scheduler.metrics()
+
+@router.get("/prefetch/status")
+async def status_prefetch():
+    """
+    Retorna o estado do worker de prefetch (última execução, próxima
+    execução agendada e resultado do último ciclo)
+    """
+    return await prefetch_worker.status()
\ No newline at end of file
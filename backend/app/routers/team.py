@@ -1,33 +1,197 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import List, Optional
+from app.core.config import settings
 from app.core.database import get_db
-from app.services.team_services import TeamService
-from app.schemas.team import TeamsListResponse, TeamDetails, TeamResponse
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.http_cache import CachePolicy, is_not_modified, not_modified
+from app.core.response_cache import cached_response, json_response
+from app.services.match_services import MatchService
+from app.services.search_services import TeamSearchService
+from app.services.stats_services import MatchStatsService
+from app.services.team_services import BRASILEIRAO, TeamService
+from app.schemas.team import (
+    TeamsListResponse, TeamDetails, TeamResponse, TeamMatchesResponse, TeamPageResponse, TeamSearchResponse,
+    TeamStatsResponse, HeadToHeadResponse
+)
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
+# Cache HTTP: clientes/CDN podem servir a cópia expirada enquanto revalidam
+TEAMS_LIST_CACHE = CachePolicy(max_age=60, stale_while_revalidate=settings.TEAMS_CACHE_TTL_SECONDS)
+TEAM_DETAILS_CACHE = CachePolicy(max_age=300, stale_while_revalidate=settings.TEAM_DETAILS_CACHE_TTL_SECONDS)
+TEAM_MATCHES_CACHE = CachePolicy(max_age=60, stale_while_revalidate=settings.MATCHES_CACHE_TTL_SECONDS)
+
+@router.get("", response_model=TeamPageResponse)
+async def list_teams(
+    after: Optional[int] = Query(None, description="Cursor: next_cursor da página anterior"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Campos separados por vírgula (ex.: id,name,crest)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Lista os times do banco local com paginação por cursor (ID externo)
+    """
+    team_service = TeamService()
+    return await team_service.list_local_teams(db, after=after, limit=limit, fields=fields)
+
 @router.get("/brasileirao", response_model=TeamsListResponse)
-def get_brasileirao_teams(db: Session = Depends(get_db)):
+async def get_brasileirao_teams(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    refresh: bool = Query(False, description="Ignora o cache local e busca na API externa"),
+    db: AsyncSession = Depends(get_db),
+):
     """
-    Busca todos os times do Brasileirão Série A
+    Busca todos os times do Brasileirão Série A.
+    Serve do cache local; se expirado, retorna os dados atuais e revalida em background.
+    Responde 304 quando o If-None-Match corresponde à versão do cache local.
     """
     team_service = TeamService()
-    return team_service.get_brasileirao_teams(db, force_refresh=True)
+    etag = None if refresh else await team_service.get_competition_etag(db, BRASILEIRAO, background_tasks)
+    if is_not_modified(request, etag):
+        return not_modified(etag, TEAMS_LIST_CACHE)
+    cached = cached_response(request, etag, TEAMS_LIST_CACHE)
+    if cached is not None:
+        return cached
+
+    result = await team_service.get_competition_teams(
+        db, BRASILEIRAO, force_refresh=refresh, background_tasks=background_tasks
+    )
+    etag = etag or await team_service.get_competition_etag(db, BRASILEIRAO)
+    return json_response(request, result, etag, TEAMS_LIST_CACHE)
+
+# Declarada antes de /{team_id} para "search" não ser tratado como ID
+@router.get("/search", response_model=TeamSearchResponse)
+async def search_teams(
+    q: str = Query(..., min_length=1, max_length=100, description="Nome, nome curto ou sigla (aceita erros e acentos)"),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Busca aproximada de times do banco local por nome, nome curto e sigla,
+    ordenada por similaridade (ex.: "Sao Paulo" encontra "São Paulo FC")
+    """
+    return await TeamSearchService.search(db, q, limit)
 
 @router.get("/{team_id}", response_model=TeamDetails)
-def get_team_details(team_id: int, db: Session = Depends(get_db)):
+async def get_team_details(
+    team_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
     """
     Busca detalhes de um time específico pelo ID
     """
     team_service = TeamService()
-    return team_service.get_team_details(team_id, db)
+    etag = await team_service.get_team_details_etag(team_id, db, background_tasks)
+    if is_not_modified(request, etag):
+        return not_modified(etag, TEAM_DETAILS_CACHE)
+    cached = cached_response(request, etag, TEAM_DETAILS_CACHE)
+    if cached is not None:
+        return cached
 
+    result = await team_service.get_team_details(team_id, db, background_tasks=background_tasks)
+    etag = etag or await team_service.get_team_details_etag(team_id, db)
+    return json_response(request, result, etag, TEAM_DETAILS_CACHE)
 
-@router.get("/{team_id}/matches")
-def get_team_matches(team_id: int):
+
+@router.get("/{team_id}/matches", response_model=TeamMatchesResponse)
+async def get_team_matches(
+    team_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    date_from: Optional[date] = Query(None, description="Data inicial (AAAA-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="Data final (AAAA-MM-DD)"),
+    status: Optional[str] = Query(None, description="Status separados por vírgula (ex.: FINISHED,SCHEDULED)"),
+    competition: Optional[str] = Query(None, description="Códigos de competição separados por vírgula (ex.: BSA)"),
+    db: AsyncSession = Depends(get_db),
+):
     """
-    Busca as partidas de um time específico
+    Busca as partidas de um time específico a partir do banco local
     """
-    team_service = TeamService()
-    return team_service.get_team_matches(team_id)
+    match_service = MatchService()
+    status_filter = _split_csv(status)
+    competition_filter = _split_csv(competition)
+    filters = (date_from, date_to, status_filter, competition_filter)
+
+    etag = await match_service.get_team_matches_etag(team_id, db, filters, background_tasks)
+    if is_not_modified(request, etag):
+        return not_modified(etag, TEAM_MATCHES_CACHE)
+    cached = cached_response(request, etag, TEAM_MATCHES_CACHE)
+    if cached is not None:
+        return cached
+
+    result = await match_service.get_team_matches(
+        team_id,
+        db,
+        date_from=date_from,
+        date_to=date_to,
+        status_filter=status_filter,
+        competition=competition_filter,
+        background_tasks=background_tasks,
+    )
+    etag = etag or await match_service.get_team_matches_etag(team_id, db, filters)
+    return json_response(request, result, etag, TEAM_MATCHES_CACHE)
+
+
+@router.get("/{team_id}/stats", response_model=TeamStatsResponse)
+async def get_team_stats(
+    team_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    last: int = Query(5, ge=1, le=50, description="Partidas consideradas na forma recente"),
+    competition: Optional[str] = Query(None, description="Códigos de competição separados por vírgula (ex.: BSA)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Estatísticas do time a partir das partidas encerradas: forma recente,
+    gols pró/contra, mandante/visitante e jogos sem sofrer gols
+    """
+    competition_filter = _split_csv(competition)
+    await MatchService().ensure_team_synced(db, team_id, background_tasks)
+
+    etag = await MatchStatsService.get_etag(db, "team", team_id, last, competition_filter)
+    if is_not_modified(request, etag):
+        return not_modified(etag, TEAM_MATCHES_CACHE)
+    cached = cached_response(request, etag, TEAM_MATCHES_CACHE)
+    if cached is not None:
+        return cached
+
+    result = await MatchStatsService.team_stats(db, team_id, last, competition_filter)
+    return json_response(request, result, etag, TEAM_MATCHES_CACHE)
+
+
+@router.get("/{team_id}/head-to-head/{opponent_id}", response_model=HeadToHeadResponse)
+async def get_head_to_head(
+    team_id: int,
+    opponent_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    competition: Optional[str] = Query(None, description="Códigos de competição separados por vírgula (ex.: BSA)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Confrontos diretos entre dois times, do ponto de vista de team_id
+    """
+    competition_filter = _split_csv(competition)
+    await MatchService().ensure_team_synced(db, team_id, background_tasks)
+
+    etag = await MatchStatsService.get_etag(db, "h2h", team_id, opponent_id, competition_filter)
+    if is_not_modified(request, etag):
+        return not_modified(etag, TEAM_MATCHES_CACHE)
+    cached = cached_response(request, etag, TEAM_MATCHES_CACHE)
+    if cached is not None:
+        return cached
+
+    result = await MatchStatsService.head_to_head(db, team_id, opponent_id, competition_filter)
+    return json_response(request, result, etag, TEAM_MATCHES_CACHE)
+
+
+def _split_csv(value: Optional[str]) -> Optional[List[str]]:
+    """Converte "A,B" em ["A", "B"] (filtros de query string)"""
+    if not value:
+        return None
+    return [item.strip().upper() for item in value.split(",") if item.strip()]
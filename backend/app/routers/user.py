@@ -1,31 +1,36 @@
 from app.core.database import get_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.core.security import get_current_user
-from app.models.user import User
-from app.schemas.user import UserCreate, UserLogin, UserResponse, UserDeleteResponse
+from app.schemas.user import UserCreate, UserLogin, UserResponse, UserDeleteResponse, UserPageResponse
 from app.schemas.auth import Token
 from app.services.user_services import UserService
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 @router.post("/signup", response_model=UserResponse)
-def signup(user: UserCreate, db: Session = Depends(get_db)):
-    return UserService.register_user(user, db)
+async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)):
+    return await UserService.register_user(user, db)
 
 @router.post("/login", response_model=Token)
-def login(user: UserLogin, db: Session = Depends(get_db)):
-    return UserService.authenticate_user(user, db)
+async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
+    return await UserService.authenticate_user(user, db)
 
 @router.get("/me", response_model=UserResponse)
-def read_users_me(current_user: User = Depends(get_current_user)):
+async def read_users_me(current_user: UserResponse = Depends(get_current_user)):
     return current_user
   
-@router.get("/all", response_model=List[UserResponse])
-def read_users(db: Session = Depends(get_db)):
-    return UserService.get_all_users(db)
+@router.get("/all", response_model=UserPageResponse)
+async def read_users(
+    after: Optional[int] = Query(None, description="Cursor: next_cursor da página anterior"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Campos separados por vírgula (ex.: id,username)"),
+    db: AsyncSession = Depends(get_db),
+):
+    return await UserService.list_users(db, after, limit, fields)
 
 @router.delete("/{user_id}", response_model=UserDeleteResponse, status_code=status.HTTP_200_OK)
-def delete_user(user_id: int, db: Session = Depends(get_db)):
-    return UserService.delete_user(user_id, db)
\ No newline at end of file
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
+    return await UserService.delete_user(user_id, db)
\ No newline at end of file
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.schemas.team import Competition
+
+
+class CompetitionSummary(Competition):
+    teams: int  # Times vinculados no banco local
+    synced_at: Optional[datetime] = None  # Última importação da lista de times
+
+
+class CompetitionsResponse(BaseModel):
+    count: int
+    competitions: List[CompetitionSummary]
+
+
+class StandingRow(BaseModel):
+    position: int
+    team: Dict[str, Any]  # id, name, shortName, tla, crest
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    goals_for: int
+    goals_against: int
+    goal_difference: int
+    points: int
+
+
+class StandingsResponse(BaseModel):
+    competition: str
+    season: int  # Ano de início da temporada
+    count: int
+    updated_at: Optional[datetime] = None
+    standings: List[StandingRow]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -83,6 +83,7 @@ class Match(BaseModel):
     group: Optional[str] = None
     last_updated: str = Field(alias="lastUpdated")
     competition: Competition
+    season: Optional[dict] = None
     home_team: HomeTeam = Field(alias="homeTeam")
     away_team: AwayTeam = Field(alias="awayTeam")
     score: Score
@@ -101,3 +102,75 @@ class TeamMatchesResponse(BaseModel):
     count: int
     filters: dict
     matches: List[Match]
+
+
+class TeamSearchResult(TeamBase):
+    score: float  # Similaridade com a busca (0 a 1)
+
+
+class TeamSearchResponse(BaseModel):
+    query: str
+    count: int
+    results: List[TeamSearchResult]
+
+
+class StatsSummary(BaseModel):
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    goals_for: int
+    goals_against: int
+    goal_difference: int
+    clean_sheets: int  # Jogos sem sofrer gols
+    points: int
+
+
+class TeamForm(StatsSummary):
+    results: str  # W/D/L da partida mais antiga para a mais recente
+
+
+class TeamStatsResponse(BaseModel):
+    team_id: int
+    competitions: List[str]
+    overall: StatsSummary
+    home: StatsSummary
+    away: StatsSummary
+    form: TeamForm
+    last_match_date: Optional[str] = None
+
+
+class StatsTeam(BaseModel):
+    id: int
+    name: Optional[str] = None
+    tla: Optional[str] = None
+
+
+class HeadToHeadMatch(BaseModel):
+    id: int
+    utc_date: str
+    competition: Optional[str] = None
+    home_team_id: int
+    away_team_id: int
+    home_goals: int
+    away_goals: int
+
+
+class HeadToHeadResponse(BaseModel):
+    team: StatsTeam
+    opponent: StatsTeam
+    competitions: List[str]
+    played: int
+    wins: int  # Vitórias de team
+    draws: int
+    losses: int
+    goals_for: int
+    goals_against: int
+    matches: List[HeadToHeadMatch]  # Da mais recente para a mais antiga
+
+
+class TeamPageResponse(BaseModel):
+    items: List[Dict[str, Any]]
+    count: int
+    limit: int
+    next_cursor: Optional[int] = None
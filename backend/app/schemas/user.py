@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, EmailStr
-from typing import List
+from typing import Any, Dict, List, Optional
 
 
 class UserCreate(BaseModel):
@@ -24,4 +24,10 @@ class UserDeleteResponse(BaseModel):
     message: str
 
 class UserListResponse(BaseModel):
-    users: List[UserResponse]
\ No newline at end of file
+    users: List[UserResponse]
+
+class UserPageResponse(BaseModel):
+    items: List[Dict[str, Any]]
+    count: int
+    limit: int
+    next_cursor: Optional[int] = None
@@ -0,0 +1,121 @@
+import csv
+import io
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.match import MatchRepository
+from app.repositories.team import TeamRepository
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+TEAM_CSV_FIELDS = [
+    "id", "name", "short_name", "tla", "crest", "area", "founded",
+    "club_colors", "venue", "website", "updated_at",
+]
+
+MATCH_CSV_FIELDS = [
+    "id", "utc_date", "status", "matchday", "stage", "group", "competition_code",
+    "home_team_id", "home_team_name", "away_team_id", "away_team_name",
+    "winner", "home_score", "away_score", "last_updated", "updated_at",
+]
+
+
+class ExportService:
+    """
+    Exportações em streaming (NDJSON ou CSV) lidas de um cursor no servidor.
+    As linhas saem ordenadas pela chave (id); para retomar uma exportação
+    interrompida, basta repetir a chamada com after=<último id recebido>.
+    """
+
+    @staticmethod
+    def stream_teams(
+        since: Optional[datetime] = None,
+        after: Optional[int] = None,
+        export_format: str = "ndjson",
+    ) -> AsyncIterator[bytes]:
+        since = ExportService._naive_utc(since)
+        return ExportService._stream(
+            lambda db: TeamRepository.stream_export(db, since, after, settings.EXPORT_BATCH_SIZE),
+            export_format,
+            TEAM_CSV_FIELDS,
+            lambda row: row,
+        )
+
+    @staticmethod
+    def stream_matches(
+        since: Optional[datetime] = None,
+        after: Optional[int] = None,
+        competition: Optional[List[str]] = None,
+        export_format: str = "ndjson",
+    ) -> AsyncIterator[bytes]:
+        since = ExportService._naive_utc(since)
+        return ExportService._stream(
+            lambda db: MatchRepository.stream_export(db, since, after, competition, settings.EXPORT_BATCH_SIZE),
+            export_format,
+            MATCH_CSV_FIELDS,
+            ExportService._match_csv_row,
+        )
+
+    @staticmethod
+    async def _stream(
+        open_cursor: Callable[[AsyncSession], Awaitable[AsyncResult]],
+        export_format: str,
+        csv_fields: List[str],
+        to_csv_row: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> AsyncIterator[bytes]:
+        """
+        Converte cada lote do cursor em um chunk da resposta. A sessão é
+        própria da exportação, já que o corpo é enviado depois do handler retornar.
+        """
+        async with SessionLocal() as db:
+            result = await open_cursor(db)
+
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=csv_fields, extrasaction="ignore")
+                writer.writeheader()
+                async for rows in result.partitions():
+                    writer.writerows(to_csv_row(dict(row._mapping)) for row in rows)
+                    yield buffer.getvalue().encode()
+                    buffer.seek(0)
+                    buffer.truncate()
+                # Cabeçalho ainda não enviado quando não há linhas
+                if buffer.tell():
+                    yield buffer.getvalue().encode()
+                return
+
+            async for rows in result.partitions():
+                yield b"".join(orjson.dumps(dict(row._mapping)) + b"\n" for row in rows)
+
+    @staticmethod
+    def _match_csv_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Achata times e placar da partida em colunas"""
+        home_team = row.pop("home_team") or {}
+        away_team = row.pop("away_team") or {}
+        score = row.pop("score") or {}
+        full_time = score.get("fullTime") or {}
+        return {
+            **row,
+            "home_team_id": home_team.get("id"),
+            "home_team_name": home_team.get("name"),
+            "away_team_id": away_team.get("id"),
+            "away_team_name": away_team.get("name"),
+            "winner": score.get("winner"),
+            "home_score": full_time.get("home"),
+            "away_score": full_time.get("away"),
+        }
+
+    @staticmethod
+    def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+        """As datas do banco são UTC sem timezone"""
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.http_cache import make_etag
+from app.models.indicadores import IndicadoresSnapshot
+from app.repositories.indicadores import IndicadoresRepository
+from app.repositories.team import TeamRepository
+
+
+class IndicadoresService:
+    @staticmethod
+    async def obter_indicadores(db: AsyncSession) -> Dict[str, Any]:
+        """
+        Retorna o snapshot pré-calculado (leitura por chave primária).
+        O snapshot só é calculado aqui se ainda não existir.
+        """
+        snapshot = await IndicadoresRepository.get_snapshot(db)
+        if snapshot is None:
+            snapshot = await IndicadoresService.rebuild_snapshot(db)
+
+        return {
+            **snapshot.payload,
+            "snapshot": {
+                "versao": snapshot.version,
+                "gerado_em": snapshot.generated_at.isoformat(),
+            },
+        }
+
+    @staticmethod
+    async def get_etag(db: AsyncSession) -> Optional[str]:
+        """ETag dos indicadores a partir da versão do snapshot (None se ainda não existe)"""
+        version = await IndicadoresRepository.get_version(db)
+        if version is None:
+            return None
+        return make_etag("indicadores", version.version, version.generated_at)
+
+    @staticmethod
+    async def rebuild_snapshot(db: AsyncSession) -> IndicadoresSnapshot:
+        """
+        Recalcula os indicadores e persiste o snapshot.
+        Chamado ao fim de toda escrita na tabela teams.
+        """
+        payload = await IndicadoresService.calcular_indicadores(db)
+        return await IndicadoresRepository.save_snapshot(db, payload)
+
+    @staticmethod
+    async def calcular_indicadores(db: AsyncSession) -> Dict[str, Any]:
+        """
+        Calcula os indicadores dos times com um número fixo de queries
+        (resumo, rankings e distribuição por década)
+        """
+        resumo = await TeamRepository.get_foundation_summary(db)
+
+        if resumo.total_teams == 0:
+            return {
+                "message": "Nenhum dado encontrado. Execute POST /importar primeiro.",
+                "total_teams": 0,
+                "timestamp": datetime.now().isoformat()
+            }
+
+        oldest_team_year = resumo.oldest_year
+        newest_team_year = resumo.newest_year
+        avg_foundation_year = resumo.avg_year
+
+        if resumo.teams_with_founded > 0:
+            rankings = await TeamRepository.get_foundation_rankings(db, limit=5)
+            decades = await TeamRepository.get_foundation_decades(db)
+        else:
+            rankings = []
+            decades = []
+
+        oldest_teams = sorted(
+            (row for row in rankings if row.rank_oldest <= 5), key=lambda row: row.rank_oldest
+        )
+        newest_teams = sorted(
+            (row for row in rankings if row.rank_newest <= 5), key=lambda row: row.rank_newest
+        )
+        oldest_team = oldest_teams[0] if oldest_teams else None
+        newest_team = newest_teams[0] if newest_teams else None
+
+        decades_distribution = [
+            {
+                "decada": f"{int(row.decade)}s",
+                "quantidade": row.quantidade,
+                "percentual": round((row.quantidade / resumo.teams_with_founded) * 100, 1)
+            }
+            for row in decades
+        ]
+
+        return {
+            "estatisticas_historicas": {
+                "time_mais_antigo": {
+                    "nome": oldest_team.name,
+                    "tla": oldest_team.tla,
+                    "ano_fundacao": oldest_team_year,
+                } if oldest_team else None,
+
+                "time_mais_recente": {
+                    "nome": newest_team.name,
+                    "tla": newest_team.tla,
+                    "ano_fundacao": newest_team_year,
+                } if newest_team else None,
+
+                "media_ano_fundacao": round(float(avg_foundation_year), 1) if avg_foundation_year else None,
+                "periodo_fundacao": f"{oldest_team_year}-{newest_team_year}" if oldest_team_year and newest_team_year else None,
+            },
+
+            "distribuicao_temporal": {
+                "por_decada": decades_distribution,
+                "times_centenarios": resumo.centenarios or 0,
+                "times_modernos": resumo.modernos or 0
+            },
+            "rankings": {
+                "times_mais_antigos": IndicadoresService._format_ranking(oldest_teams),
+                "times_mais_novos": IndicadoresService._format_ranking(newest_teams)
+            },
+        }
+
+    @staticmethod
+    def _format_ranking(rows) -> list:
+        """Formata as linhas de ranking no formato da resposta"""
+        return [
+            {
+                "nome": row.name,
+                "tla": row.tla,
+                "fundacao": row.founded,
+            }
+            for row in rows
+        ]
@@ -0,0 +1,260 @@
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, List, Optional, Tuple
+
+from fastapi import BackgroundTasks, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.http_cache import make_etag
+from app.core.metrics import record_cache
+from app.core.upstream_scheduler import Priority
+from app.models.match import Match
+from app.repositories.match import MatchRepository
+from app.repositories.sync_state import SyncStateRepository
+from app.repositories.team import TeamRepository
+from app.schemas.team import Match as MatchSchema, TeamMatchesResponse
+
+logger = logging.getLogger(__name__)
+
+
+class MatchService:
+    # Times com sync de partidas em andamento neste processo
+    _sync_lock = threading.Lock()
+    _syncing_teams = set()
+    _syncing_competitions = set()
+
+    def __init__(self):
+        self.team_repository = TeamRepository()
+
+    async def get_team_matches(
+        self,
+        team_id: int,
+        db: AsyncSession,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        status_filter: Optional[List[str]] = None,
+        competition: Optional[List[str]] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> TeamMatchesResponse:
+        """
+        Busca partidas de um time a partir do banco local.
+        Na primeira consulta sincroniza com a API externa; depois do TTL
+        a sincronização incremental roda em background.
+        """
+        try:
+            await self.ensure_team_synced(db, team_id, background_tasks)
+
+            matches = await MatchRepository.get_team_matches(
+                db, team_id, date_from, date_to, status_filter, competition
+            )
+
+            filters = {
+                key: value for key, value in {
+                    "dateFrom": date_from.isoformat() if date_from else None,
+                    "dateTo": date_to.isoformat() if date_to else None,
+                    "status": ",".join(status_filter) if status_filter else None,
+                    "competitions": ",".join(competition) if competition else None,
+                }.items() if value
+            }
+            return TeamMatchesResponse(
+                count=len(matches),
+                filters=filters,
+                matches=[self._to_schema(match) for match in matches]
+            )
+        except Exception as e:
+            if isinstance(e, HTTPException):
+                raise e
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error fetching team matches: {str(e)}"
+            )
+
+    async def get_team_matches_etag(
+        self,
+        team_id: int,
+        db: AsyncSession,
+        filters: Tuple[Any, ...] = (),
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Optional[str]:
+        """
+        ETag das partidas do time (versão das partidas gravadas + filtros).
+        Retorna None quando o time ainda não foi sincronizado; sync expirado
+        é agendado em background como em get_team_matches.
+        """
+        synced_at = await SyncStateRepository.get_synced_at(db, self.sync_key(team_id))
+        if synced_at is None:
+            return None
+        if self.is_stale(synced_at):
+            if background_tasks is None:
+                return None
+            self._schedule_background_sync(team_id, background_tasks)
+
+        version = await MatchRepository.get_team_version(db, team_id)
+        return make_etag("matches", team_id, version.total, version.newest_update, *filters)
+
+    async def ensure_team_synced(
+        self,
+        db: AsyncSession,
+        team_id: int,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> None:
+        """
+        Garante que as partidas do time existem no banco local: sincroniza
+        na primeira consulta e, depois do TTL, revalida em background
+        """
+        synced_at = await SyncStateRepository.get_synced_at(db, self.sync_key(team_id))
+
+        if synced_at is None:
+            record_cache("matches", "miss")
+            await self.sync_team_matches(db, team_id)
+        elif self.is_stale(synced_at):
+            record_cache("matches", "stale")
+            if background_tasks is not None:
+                self._schedule_background_sync(team_id, background_tasks)
+            else:
+                await self.sync_team_matches(db, team_id)
+        else:
+            record_cache("matches", "hit")
+
+    async def sync_team_matches(self, db: AsyncSession, team_id: int, priority: Priority = Priority.USER) -> int:
+        """
+        Sincroniza as partidas de um time com a API externa, gravando apenas
+        as partidas com lastUpdated mais recente. Retorna a quantidade gravada.
+        """
+        data = await self.team_repository.get_team_matches(team_id, priority=priority)
+        payload = TeamMatchesResponse(**data)
+
+        saved = await MatchRepository.upsert_newer(db, payload.matches)
+        await SyncStateRepository.mark_synced(db, self.sync_key(team_id))
+        return saved
+
+    async def ensure_competition_synced(
+        self,
+        db: AsyncSession,
+        competition_code: str,
+        season: Optional[int] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> None:
+        """Como ensure_team_synced, para todas as partidas de uma temporada da competição"""
+        try:
+            key = self.competition_sync_key(competition_code, season)
+            synced_at = await SyncStateRepository.get_synced_at(db, key)
+
+            if synced_at is None:
+                record_cache("matches", "miss")
+                await self.sync_competition_matches(db, competition_code, season)
+            elif self.is_stale(synced_at):
+                record_cache("matches", "stale")
+                if background_tasks is not None:
+                    self._schedule_background_competition_sync(competition_code, season, background_tasks)
+                else:
+                    await self.sync_competition_matches(db, competition_code, season)
+            else:
+                record_cache("matches", "hit")
+        except Exception as e:
+            if isinstance(e, HTTPException):
+                raise e
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error syncing competition matches: {str(e)}"
+            )
+
+    async def sync_competition_matches(
+        self,
+        db: AsyncSession,
+        competition_code: str,
+        season: Optional[int] = None,
+        priority: Priority = Priority.USER,
+    ) -> int:
+        """
+        Sincroniza a temporada inteira da competição com uma única requisição
+        à API externa. Retorna a quantidade de partidas gravadas.
+        """
+        data = await self.team_repository.get_competition_matches(competition_code, season, priority=priority)
+        matches = [MatchSchema(**match) for match in data.get("matches", [])]
+
+        saved = await MatchRepository.upsert_newer(db, matches)
+        await SyncStateRepository.mark_synced(db, self.competition_sync_key(competition_code, season))
+        return saved
+
+    @staticmethod
+    def competition_sync_key(competition_code: str, season: Optional[int] = None) -> str:
+        """Chave do sync de partidas da competição (temporada atual quando season é None)"""
+        return f"matches:competition:{competition_code}:{season or 'atual'}"
+
+    @staticmethod
+    def sync_key(team_id: int) -> str:
+        """Chave do sync de partidas do time na tabela sync_state"""
+        return f"matches:team:{team_id}"
+
+    @staticmethod
+    def is_stale(synced_at: datetime) -> bool:
+        """Verifica se o último sync passou do TTL configurado"""
+        ttl = timedelta(seconds=settings.MATCHES_CACHE_TTL_SECONDS)
+        return datetime.utcnow() - synced_at > ttl
+
+    @classmethod
+    def _schedule_background_sync(cls, team_id: int, background_tasks: BackgroundTasks) -> None:
+        """Agenda o sync do time, evitando syncs duplicados em paralelo"""
+        with cls._sync_lock:
+            if team_id in cls._syncing_teams:
+                return
+            cls._syncing_teams.add(team_id)
+        background_tasks.add_task(cls._background_sync, team_id)
+
+    @classmethod
+    async def _background_sync(cls, team_id: int) -> None:
+        """Sincroniza as partidas do time usando uma sessão própria do banco"""
+        try:
+            async with SessionLocal() as db:
+                await cls().sync_team_matches(db, team_id, priority=Priority.BACKGROUND)
+        except Exception:
+            logger.exception("Falha ao sincronizar partidas do time %s em background", team_id)
+        finally:
+            with cls._sync_lock:
+                cls._syncing_teams.discard(team_id)
+
+    @classmethod
+    def _schedule_background_competition_sync(
+        cls, competition_code: str, season: Optional[int], background_tasks: BackgroundTasks
+    ) -> None:
+        """Agenda o sync da competição, evitando syncs duplicados em paralelo"""
+        key = (competition_code, season)
+        with cls._sync_lock:
+            if key in cls._syncing_competitions:
+                return
+            cls._syncing_competitions.add(key)
+        background_tasks.add_task(cls._background_competition_sync, competition_code, season)
+
+    @classmethod
+    async def _background_competition_sync(cls, competition_code: str, season: Optional[int]) -> None:
+        """Sincroniza as partidas da competição usando uma sessão própria do banco"""
+        try:
+            async with SessionLocal() as db:
+                await cls().sync_competition_matches(db, competition_code, season, priority=Priority.BACKGROUND)
+        except Exception:
+            logger.exception("Falha ao sincronizar partidas da competição %s em background", competition_code)
+        finally:
+            with cls._sync_lock:
+                cls._syncing_competitions.discard((competition_code, season))
+
+    @staticmethod
+    def _to_schema(match: Match) -> MatchSchema:
+        """Converte a partida do banco local para o formato da API"""
+        return MatchSchema(
+            id=match.id,
+            utc_date=match.utc_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            status=match.status,
+            matchday=match.matchday,
+            stage=match.stage,
+            group=match.group,
+            last_updated=match.last_updated.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            competition=match.competition,
+            season=match.season,
+            home_team=match.home_team,
+            away_team=match.away_team,
+            score=match.score,
+        )
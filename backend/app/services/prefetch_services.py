@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.upstream_scheduler import Priority
+from app.repositories.competition import CompetitionRepository
+from app.repositories.sync_state import SyncStateRepository
+from app.repositories.team import TeamRepository
+from app.services.match_services import MatchService
+from app.services.team_services import TeamService
+
+logger = logging.getLogger(__name__)
+
+# Chave da última execução na tabela sync_state (compartilhada entre processos)
+PREFETCH_RUN_KEY = "prefetch:run"
+
+
+class PrefetchWorker:
+    """
+    Atualiza periodicamente os times das competições configuradas
+    (FOOTBALL_API_COMPETITIONS) e, para cada time, os
+    detalhes e as partidas, sempre com prioridade BACKGROUND no agendador
+    da API externa. Itens ainda dentro do TTL não são buscados novamente.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._next_run_at: Optional[datetime] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+
+    def start(self) -> None:
+        """Inicia o loop do worker (startup da aplicação)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Interrompe o loop do worker (shutdown da aplicação)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._next_run_at = None
+
+    async def status(self) -> Dict[str, Any]:
+        """Estado atual do worker e resultado da última execução"""
+        async with SessionLocal() as db:
+            last_run_at = await SyncStateRepository.get_synced_at(db, PREFETCH_RUN_KEY)
+
+        return {
+            "enabled": settings.PREFETCH_ENABLED,
+            "active": self._task is not None and not self._task.done(),
+            "running": self._running,
+            "interval_seconds": settings.PREFETCH_INTERVAL_SECONDS,
+            "jitter_seconds": settings.PREFETCH_JITTER_SECONDS,
+            "last_run_at": last_run_at.isoformat() if last_run_at else None,
+            "next_run_at": self._next_run_at.isoformat() if self._next_run_at else None,
+            "last_result": self._last_result,
+        }
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                delay = await self._seconds_until_next_run()
+            except Exception:
+                # Banco indisponível (ainda subindo, conexão caiu): o worker não pode morrer aqui
+                logger.exception("Falha ao calcular a próxima execução do prefetch")
+                delay = settings.PREFETCH_INTERVAL_SECONDS + random.uniform(0, settings.PREFETCH_JITTER_SECONDS)
+            self._next_run_at = datetime.utcnow() + timedelta(seconds=delay)
+            await asyncio.sleep(delay)
+            self._next_run_at = None
+
+            try:
+                if await self._claim_run():
+                    await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Falha na execução do prefetch")
+
+    async def _seconds_until_next_run(self) -> float:
+        """
+        Calcula a espera até a próxima execução a partir da última execução
+        persistida, para que um restart não provoque um refetch completo
+        """
+        async with SessionLocal() as db:
+            last_run_at = await SyncStateRepository.get_synced_at(db, PREFETCH_RUN_KEY)
+
+        jitter = random.uniform(0, settings.PREFETCH_JITTER_SECONDS)
+        if last_run_at is None:
+            return jitter
+
+        due_at = last_run_at + timedelta(seconds=settings.PREFETCH_INTERVAL_SECONDS)
+        return max(0.0, (due_at - datetime.utcnow()).total_seconds()) + jitter
+
+    async def _claim_run(self) -> bool:
+        """Garante uma única execução por intervalo entre todos os processos"""
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.PREFETCH_INTERVAL_SECONDS)
+        async with SessionLocal() as db:
+            return await SyncStateRepository.try_claim(db, PREFETCH_RUN_KEY, stale_before)
+
+    async def run_once(self) -> Dict[str, Any]:
+        """Executa um ciclo completo de prefetch"""
+        self._running = True
+        started_at = datetime.utcnow()
+        result = {
+            "started_at": started_at.isoformat(),
+            "teams_refreshed": False,
+            "details_refreshed": 0,
+            "matches_synced": 0,
+            "errors": 0,
+        }
+
+        team_service = TeamService()
+        match_service = MatchService()
+        try:
+            async with SessionLocal() as db:
+                for code in settings.FOOTBALL_API_COMPETITIONS:
+                    competition = await CompetitionRepository.get_by_code(db, code)
+                    if competition is None or TeamService.is_competition_stale(competition):
+                        await team_service.refresh_from_api(db, code, priority=Priority.BACKGROUND)
+                        result["teams_refreshed"] = True
+                local_teams = await TeamRepository.get_all_local(db)
+
+                for external_id in [team.external_id for team in local_teams]:
+                    try:
+                        _, detail = await TeamRepository.get_with_details(db, external_id)
+                        if detail is None or TeamService.is_details_stale(detail):
+                            await team_service.refresh_team_details(
+                                db, external_id, detail, priority=Priority.BACKGROUND
+                            )
+                            result["details_refreshed"] += 1
+
+                        synced_at = await SyncStateRepository.get_synced_at(
+                            db, MatchService.sync_key(external_id)
+                        )
+                        if synced_at is None or MatchService.is_stale(synced_at):
+                            await match_service.sync_team_matches(db, external_id, priority=Priority.BACKGROUND)
+                            result["matches_synced"] += 1
+                    except Exception:
+                        result["errors"] += 1
+                        logger.exception("Falha no prefetch do time %s", external_id)
+        except Exception:
+            result["errors"] += 1
+            raise
+        finally:
+            self._running = False
+            result["finished_at"] = datetime.utcnow().isoformat()
+            result["duration_seconds"] = round((datetime.utcnow() - started_at).total_seconds(), 1)
+            self._last_result = result
+
+        return result
+
+
+prefetch_worker = PrefetchWorker()
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from typing import Any, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.search_index import TrigramIndex
+from app.repositories.indicadores import IndicadoresRepository
+from app.repositories.team import TeamRepository
+from app.schemas.team import TeamSearchResponse, TeamSearchResult
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIELDS = ("name", "short_name", "tla")
+
+
+class TeamSearchService:
+    """
+    Busca aproximada de times (erros de digitação e acentos).
+
+    No Postgres com o índice GIN de trigramas (criado pela migração inicial
+    quando pg_trgm/unaccent estão disponíveis) a busca roda no banco. Nos
+    demais casos (SQLite, ou sem as extensões) usa um índice em memória, refeito
+    quando a versão do snapshot de indicadores muda: toda escrita na tabela
+    teams reconstrói o snapshot, então cada worker percebe uma importação
+    com uma leitura por chave primária.
+    """
+
+    # None: ainda não verificado (a verificação ocorre na primeira busca, não no startup)
+    use_trigram: Optional[bool] = None
+    _index: Optional[TrigramIndex] = None
+    _index_version: Optional[Tuple[Any, ...]] = None
+    _index_lock: Optional[asyncio.Lock] = None
+    _lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    async def _detect_trigram(cls, db: AsyncSession) -> bool:
+        """Usa o índice do Postgres se a migração conseguiu criá-lo"""
+        if cls.use_trigram is None:
+            cls.use_trigram = (
+                db.get_bind().dialect.name == "postgresql" and await TeamRepository.has_trigram_search(db)
+            )
+            if not cls.use_trigram:
+                logger.info("Busca de times usando o índice de trigramas em memória")
+        return cls.use_trigram
+
+    @classmethod
+    async def search(cls, db: AsyncSession, query: str, limit: int) -> TeamSearchResponse:
+        min_score = settings.TEAM_SEARCH_MIN_SCORE
+        if await cls._detect_trigram(db):
+            rows = await TeamRepository.search_trigram(db, query, limit, min_score)
+            results = [
+                TeamSearchResult(**{**row._mapping, "score": round(row.score, 4)}) for row in rows
+            ]
+        else:
+            index = await cls._current_index(db)
+            results = [
+                TeamSearchResult(**document, score=score)
+                for score, document in index.search(query, limit, min_score)
+            ]
+        return TeamSearchResponse(query=query, count=len(results), results=results)
+
+    @classmethod
+    async def refresh(cls, db: AsyncSession) -> None:
+        """Refaz o índice em memória se os times mudaram (chamado após importações)"""
+        if not await cls._detect_trigram(db):
+            await cls._current_index(db)
+
+    @classmethod
+    async def _current_index(cls, db: AsyncSession) -> TrigramIndex:
+        version = await IndicadoresRepository.get_version(db)
+        version_key = tuple(version) if version is not None else None
+        if cls._index is not None and cls._index_version == version_key:
+            return cls._index
+
+        loop = asyncio.get_running_loop()
+        if cls._index_lock is None or cls._lock_loop is not loop:
+            cls._index_lock, cls._lock_loop = asyncio.Lock(), loop
+        async with cls._index_lock:
+            # Outra requisição pode ter refeito o índice enquanto esta aguardava
+            if cls._index is None or cls._index_version != version_key:
+                documents = await TeamRepository.get_search_documents(db)
+                # Montar o índice é CPU puro: roda fora do event loop
+                cls._index = await asyncio.to_thread(TrigramIndex, documents, SEARCH_FIELDS)
+                cls._index_version = version_key
+            return cls._index
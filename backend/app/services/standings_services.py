@@ -0,0 +1,98 @@
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.http_cache import make_etag
+from app.repositories.standings import COUNTERS, StandingsRepository
+from app.schemas.competition import StandingRow, StandingsResponse
+
+
+class StandingsService:
+    """
+    Classificação das competições a partir das partidas gravadas.
+
+    A tabela standings é mantida de forma incremental por
+    MatchRepository.upsert_newer: cada partida gravada desconta o resultado
+    aplicado antes e soma o atual. verify() recalcula tudo do zero para
+    conferir o resultado incremental (rebuild_standings.py).
+    """
+
+    @staticmethod
+    async def resolve_season(db: AsyncSession, competition_code: str, season: Optional[int]) -> int:
+        """Temporada pedida ou a mais recente com classificação no banco local"""
+        if season is None:
+            season = await StandingsRepository.get_latest_season(db, competition_code)
+        if season is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No standings for competition {competition_code}"
+            )
+        return season
+
+    @staticmethod
+    async def get_etag(db: AsyncSession, competition_code: str, season: int) -> str:
+        version = await StandingsRepository.get_version(db, competition_code, season)
+        return make_etag("standings", competition_code, season, version.total, version.newest_update)
+
+    @staticmethod
+    async def get_standings(db: AsyncSession, competition_code: str, season: int) -> StandingsResponse:
+        rows = await StandingsRepository.get_table(db, competition_code, season)
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No standings for competition {competition_code} in season {season}"
+            )
+        return StandingsResponse(
+            competition=competition_code,
+            season=season,
+            count=len(rows),
+            updated_at=max(row.updated_at for row in rows),
+            standings=[
+                StandingRow(
+                    position=position,
+                    team=row.team,
+                    **{column: getattr(row, column) for column in COUNTERS},
+                    goal_difference=row.goals_for - row.goals_against,
+                )
+                for position, row in enumerate(rows, start=1)
+            ],
+        )
+
+    @staticmethod
+    async def verify(db: AsyncSession, fix: bool = False) -> Dict[str, Any]:
+        """
+        Recalcula a classificação do zero e compara com a mantida de forma
+        incremental. Com fix=True, substitui a tabela pelo recálculo.
+        """
+        expected_totals, expected_results = await StandingsRepository.compute_full(db)
+        current_totals, current_results = await StandingsRepository.get_all(db)
+
+        wrong_rows = sorted(
+            key for key in expected_totals.keys() | current_totals.keys()
+            if expected_totals.get(key) != current_totals.get(key)
+        )
+        wrong_matches = sorted(
+            match_id for match_id in expected_results.keys() | current_results.keys()
+            if expected_results.get(match_id) != current_results.get(match_id)
+        )
+        report = {
+            "linhas": len(expected_totals),
+            "partidas": len(expected_results),
+            "linhas_divergentes": [
+                {
+                    "competicao": code,
+                    "temporada": season,
+                    "time": team_id,
+                    "esperado": expected_totals.get((code, season, team_id)),
+                    "atual": current_totals.get((code, season, team_id)),
+                }
+                for code, season, team_id in wrong_rows
+            ],
+            "partidas_divergentes": wrong_matches,
+            "corrigido": False,
+        }
+        if fix and (wrong_rows or wrong_matches):
+            await StandingsRepository.replace_all(db, expected_results)
+            report["corrigido"] = True
+        return report
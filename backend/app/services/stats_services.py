@@ -0,0 +1,109 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.http_cache import make_etag
+from app.repositories.match import MatchRepository
+from app.schemas.team import HeadToHeadResponse, TeamStatsResponse
+
+if TYPE_CHECKING:
+    from app.core.match_stats import MatchStatsTable
+
+
+class MatchStatsService:
+    """
+    Estatísticas de partidas (forma, gols, mandante/visitante, jogos sem
+    sofrer gols, confrontos diretos e tabela da liga).
+
+    As partidas encerradas do banco local viram uma tabela colunar NumPy
+    montada uma vez por versão das partidas (quantidade + última gravação);
+    toda gravação de partidas muda essa versão. As respostas usam a mesma
+    versão no ETag, então o cache de respostas serve leituras repetidas sem
+    recalcular nada.
+    """
+
+    _table: Optional["MatchStatsTable"] = None
+    _table_version: Optional[Tuple[Any, ...]] = None
+    _table_lock: Optional[asyncio.Lock] = None
+    _lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    async def get_etag(db: AsyncSession, *parts: Any) -> str:
+        """ETag das estatísticas: versão das partidas + parâmetros da consulta"""
+        version = await MatchRepository.get_version(db)
+        return make_etag("stats", version.total, version.newest_update, *parts)
+
+    @classmethod
+    async def team_stats(
+        cls, db: AsyncSession, team_id: int, last: int, competitions: Optional[List[str]] = None
+    ) -> TeamStatsResponse:
+        try:
+            table = await cls._current_table(db)
+            return TeamStatsResponse(
+                **table.team_stats(team_id, last, competitions),
+                competitions=competitions or [],
+            )
+        except Exception as e:
+            if isinstance(e, HTTPException):
+                raise e
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error computing team stats: {str(e)}"
+            )
+
+    @classmethod
+    async def head_to_head(
+        cls, db: AsyncSession, team_id: int, opponent_id: int, competitions: Optional[List[str]] = None
+    ) -> HeadToHeadResponse:
+        if team_id == opponent_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Opponent must be a different team"
+            )
+        try:
+            table = await cls._current_table(db)
+            return HeadToHeadResponse(
+                **table.head_to_head(team_id, opponent_id, competitions),
+                competitions=competitions or [],
+            )
+        except Exception as e:
+            if isinstance(e, HTTPException):
+                raise e
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error computing head-to-head: {str(e)}"
+            )
+
+    @classmethod
+    async def league(cls, db: AsyncSession, competition: Optional[str] = None) -> Dict[str, Any]:
+        """Resumo das partidas encerradas e classificação calculada a partir delas"""
+        table = await cls._current_table(db)
+        if not len(table):
+            return {
+                "message": "Nenhuma partida encerrada no banco local. Consulte GET /teams/{id}/matches primeiro.",
+                "partidas": 0,
+            }
+        return table.league(competition)
+
+    @classmethod
+    async def _current_table(cls, db: AsyncSession) -> "MatchStatsTable":
+        # NumPy só é carregado na primeira consulta de estatísticas, não no startup de cada worker
+        from app.core.match_stats import MatchStatsTable
+
+        version = tuple(await MatchRepository.get_version(db))
+        if cls._table is not None and cls._table_version == version:
+            return cls._table
+
+        loop = asyncio.get_running_loop()
+        if cls._table_lock is None or cls._lock_loop is not loop:
+            cls._table_lock, cls._lock_loop = asyncio.Lock(), loop
+        async with cls._table_lock:
+            # Outra requisição pode ter montado a tabela enquanto esta aguardava
+            if cls._table is None or cls._table_version != version:
+                rows = await MatchRepository.get_finished_columns(db)
+                # Montar as colunas é CPU puro: roda fora do event loop
+                cls._table = await asyncio.to_thread(MatchStatsTable, rows)
+                cls._table_version = version
+            return cls._table
@@ -1,37 +1,72 @@
-from typing import Dict, Any
-from sqlalchemy.orm import Session
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.http_cache import make_etag
+from app.core.metrics import record_cache
+from app.core.pagination import build_page, page_columns, parse_fields
+from app.core.upstream_scheduler import Priority
+from app.models.team import Team, TeamDetail
+from app.repositories.competition import CompetitionRepository
 from app.repositories.team import TeamRepository
+from app.services.indicadores_services import IndicadoresService
+from app.services.search_services import TeamSearchService
+from app.schemas.competition import CompetitionSummary, CompetitionsResponse
 from app.schemas.team import TeamsListResponse, TeamDetails, TeamBase, Competition
-from fastapi import HTTPException, status
-from datetime import datetime
+from fastapi import BackgroundTasks, HTTPException, status
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# Competição das rotas /teams/brasileirao
+BRASILEIRAO = "BSA"
 
 
 class TeamService:
+    # Controle dos refreshes em background (um por processo / por competição / por time)
+    _refresh_lock = threading.Lock()
+    _refreshing_competitions = set()
+    _refreshing_details = set()
+
     def __init__(self):
         self.team_repository = TeamRepository()
 
-    def get_brasileirao_teams(self, db: Session, force_refresh: bool = False) -> TeamsListResponse:
+    async def get_competition_teams(
+        self,
+        db: AsyncSession,
+        code: str = BRASILEIRAO,
+        force_refresh: bool = False,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> TeamsListResponse:
         """
-        Busca times do Brasileirão Série A.
-        Usa cache (banco local) por padrão, ou busca da API se force_refresh=True
+        Busca os times de uma competição (Brasileirão Série A por padrão).
+        Usa cache (banco local) por padrão, ou busca da API se force_refresh=True.
+        Com cache expirado, retorna os dados locais e agenda um único refresh em
+        background (stale-while-revalidate) quando background_tasks é informado.
         """
         try:
             # Se force_refresh=False, tenta buscar do cache primeiro
             if not force_refresh:
-                local_teams = self.team_repository.get_all_local(db)
-                
-                if local_teams and len(local_teams) > 0:
-                    # Retorna dados do cache
-                    return self._format_local_teams_response(local_teams)
-            
-            # Se não há dados no cache OU force_refresh=True, busca da API
-            api_data = self.team_repository.get_competition_teams("BSA")
-            
-            # Salva dados no banco local (cache)
-            for team_data in api_data.get("teams", []):
-                self.team_repository.create_or_update(db, team_data)
+                competition = await CompetitionRepository.get_by_code(db, code)
+
+                if competition is not None and competition.synced_at is not None:
+                    local_teams = await CompetitionRepository.get_teams(db, competition.id)
+                    if not self.is_competition_stale(competition):
+                        record_cache("teams", "hit")
+                        return self._format_local_teams_response(competition, local_teams)
+
+                    if background_tasks is not None:
+                        # Retorna dados expirados e revalida em background
+                        record_cache("teams", "stale")
+                        self._schedule_background_refresh(code, background_tasks)
+                        return self._format_local_teams_response(competition, local_teams)
             
-            return TeamsListResponse(**api_data)
+            # Se não há dados no cache, cache expirado sem background OU force_refresh=True
+            record_cache("teams", "miss")
+            return await self.refresh_from_api(db, code)
             
         except Exception as e:
             if isinstance(e, HTTPException):
@@ -41,7 +76,151 @@ class TeamService:
                 detail=f"Error fetching teams: {str(e)}"
             )
 
-    def _format_local_teams_response(self, local_teams) -> TeamsListResponse:
+    async def get_competition_etag(
+        self,
+        db: AsyncSession,
+        code: str = BRASILEIRAO,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Optional[str]:
+        """
+        ETag da lista de times da competição a partir da versão do cache local.
+        Retorna None quando a resposta precisa consultar a API externa
+        (competição não importada, ou expirada sem background_tasks). Com cache
+        expirado, agenda o refresh em background como get_competition_teams.
+        """
+        version = await CompetitionRepository.get_version(db, code)
+        if version is None or version.synced_at is None:
+            return None
+        if self._is_update_stale(version.synced_at):
+            if background_tasks is None:
+                return None
+            self._schedule_background_refresh(code, background_tasks)
+        return make_etag("teams", code, version.total, version.newest_update)
+
+    async def list_local_teams(
+        self,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        limit: int = 50,
+        fields: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Lista os times do banco local paginados por ID externo,
+        selecionando no SQL apenas os campos pedidos
+        """
+        columns = self.team_repository.LIST_COLUMNS
+        selected = parse_fields(fields, list(columns), required="id")
+        rows = await self.team_repository.get_page(db, page_columns(selected, columns), after, limit)
+        return build_page(rows, selected, "id", limit)
+
+    async def list_competitions(self, db: AsyncSession) -> CompetitionsResponse:
+        """Competições importadas no banco local"""
+        rows = await CompetitionRepository.get_all(db)
+        return CompetitionsResponse(
+            count=len(rows),
+            competitions=[
+                CompetitionSummary(
+                    **self._competition_schema(competition).model_dump(),
+                    teams=teams,
+                    synced_at=competition.synced_at,
+                )
+                for competition, teams in rows
+            ]
+        )
+
+    async def refresh_from_api(
+        self,
+        db: AsyncSession,
+        code: str = BRASILEIRAO,
+        priority: Priority = Priority.USER
+    ) -> TeamsListResponse:
+        """
+        Busca os times da competição na API externa e salva no banco local (cache)
+        """
+        api_data = await self.team_repository.get_competition_teams(code, priority=priority)
+
+        await self._persist_competition(db, code, api_data)
+        await IndicadoresService.rebuild_snapshot(db)
+
+        return TeamsListResponse(**api_data)
+
+    async def _persist_competition(
+        self,
+        db: AsyncSession,
+        code: str,
+        api_data: Dict[str, Any],
+        already_saved: Optional[Set[int]] = None
+    ) -> Tuple[int, int]:
+        """
+        Grava os times em lote e a lista de times da competição.
+        Times em already_saved (gravados por outra competição na mesma
+        importação) só são vinculados. Retorna (novos, atualizados).
+        O snapshot de indicadores fica a cargo do chamador.
+        """
+        teams = api_data.get("teams", [])
+        pending = [team for team in teams if not already_saved or team["id"] not in already_saved]
+        result = await self.team_repository.bulk_upsert(db, pending)
+        # O código pedido vale quando a API não o repete no payload
+        competition = {"code": code, **api_data.get("competition", {})}
+        await CompetitionRepository.save_teams(
+            db, competition, api_data.get("season"), [team["id"] for team in teams]
+        )
+        if already_saved is not None:
+            already_saved.update(team["id"] for team in teams)
+        return result
+
+    @staticmethod
+    def is_competition_stale(competition) -> bool:
+        """
+        Verifica se a última importação da competição passou do TTL configurado
+        """
+        return TeamService._is_update_stale(competition.synced_at)
+
+    @staticmethod
+    def _is_update_stale(oldest_update: Optional[datetime]) -> bool:
+        """Verifica se a atualização mais antiga passou do TTL configurado"""
+        if oldest_update is None:
+            return True
+        ttl = timedelta(seconds=settings.TEAMS_CACHE_TTL_SECONDS)
+        return datetime.utcnow() - oldest_update > ttl
+
+    @classmethod
+    def _schedule_background_refresh(cls, code: str, background_tasks: BackgroundTasks) -> None:
+        """
+        Agenda o refresh do cache, garantindo apenas um refresh em andamento
+        por competição em cada processo
+        """
+        with cls._refresh_lock:
+            if code in cls._refreshing_competitions:
+                return
+            cls._refreshing_competitions.add(code)
+        background_tasks.add_task(cls._background_refresh, code)
+
+    @classmethod
+    async def _background_refresh(cls, code: str) -> None:
+        """
+        Atualiza o cache de times da competição usando uma sessão própria do banco
+        """
+        try:
+            async with SessionLocal() as db:
+                await cls().refresh_from_api(db, code, priority=Priority.BACKGROUND)
+        except Exception:
+            logger.exception("Falha ao atualizar cache de times da competição %s em background", code)
+        finally:
+            with cls._refresh_lock:
+                cls._refreshing_competitions.discard(code)
+
+    @staticmethod
+    def _competition_schema(competition) -> Competition:
+        return Competition(
+            id=competition.external_id,
+            name=competition.name,
+            code=competition.code,
+            type=competition.type,
+            emblem=competition.emblem
+        )
+
+    def _format_local_teams_response(self, competition, local_teams) -> TeamsListResponse:
         """
         Converte dados do banco local para o formato TeamsListResponse
         """
@@ -55,66 +234,119 @@ class TeamService:
                 crest=team.crest
             ))
         
-        # Cria response simulando estrutura da API
+        # Mesmo formato da API externa; a temporada vem da última importação
+        start_date = (competition.season or {}).get("startDate")
         return TeamsListResponse(
             count=len(teams_data),
-            filters={"season": "2025"},  # Mock data
-            competition=Competition(
-                id=2013,
-                name="Campeonato Brasileiro Série A", 
-                code="BSA",
-                type="LEAGUE",
-                emblem="https://crests.football-data.org/bsa.png"
-            ),
+            filters={"season": start_date[:4]} if start_date else {},
+            competition=self._competition_schema(competition),
             teams=teams_data
         )
 
-    def import_fresh_data(self, db: Session) -> Dict[str, Any]:
+    async def import_fresh_data(self, db: AsyncSession, competitions: Optional[List[str]] = None) -> Dict[str, Any]:
         """
-        Força importação de dados frescos da API (usado pelo endpoint /importar)
+        Força importação de dados frescos da API (usado pelo endpoint /importar).
+        As competições são buscadas em paralelo (o agendador respeita a cota)
+        e cada uma é gravada assim que chega, enquanto as demais ainda estão
+        em trânsito. Falhas de uma competição não impedem as outras.
         """
+        codes = list(dict.fromkeys(competitions or settings.FOOTBALL_API_COMPETITIONS))
+
+        async def fetch(code: str):
+            try:
+                return code, await self.team_repository.get_competition_teams(code), None
+            except HTTPException as e:
+                return code, None, e.detail
+
         try:
-            
-            # Busca dados da API externa
-            data = self.team_repository.get_competition_teams("BSA")
-            
-            # Conta novos vs atualizados
-            teams_importados = 0
-            teams_atualizados = 0
-            
-            for team_data in data.get("teams", []):
-                existing_team = self.team_repository.get_by_external_id(db, team_data["id"])
-                
-                if existing_team:
-                    self.team_repository.create_or_update(db, team_data)
-                    teams_atualizados += 1
-                else:
-                    self.team_repository.create_or_update(db, team_data)
-                    teams_importados += 1
-            
-            return {
+            imported: Dict[str, Dict[str, Any]] = {}
+            erros: Dict[str, str] = {}
+            saved: Set[int] = set()
+            teams_importados = teams_atualizados = 0
+
+            for next_result in asyncio.as_completed([fetch(code) for code in codes]):
+                code, data, error = await next_result
+                if data is None:
+                    erros[code] = error
+                    continue
+
+                # Upsert em lote; novos vs atualizados vêm do próprio statement
+                novos, atualizados = await self._persist_competition(db, code, data, saved)
+                teams_importados += novos
+                teams_atualizados += atualizados
+                imported[code] = {
+                    "code": code,
+                    "name": data.get("competition", {}).get("name"),
+                    "teams": len(data.get("teams", [])),
+                }
+
+            if not imported:
+                raise HTTPException(
+                    status_code=status.HTTP_502_BAD_GATEWAY,
+                    detail=f"No competition imported: {erros}"
+                )
+            await IndicadoresService.rebuild_snapshot(db)
+            # Índice de busca em memória já pronto para a primeira consulta
+            await TeamSearchService.refresh(db)
+
+            result = {
                 "message": "Dados importados com sucesso",
                 "fonte": "football-data.org API",
-                "competition": data.get("competition", {}).get("name", "Brasileirão Série A"),
+                "competition": ", ".join(imported[code]["name"] for code in codes if code in imported),
+                "competitions": [imported[code] for code in codes if code in imported],
                 "teams_novos": teams_importados,
                 "teams_atualizados": teams_atualizados,
                 "total_processados": teams_importados + teams_atualizados,
                 "timestamp": datetime.now().isoformat()
             }
+            if erros:
+                result["erros"] = erros
+            return result
             
         except Exception as e:
+            if isinstance(e, HTTPException):
+                raise e
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error importing fresh data: {str(e)}"
             )
 
-    def get_team_details(self, team_id: int, db: Session) -> TeamDetails:
+    async def get_team_details(
+        self,
+        team_id: int,
+        db: AsyncSession,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> TeamDetails:
         """
-        Busca detalhes de um time específico
+        Busca detalhes de um time específico.
+        Times importados são servidos do banco local (elenco e técnico inclusos);
+        após o TTL, os detalhes são revalidados com requisição condicional.
         """
         try:
-            data = self.team_repository.get_team_details(team_id)
-            return TeamDetails(**data)
+            local = await self.team_repository.get_with_details(db, team_id)
+
+            if local is None:
+                # Time fora do banco local: apenas repassa a API externa
+                record_cache("team_details", "miss")
+                data = await self.team_repository.get_team_details(team_id)
+                return TeamDetails(**data)
+
+            team, detail = local
+            if detail is None:
+                record_cache("team_details", "miss")
+                await self.refresh_team_details(db, team_id)
+                team, detail = await self.team_repository.get_with_details(db, team_id)
+            elif self.is_details_stale(detail):
+                record_cache("team_details", "stale")
+                if background_tasks is not None:
+                    self._schedule_details_refresh(team_id, background_tasks)
+                else:
+                    await self.refresh_team_details(db, team_id, detail)
+                    team, detail = await self.team_repository.get_with_details(db, team_id)
+            else:
+                record_cache("team_details", "hit")
+
+            return self._format_local_team_details(team, detail)
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise e
@@ -123,17 +355,111 @@ class TeamService:
                 detail=f"Error fetching team details: {str(e)}"
             )
 
-    def get_team_matches(self, team_id: int) -> Dict[Any, Any]:
+    async def get_team_details_etag(
+        self,
+        team_id: int,
+        db: AsyncSession,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Optional[str]:
+        """
+        ETag dos detalhes de um time importado. Retorna None quando o time
+        não está no banco local ou os detalhes ainda precisam ser buscados.
+        Detalhes expirados são revalidados em background.
+        """
+        version = await self.team_repository.get_details_version(db, team_id)
+        if version is None or version.synced_at is None:
+            return None
+        if self._is_details_sync_stale(version.synced_at):
+            if background_tasks is None:
+                return None
+            self._schedule_details_refresh(team_id, background_tasks)
+        # save_details sempre atualiza a linha do time; um 304 da API externa não
+        return make_etag("team", team_id, version.updated_at)
+
+    async def refresh_team_details(
+        self,
+        db: AsyncSession,
+        team_id: int,
+        detail: Optional[TeamDetail] = None,
+        priority: Priority = Priority.USER
+    ) -> bool:
         """
-        Busca partidas de um time específico
+        Revalida os detalhes do time na API externa usando ETag/Last-Modified.
+        Retorna True se houve dados novos e False quando a API respondeu 304.
         """
+        data, etag, last_modified = await self.team_repository.get_team_details_conditional(
+            team_id,
+            etag=detail.etag if detail else None,
+            last_modified=detail.last_modified if detail else None,
+            priority=priority
+        )
+
+        if data is None:
+            await self.team_repository.touch_details(db, detail.team_id, etag, last_modified)
+            return False
+
+        await self._persist_details(db, data, etag, last_modified)
+        return True
+
+    async def _persist_details(self, db: AsyncSession, data: Dict[str, Any], etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Grava os detalhes e reconstrói o snapshot de indicadores só quando
+        nome/sigla/fundação do time mudaram: o prefetch revalida os times um a
+        um, e recalcular a cada time trocaria o ETag de /indicadores e o índice
+        de busca a cada passo
+        """
+        if await self.team_repository.save_details(db, data, etag, last_modified):
+            await IndicadoresService.rebuild_snapshot(db)
+
+    @staticmethod
+    def is_details_stale(detail: TeamDetail) -> bool:
+        """Verifica se os detalhes passaram do TTL configurado"""
+        return TeamService._is_details_sync_stale(detail.synced_at)
+
+    @staticmethod
+    def _is_details_sync_stale(synced_at: datetime) -> bool:
+        ttl = timedelta(seconds=settings.TEAM_DETAILS_CACHE_TTL_SECONDS)
+        return datetime.utcnow() - synced_at > ttl
+
+    @classmethod
+    def _schedule_details_refresh(cls, team_id: int, background_tasks: BackgroundTasks) -> None:
+        """Agenda a revalidação dos detalhes, evitando duplicidade por time"""
+        with cls._refresh_lock:
+            if team_id in cls._refreshing_details:
+                return
+            cls._refreshing_details.add(team_id)
+        background_tasks.add_task(cls._background_details_refresh, team_id)
+
+    @classmethod
+    async def _background_details_refresh(cls, team_id: int) -> None:
+        """Revalida os detalhes do time usando uma sessão própria do banco"""
         try:
-            data = self.team_repository.get_team_matches(team_id)
-            return data
-        except Exception as e:
-            if isinstance(e, HTTPException):
-                raise e
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error fetching team matches: {str(e)}"
-            )
\ No newline at end of file
+            service = cls()
+            async with SessionLocal() as db:
+                local = await service.team_repository.get_with_details(db, team_id)
+                if local is not None:
+                    await service.refresh_team_details(db, team_id, local[1], priority=Priority.BACKGROUND)
+        except Exception:
+            logger.exception("Falha ao revalidar detalhes do time %s em background", team_id)
+        finally:
+            with cls._refresh_lock:
+                cls._refreshing_details.discard(team_id)
+
+    @staticmethod
+    def _format_local_team_details(team: Team, detail: Optional[TeamDetail]) -> TeamDetails:
+        """Converte o time e seus detalhes do banco local para TeamDetails"""
+        area = detail.area if detail and detail.area else ({"name": team.area} if team.area else None)
+        return TeamDetails(
+            id=team.external_id,
+            name=team.name,
+            short_name=team.short_name,
+            tla=team.tla,
+            crest=team.crest,
+            area=area,
+            founded=team.founded,
+            club_colors=team.club_colors,
+            venue=team.venue,
+            website=team.website,
+            coach=detail.coach if detail else None,
+            squad=detail.squad if detail else None
+        )
\ No newline at end of file
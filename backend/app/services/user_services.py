@@ -1,44 +1,69 @@
+from typing import Optional
+
 from app.core import security
+from app.core.pagination import build_page, page_columns, parse_fields
+from app.core.password_hashing import hash_password, verify_password
+from app.core.user_cache import user_cache
 from app.repositories.user import UserRepository
 from app.schemas.user import UserCreate, UserLogin
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class UserService:
     @staticmethod
-    def register_user(user: UserCreate, db: Session):
-        if UserRepository.get_by_username(db, user.username):
+    async def register_user(user: UserCreate, db: AsyncSession):
+        if await UserRepository.get_by_username(db, user.username):
             raise HTTPException(status_code=400, detail="Username already exists")
 
-        if UserRepository.get_by_email(db, user.email):
+        if await UserRepository.get_by_email(db, user.email):
             raise HTTPException(status_code=400, detail="Email already exists")
 
-        hashed_password = security.get_password_hash(user.password)
-        return UserRepository.create(db, user.username, user.email, user.team_favorite, hashed_password)
+        # bcrypt roda no pool de processos, fora das threads de requisição
+        hashed_password = await hash_password(user.password)
+        return await UserRepository.create(
+            db, user.username, user.email, user.team_favorite, hashed_password
+        )
 
     @staticmethod
-    def authenticate_user(user: UserLogin, db: Session):
-        db_user = UserRepository.get_by_username(db, user.username)
-        if not db_user or not security.verify_password(user.password, db_user.hashed_password):
+    async def authenticate_user(user: UserLogin, db: AsyncSession):
+        db_user = await UserRepository.get_by_username(db, user.username)
+        valid, new_hash = (False, None)
+        if db_user:
+            valid, new_hash = await verify_password(user.password, db_user.hashed_password)
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        token = security.create_access_token(data={"sub": db_user.username})
+        # Custo do bcrypt mudou: regrava o hash com o custo atual
+        if new_hash:
+            await UserRepository.update_password(db, db_user, new_hash)
+
+        # Claims extras permitem validar o token sem consultar o banco (AUTH_CLAIMS_ONLY)
+        token = security.create_access_token(data={
+            "sub": db_user.username,
+            "uid": db_user.id,
+            "email": db_user.email,
+            "team_favorite": db_user.team_favorite,
+        })
         return {"access_token": token, "token_type": "bearer"}
 
     #Casos de uso excluiso no postman
     @staticmethod
-    def get_all_users(db: Session):
-        return UserRepository.get_all(db)
+    async def list_users(db: AsyncSession, after: Optional[int], limit: int, fields: Optional[str] = None):
+        selected = parse_fields(fields, list(UserRepository.LIST_COLUMNS), required="id")
+        rows = await UserRepository.get_page(
+            db, page_columns(selected, UserRepository.LIST_COLUMNS), after, limit
+        )
+        return build_page(rows, selected, "id", limit)
 
     @staticmethod
-    def delete_user(user_id: int, db: Session):
+    async def delete_user(user_id: int, db: AsyncSession):
         # Verifica se o usuário existe
-        user = UserRepository.get_by_id(db, user_id)
+        user = await UserRepository.get_by_id(db, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -46,7 +71,8 @@ class UserService:
             )
         
         # Deleta o usuário
-        success = UserRepository.delete(db, user_id)
+        success = await UserRepository.delete(db, user_id)
+        user_cache.invalidate(user.username)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,154 @@
+"""
+Dados fixos no formato da football-data.org (v4) usados pelos benchmarks.
+
+Uma competição com N times e um turno e returno completo (cada time joga
+2 * (N - 1) partidas) por temporada. Os dados são determinísticos: a mesma
+configuração gera sempre os mesmos IDs, nomes e placares.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+COMPETITION = {
+    "id": 2013,
+    "name": "Campeonato Brasileiro Série A",
+    "code": "BSA",
+    "type": "LEAGUE",
+    "emblem": "https://crests.football-data.org/bsa.png",
+}
+AREA = {"id": 2032, "name": "Brazil", "code": "BRA", "flag": "https://crests.football-data.org/764.svg"}
+
+# IDs externos começam aqui para não parecerem índices
+FIRST_TEAM_ID = 1760
+SEASON_START = datetime(2025, 3, 29, 19, 0)
+LAST_UPDATED = "2025-12-08T00:00:00Z"
+POSITIONS = ("Goalkeeper", "Defence", "Midfield", "Offence")
+
+
+class League:
+    """Times, elencos e partidas de uma temporada sintética"""
+
+    def __init__(self, teams: int = 20, squad_size: int = 30, season: int = SEASON_START.year):
+        if teams < 2 or teams % 2:
+            raise ValueError("teams deve ser par e maior que 1")
+        self.team_ids = [FIRST_TEAM_ID + n for n in range(teams)]
+        self.squad_size = squad_size
+        self.season = season
+        self.season_info = {
+            "id": 2372 + season - SEASON_START.year,
+            "startDate": f"{season}-03-29",
+            "endDate": f"{season}-12-07",
+        }
+        self.last_updated = LAST_UPDATED.replace(str(SEASON_START.year), str(season), 1)
+        self._matches = self._schedule()
+        self._by_team: Dict[int, List[dict]] = {team_id: [] for team_id in self.team_ids}
+        for match in self._matches:
+            self._by_team[match["homeTeam"]["id"]].append(match)
+            self._by_team[match["awayTeam"]["id"]].append(match)
+
+    def team(self, team_id: int) -> dict:
+        n = team_id - FIRST_TEAM_ID
+        return {
+            "id": team_id,
+            "name": f"Esporte Clube {n + 1:02d}",
+            "shortName": f"EC {n + 1:02d}",
+            "tla": f"E{n + 1:02d}",
+            "crest": f"https://crests.football-data.org/{team_id}.png",
+            "area": AREA,
+            "address": f"Rua {n + 1}, Cidade",
+            "founded": 1895 + (n * 7) % 40,
+            "clubColors": "Red / Black",
+            "venue": f"Estádio {n + 1:02d}",
+            "website": f"https://ec{n + 1:02d}.example.com",
+            "lastUpdated": LAST_UPDATED,
+        }
+
+    def competition_teams(self) -> dict:
+        return {
+            "count": len(self.team_ids),
+            "filters": {"season": str(self.season)},
+            "competition": COMPETITION,
+            "season": self.season_info,
+            "teams": [self.team(team_id) for team_id in self.team_ids],
+        }
+
+    def competition_matches(self) -> dict:
+        return {
+            "filters": {"season": str(self.season)},
+            "resultSet": {"count": len(self._matches), "played": len(self._matches)},
+            "competition": COMPETITION,
+            "matches": self._matches,
+        }
+
+    def team_details(self, team_id: int) -> dict:
+        return {
+            **self.team(team_id),
+            "runningCompetitions": [COMPETITION],
+            "coach": {"id": team_id * 10, "name": f"Técnico {team_id}", "nationality": "Brazil"},
+            "squad": [
+                {
+                    "id": team_id * 100 + n,
+                    "name": f"Jogador {team_id}-{n}",
+                    "position": POSITIONS[n % len(POSITIONS)],
+                    "dateOfBirth": f"{1990 + n % 15}-0{1 + n % 9}-1{n % 10}",
+                    "nationality": "Brazil",
+                }
+                for n in range(self.squad_size)
+            ],
+        }
+
+    def team_matches(self, team_id: int) -> dict:
+        matches = self._by_team[team_id]
+        return {
+            "count": len(matches),
+            "filters": {"competitions": "BSA", "permission": "TIER_ONE", "limit": 100},
+            "resultSet": {"count": len(matches), "competitions": "BSA", "played": len(matches)},
+            "matches": matches,
+        }
+
+    def _schedule(self) -> List[dict]:
+        """Turno e returno pelo método do círculo"""
+        ids = list(self.team_ids)
+        rounds = len(ids) - 1
+        matches = []
+        match_id = 500000 + 10000 * (self.season - SEASON_START.year)
+        for leg in range(2):
+            rotation = list(ids)
+            for round_index in range(rounds):
+                matchday = leg * rounds + round_index + 1
+                kickoff = SEASON_START.replace(year=self.season) + timedelta(days=7 * (matchday - 1))
+                for pair in range(len(ids) // 2):
+                    home, away = rotation[pair], rotation[-1 - pair]
+                    if leg:
+                        home, away = away, home
+                    match_id += 1
+                    matches.append(self._match(match_id, matchday, kickoff, home, away))
+                rotation = [rotation[0], rotation[-1], *rotation[1:-1]]
+        return matches
+
+    def _match(self, match_id: int, matchday: int, kickoff: datetime, home: int, away: int) -> dict:
+        home_goals, away_goals = match_id % 4, (match_id // 4) % 3
+        winner = "HOME_TEAM" if home_goals > away_goals else "AWAY_TEAM" if away_goals > home_goals else "DRAW"
+        return {
+            "area": AREA,
+            "competition": COMPETITION,
+            "season": self.season_info,
+            "id": match_id,
+            "utcDate": kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "status": "FINISHED",
+            "matchday": matchday,
+            "stage": "REGULAR_SEASON",
+            "group": None,
+            "lastUpdated": self.last_updated,
+            "homeTeam": self._team_ref(home),
+            "awayTeam": self._team_ref(away),
+            "score": {
+                "winner": winner,
+                "duration": "REGULAR",
+                "fullTime": {"home": home_goals, "away": away_goals},
+                "halfTime": {"home": home_goals // 2, "away": away_goals // 2},
+            },
+        }
+
+    def _team_ref(self, team_id: int) -> dict:
+        team = self.team(team_id)
+        return {key: team[key] for key in ("id", "name", "shortName", "tla", "crest")}
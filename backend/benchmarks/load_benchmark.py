@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+Benchmark de carga de todas as rotas da API.
+
+Sobe a aplicação com uvicorn contra um banco descartável (SQLite temporário
+ou o Postgres informado em --database-url, que é APAGADO) e um stub local
+da football-data.org (benchmarks.upstream_stub) com latência configurável.
+Cada cenário é disparado por clientes concorrentes e o resultado
+(p50/p95/p99, média, máximo, erros e vazão) é gravado em JSON.
+
+Rotas da aplicação sem cenário aparecem em "uncovered_routes" no resultado.
+
+As medições são "quentes": antes dos cenários o banco é populado via
+/importar e cada time tem detalhes e partidas sincronizados uma vez.
+POST /importar continua indo ao stub a cada requisição.
+
+Os hashes de senha usam --bcrypt-rounds (padrão 4) para que as rotas de
+usuário meçam a aplicação e não o bcrypt; o custo do hash tem benchmark
+próprio em benchmarks.login_benchmark.
+
+Com --fixtures-mode record as respostas do stub são gravadas em
+--fixtures-dir (FOOTBALL_API_MODE=record); com replay o stub não é iniciado
+e a aplicação responde a partir das respostas gravadas, sem rede. O replay
+usa o mesmo --teams da gravação.
+
+Uso (a partir de backend/):
+    python -m benchmarks.load_benchmark run --concurrency 16 --requests 200 --output bench.json
+    python -m benchmarks.load_benchmark run --latency-ms 80 --baseline baseline.json --threshold 0.2
+    python -m benchmarks.load_benchmark run --fixtures-mode record --fixtures-dir /tmp/fixtures
+    python -m benchmarks.load_benchmark run --fixtures-mode replay --fixtures-dir /tmp/fixtures
+    python -m benchmarks.load_benchmark compare bench.json baseline.json --threshold 0.2
+
+No modo compare (ou run com --baseline) o processo termina com código 1
+quando algum cenário piora além do limite em relação à baseline.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.fixtures import League
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_TIMEOUT_SECONDS = 60
+
+# Métricas comparadas com a baseline: latências pioram quando sobem, vazão quando cai
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+DEFAULT_COMPARE_METRICS = ("p95_ms", "throughput_rps")
+
+
+@dataclass
+class Context:
+    """Estado compartilhado entre os cenários (token, IDs criados, ETags)"""
+    team_ids: List[int]
+    run_id: str
+    token: Optional[str] = None
+    created_user_ids: List[int] = field(default_factory=list)
+    etags: Dict[str, str] = field(default_factory=dict)
+    sequence: Iterator[int] = field(default_factory=itertools.count)
+
+    def auth(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def team(self, i: int) -> int:
+        return self.team_ids[i % len(self.team_ids)]
+
+
+# (método, url, kwargs do httpx) para a i-ésima requisição do cenário
+RequestBuilder = Callable[[int, Context], Tuple[str, str, Dict[str, Any]]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    route: str  # "MÉTODO /template", como no OpenAPI
+    build: RequestBuilder
+    expected: Tuple[int, ...] = (200,)
+    # Quantidade de requisições limitada pelo estado (ex.: usuários para apagar)
+    limit: Optional[Callable[[Context], int]] = None
+    on_response: Optional[Callable[[int, httpx.Response, Context], None]] = None
+    # Executado antes do aquecimento (ex.: ler a ETag atual da rota)
+    before: Optional[Callable[[httpx.AsyncClient, Context], Awaitable[None]]] = None
+
+
+def _get(url: str, **kwargs) -> RequestBuilder:
+    return lambda i, ctx: ("GET", url, kwargs)
+
+
+def _signup(i: int, ctx: Context):
+    # Sequência própria: o aquecimento também cria usuários
+    username = f"bench{ctx.run_id}_{next(ctx.sequence)}"
+    return "POST", "/users/signup", {"json": {
+        "username": username, "email": f"{username}@example.com", "password": "benchmark-password",
+        "team_favorite": "EC 01",
+    }}
+
+
+def _keep_user_id(i: int, response: httpx.Response, ctx: Context) -> None:
+    if response.status_code == 200:
+        ctx.created_user_ids.append(response.json()["id"])
+
+
+def _conditional(name: str, route: str, url: str) -> Scenario:
+    """GET com If-None-Match da versão atual (espera 304)"""
+    async def read_etag(client: httpx.AsyncClient, ctx: Context) -> None:
+        response = await client.get(url)
+        response.raise_for_status()
+        ctx.etags[url] = response.headers["ETag"]
+
+    return Scenario(
+        name, route, lambda i, ctx: ("GET", url, {"headers": {"If-None-Match": ctx.etags[url]}}),
+        expected=(304,), before=read_etag,
+    )
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("GET /status", "GET /status", _get("/status")),
+    # Usuários
+    Scenario("POST /users/signup", "POST /users/signup", _signup, on_response=_keep_user_id),
+    Scenario("POST /users/login", "POST /users/login", lambda i, ctx: ("POST", "/users/login", {
+        "json": {"username": f"bench{ctx.run_id}", "password": "benchmark-password"},
+    })),
+    Scenario("GET /users/me", "GET /users/me", lambda i, ctx: ("GET", "/users/me", {"headers": ctx.auth()})),
+    Scenario("GET /users/all", "GET /users/all", _get("/users/all", params={"limit": 50})),
+    Scenario(
+        "DELETE /users/{user_id}", "DELETE /users/{user_id}",
+        lambda i, ctx: ("DELETE", f"/users/{ctx.created_user_ids[i]}", {}),
+        limit=lambda ctx: len(ctx.created_user_ids),
+    ),
+    # Times
+    Scenario("GET /teams", "GET /teams", _get("/teams", params={"limit": 50})),
+    Scenario("GET /teams?fields", "GET /teams", _get("/teams", params={"limit": 50, "fields": "id,name,tla"})),
+    Scenario("GET /teams/brasileirao", "GET /teams/brasileirao", _get("/teams/brasileirao")),
+    Scenario("GET /teams/search", "GET /teams/search", _get("/teams/search", params={"q": "esporte clube 1"})),
+    _conditional("GET /teams/brasileirao [304]", "GET /teams/brasileirao", "/teams/brasileirao"),
+    Scenario(
+        "GET /teams/{team_id}", "GET /teams/{team_id}",
+        lambda i, ctx: ("GET", f"/teams/{ctx.team(i)}", {}),
+    ),
+    Scenario(
+        "GET /teams/{team_id}/matches", "GET /teams/{team_id}/matches",
+        lambda i, ctx: ("GET", f"/teams/{ctx.team(i)}/matches", {}),
+    ),
+    Scenario(
+        "GET /teams/{team_id}/matches?filters", "GET /teams/{team_id}/matches",
+        lambda i, ctx: ("GET", f"/teams/{ctx.team(i)}/matches", {
+            "params": {"status": "FINISHED", "date_from": "2025-06-01", "date_to": "2025-09-30"},
+        }),
+    ),
+    Scenario(
+        "GET /teams/{team_id}/stats", "GET /teams/{team_id}/stats",
+        lambda i, ctx: ("GET", f"/teams/{ctx.team(i)}/stats", {"params": {"last": 5}}),
+    ),
+    Scenario(
+        "GET /teams/{team_id}/head-to-head/{opponent_id}", "GET /teams/{team_id}/head-to-head/{opponent_id}",
+        lambda i, ctx: ("GET", f"/teams/{ctx.team(i)}/head-to-head/{ctx.team(i + 1)}", {}),
+    ),
+    # Competições
+    Scenario("GET /competitions", "GET /competitions", _get("/competitions")),
+    Scenario("GET /competitions/{code}/teams", "GET /competitions/{code}/teams", _get("/competitions/BSA/teams")),
+    Scenario(
+        "GET /competitions/{code}/standings", "GET /competitions/{code}/standings", _get("/competitions/BSA/standings")
+    ),
+    # Sistema
+    Scenario("POST /importar", "POST /importar", lambda i, ctx: ("POST", "/importar", {})),
+    Scenario("GET /indicadores", "GET /indicadores", _get("/indicadores")),
+    _conditional("GET /indicadores [304]", "GET /indicadores", "/indicadores"),
+    Scenario("GET /indicadores/partidas", "GET /indicadores/partidas", _get("/indicadores/partidas")),
+    Scenario("GET /upstream/status", "GET /upstream/status", _get("/upstream/status")),
+    Scenario("GET /prefetch/status", "GET /prefetch/status", _get("/prefetch/status")),
+    # Exportações
+    Scenario("GET /export/teams", "GET /export/teams", _get("/export/teams")),
+    Scenario("GET /export/matches", "GET /export/matches", _get("/export/matches")),
+    Scenario("GET /export/matches?format=csv", "GET /export/matches", _get("/export/matches", params={"format": "csv"})),
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil pelo método nearest-rank"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * pct / 100))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    values = sorted(latency * 1000 for latency in latencies)
+    total = len(values) + errors
+    return {
+        "requests": total,
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "max_ms": round(values[-1], 3) if values else 0.0,
+        "throughput_rps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    requests: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Dispara as requisições do cenário com `concurrency` clientes simultâneos"""
+    if scenario.limit is not None:
+        requests = min(requests, scenario.limit(ctx))
+    counter = itertools.count()
+    latencies: List[float] = []
+    errors = 0
+    error_samples: List[str] = []
+
+    async def worker() -> None:
+        nonlocal errors
+        while True:
+            i = next(counter)
+            if i >= requests:
+                return
+            method, url, kwargs = scenario.build(i, ctx)
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+                # Corpo lido por completo (inclusive streaming) antes de parar o relógio
+                await response.aread()
+            except httpx.HTTPError as exc:
+                errors += 1
+                if len(error_samples) < 3:
+                    error_samples.append(repr(exc))
+                continue
+            elapsed = time.perf_counter() - start
+            if response.status_code not in scenario.expected:
+                errors += 1
+                if len(error_samples) < 3:
+                    error_samples.append(f"{response.status_code} {response.text[:200]}")
+                continue
+            latencies.append(elapsed)
+            if scenario.on_response is not None:
+                scenario.on_response(i, response, ctx)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, max(requests, 1)))))
+    result = {"route": scenario.route, **summarize(latencies, errors, time.perf_counter() - start)}
+    if error_samples:
+        result["error_samples"] = error_samples
+    return result
+
+
+async def prepare(client: httpx.AsyncClient, ctx: Context) -> None:
+    """Popula o banco, cria o usuário do benchmark e aquece detalhes/partidas dos times"""
+    response = await client.post("/importar")
+    response.raise_for_status()
+    if "error" in response.json():
+        raise RuntimeError(f"Falha ao importar os times do stub: {response.text}")
+
+    username = f"bench{ctx.run_id}"
+    credentials = {"username": username, "password": "benchmark-password"}
+    response = await client.post("/users/signup", json={
+        **credentials, "email": f"{username}@example.com", "team_favorite": "EC 01",
+    })
+    response.raise_for_status()
+    response = await client.post("/users/login", json=credentials)
+    response.raise_for_status()
+    ctx.token = response.json()["access_token"]
+
+    for team_id in ctx.team_ids:
+        for url in (f"/teams/{team_id}", f"/teams/{team_id}/matches"):
+            (await client.get(url)).raise_for_status()
+
+
+async def drive(base_url: str, args: argparse.Namespace, league: League) -> Dict[str, Any]:
+    ctx = Context(team_ids=league.team_ids, run_id=str(int(time.time())))
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    selected = [
+        scenario for scenario in SCENARIOS
+        if not args.only or any(pattern in scenario.name for pattern in args.only)
+    ]
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        await prepare(client, ctx)
+
+        results = {}
+        for scenario in selected:
+            if scenario.before is not None:
+                await scenario.before(client, ctx)
+            if args.warmup and scenario.limit is None:
+                await run_scenario(client, scenario, ctx, args.warmup, args.concurrency)
+            result = await run_scenario(client, scenario, ctx, args.requests, args.concurrency)
+            results[scenario.name] = result
+            print(
+                f"  {scenario.name:<42} p50={result['p50_ms']:>8.2f}ms p95={result['p95_ms']:>8.2f}ms "
+                f"p99={result['p99_ms']:>8.2f}ms {result['throughput_rps']:>9.1f} req/s "
+                f"erros={result['errors']}"
+            )
+
+        openapi = (await client.get("/openapi.json")).json()
+
+    app_routes = {
+        f"{method.upper()} {path}"
+        for path, operations in openapi.get("paths", {}).items()
+        for method in operations
+    }
+    covered = {scenario.route for scenario in SCENARIOS}
+    return {"scenarios": results, "uncovered_routes": sorted(app_routes - covered)}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url: str, process: subprocess.Popen, log_path: str) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            break
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    with open(log_path, encoding="utf-8", errors="replace") as log:
+        tail = log.read()[-4000:]
+    raise RuntimeError(f"{url} não respondeu em {STARTUP_TIMEOUT_SECONDS}s. Log:\n{tail}")
+
+
+def _spawn(command: List[str], env: Dict[str, str], log_path: str) -> subprocess.Popen:
+    log = open(log_path, "w", encoding="utf-8")
+    return subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+
+def _stop(process: Optional[subprocess.Popen]) -> None:
+    if process is None or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> int:
+    workdir = tempfile.mkdtemp(prefix="load_benchmark_")
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'benchmark.db')}"
+    stub_port, app_port = _free_port(), _free_port()
+    league = League(args.teams)
+
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "FOOTBALL_API_BASE_URL": f"http://127.0.0.1:{stub_port}",
+        # A cota da API real não se aplica ao stub
+        "FOOTBALL_API_REQUESTS_PER_MINUTE": "1000000",
+        "FOOTBALL_API_BURST": "100000",
+        "PREFETCH_ENABLED": "false",
+        "BCRYPT_ROUNDS": str(args.bcrypt_rounds),
+        "SQL_PROFILING": "false",
+        "FOOTBALL_API_MODE": args.fixtures_mode,
+        "FOOTBALL_API_FIXTURES_DIR": os.path.abspath(args.fixtures_dir),
+    }
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    if args.workers > 1:
+        env["PROMETHEUS_MULTIPROC_DIR"] = os.path.join(workdir, "prometheus")
+        os.makedirs(env["PROMETHEUS_MULTIPROC_DIR"])
+
+    stub = app = None
+    try:
+        # Banco descartável: tabelas recriadas do zero a cada execução
+        subprocess.run([sys.executable, "reset_db.py"], cwd=BACKEND_DIR, env=env, check=True, stdout=subprocess.DEVNULL)
+
+        replay = args.fixtures_mode == "replay"
+        if not replay:
+            stub_log = os.path.join(workdir, "stub.log")
+            stub = _spawn([
+                sys.executable, "-m", "benchmarks.upstream_stub", "--port", str(stub_port),
+                "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms), "--teams", str(args.teams),
+            ], env, stub_log)
+            _wait_ready(f"http://127.0.0.1:{stub_port}/_stub/stats", stub, stub_log)
+
+        app_log = os.path.join(workdir, "app.log")
+        app = _spawn([
+            sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(app_port),
+            "--workers", str(args.workers), "--log-level", "warning", "--no-access-log",
+        ], env, app_log)
+        base_url = f"http://127.0.0.1:{app_port}"
+        _wait_ready(f"{base_url}/status", app, app_log)
+
+        print(
+            f"banco={database_url.split(':', 1)[0]} workers={args.workers} concorrência={args.concurrency} "
+            f"requisições/cenário={args.requests} "
+            + ("upstream=replay" if replay else f"latência stub={args.latency_ms}+{args.jitter_ms}ms")
+        )
+        started_at = datetime.now(timezone.utc)
+        measured = asyncio.run(drive(base_url, args, league))
+        upstream_requests = None if replay else (
+            httpx.get(f"http://127.0.0.1:{stub_port}/_stub/stats").json()["requests"]
+        )
+    finally:
+        _stop(app)
+        _stop(stub)
+        if not args.keep_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "started_at": started_at.isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": database_url.split(":", 1)[0],
+            "workers": args.workers,
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "warmup": args.warmup,
+            "upstream_mode": args.fixtures_mode,
+            "upstream_latency_ms": args.latency_ms,
+            "upstream_jitter_ms": args.jitter_ms,
+            "teams": args.teams,
+            "bcrypt_rounds": args.bcrypt_rounds,
+            "upstream_requests": upstream_requests,
+        },
+        **measured,
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2, ensure_ascii=False)
+    print(f"\nResultado gravado em {args.output}")
+    if report["uncovered_routes"]:
+        print(f"Rotas sem cenário: {', '.join(report['uncovered_routes'])}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline:
+            return compare(report, json.load(baseline), args.threshold, args.metrics, args.min_delta_ms)
+    return 1 if any(result["errors"] for result in report["scenarios"].values()) else 0
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+    metrics: Tuple[str, ...] = DEFAULT_COMPARE_METRICS,
+    min_delta_ms: float = 1.0,
+) -> int:
+    """
+    Compara cada cenário com a baseline. Regressão: latência acima de
+    (1 + threshold) x baseline (e pelo menos min_delta_ms pior), vazão abaixo
+    de (1 - threshold) x baseline, erros novos ou cenário ausente.
+    Retorna 1 se houver regressão.
+    """
+    regressions = []
+    print(f"\nComparação com a baseline (limite {threshold:.0%})")
+    for name, base in baseline["scenarios"].items():
+        result = current["scenarios"].get(name)
+        if result is None:
+            regressions.append(f"{name}: cenário ausente")
+            continue
+        if result["errors"] > base.get("errors", 0):
+            regressions.append(f"{name}: {result['errors']} erros (baseline {base.get('errors', 0)})")
+
+        for metric in metrics:
+            before, after = base.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if metric in LATENCY_METRICS:
+                regressed = change > threshold and after - before >= min_delta_ms
+            else:
+                regressed = change < -threshold
+            marker = "REGRESSÃO" if regressed else "ok"
+            print(f"  {name:<42} {metric:<15} {before:>10.2f} -> {after:>10.2f} ({change:+.1%}) {marker}")
+            if regressed:
+                regressions.append(f"{name}: {metric} {before} -> {after} ({change:+.1%})")
+
+    if regressions:
+        print("\nRegressões:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print("\nSem regressões")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_compare_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument("--threshold", type=float, default=0.2, help="Piora tolerada (0.2 = 20%%)")
+        command.add_argument(
+            "--metrics", type=lambda value: tuple(value.split(",")), default=DEFAULT_COMPARE_METRICS,
+            help="Métricas comparadas, separadas por vírgula (padrão: p95_ms,throughput_rps)",
+        )
+        command.add_argument(
+            "--min-delta-ms", type=float, default=1.0,
+            help="Diferença mínima de latência para contar como regressão (ruído)",
+        )
+
+    run_command = commands.add_parser("run", help="Executa o benchmark")
+    run_command.add_argument("--database-url", help="Banco descartável (padrão: SQLite temporário). É APAGADO.")
+    run_command.add_argument("--concurrency", type=int, default=16)
+    run_command.add_argument("--requests", type=int, default=200, help="Requisições medidas por cenário")
+    run_command.add_argument("--warmup", type=int, default=20, help="Requisições de aquecimento por cenário")
+    run_command.add_argument("--workers", type=int, default=1, help="Workers do uvicorn")
+    run_command.add_argument("--latency-ms", type=float, default=50.0, help="Latência fixa do stub")
+    run_command.add_argument("--jitter-ms", type=float, default=20.0, help="Latência aleatória extra do stub")
+    run_command.add_argument("--teams", type=int, default=20)
+    run_command.add_argument(
+        "--fixtures-mode", choices=("live", "record", "replay"), default="live",
+        help="FOOTBALL_API_MODE da aplicação (live e record usam o stub)",
+    )
+    run_command.add_argument("--fixtures-dir", default="fixtures/benchmark", help="Respostas gravadas")
+    run_command.add_argument("--bcrypt-rounds", type=int, default=4)
+    run_command.add_argument("--only", nargs="*", help="Executa apenas cenários cujo nome contém um dos trechos")
+    run_command.add_argument("--output", default="load_benchmark.json")
+    run_command.add_argument("--baseline", help="Compara com esta baseline ao final")
+    run_command.add_argument("--keep-workdir", action="store_true", help="Mantém banco e logs temporários")
+    add_compare_options(run_command)
+
+    compare_command = commands.add_parser("compare", help="Compara um resultado com a baseline")
+    compare_command.add_argument("current")
+    compare_command.add_argument("baseline")
+    add_compare_options(compare_command)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        return run(args)
+
+    with open(args.current, encoding="utf-8") as current, open(args.baseline, encoding="utf-8") as baseline:
+        return compare(json.load(current), json.load(baseline), args.threshold, args.metrics, args.min_delta_ms)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput de login (verificação bcrypt).
+
+Compara a verificação inline em threads com o pool de processos de
+app/core/password_hashing.py para 1..N workers.
+
+Uso (a partir de backend/):
+    python -m benchmarks.login_benchmark --logins 64 --rounds 12
+"""
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core import password_hashing
+from app.core.config import settings
+
+
+def _worker_counts(max_workers: int):
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+async def _run_pool(logins: int, hashed: str) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(password_hashing.verify_password("senha", hashed) for _ in range(logins)))
+    return logins / (time.perf_counter() - start)
+
+
+async def _run_threads(logins: int, hashed: str, workers: int) -> float:
+    loop = asyncio.get_running_loop()
+    context = password_hashing._crypt_context(settings.BCRYPT_ROUNDS)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, context.verify, "senha", hashed) for _ in range(logins)
+        ))
+    return logins / (time.perf_counter() - start)
+
+
+async def main(logins: int, rounds: int, max_workers: int) -> None:
+    settings.BCRYPT_ROUNDS = rounds
+    hashed = password_hashing._hash("senha", rounds)
+    print(f"bcrypt rounds={rounds} logins={logins} cpus={os.cpu_count()}")
+    print(f"{'workers':>8} {'threads (login/s)':>18} {'processos (login/s)':>20}")
+
+    for workers in _worker_counts(max_workers):
+        threads = await _run_threads(logins, hashed, workers)
+
+        settings.PASSWORD_HASH_WORKERS = workers
+        password_hashing.shutdown_hashing_pool()
+        password_hashing.start_hashing_pool()
+        # Aquece os processos antes de medir
+        await asyncio.gather(*(password_hashing.verify_password("senha", hashed) for _ in range(workers)))
+        processes = await _run_pool(logins, hashed)
+
+        print(f"{workers:>8} {threads:>18.1f} {processes:>20.1f}")
+
+    password_hashing.shutdown_hashing_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.max_workers))
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark de CPU por requisição nas rotas de leitura com payloads grandes.
+
+Popula um SQLite temporário com um time com elenco completo e uma temporada
+de partidas e mede o tempo de CPU do processo por requisição:
+
+- serialização isolada: jsonable_encoder + json.dumps (JSONResponse padrão)
+  vs Pydantic dump_json vs bytes em cache
+- requisição completa sem o cache de respostas (service + Pydantic + JSON)
+  vs com os bytes pré-serializados, com e sem gzip
+
+Uso (a partir de backend/):
+    python -m benchmarks.response_benchmark --requests 300 --matches 380
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "response_benchmark.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["PREFETCH_ENABLED"] = "false"
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.database import Base, SessionLocal, dispose_engine, get_engine  # noqa: E402
+from app.core.response_cache import response_cache, serialize  # noqa: E402
+from app.main import app  # noqa: E402
+from app.repositories.match import MatchRepository  # noqa: E402
+from app.repositories.sync_state import SyncStateRepository  # noqa: E402
+from app.repositories.team import TeamRepository  # noqa: E402
+from app.schemas.team import TeamMatchesResponse  # noqa: E402
+from app.services.match_services import MatchService  # noqa: E402
+
+TEAM_ID = 1
+
+
+def _team(team_id: int) -> dict:
+    return {
+        "id": team_id, "name": f"Time {team_id}", "shortName": f"T{team_id}", "tla": f"T{team_id:02d}",
+        "crest": f"https://crests.football-data.org/{team_id}.png", "area": {"id": 2032, "name": "Brazil"},
+        "founded": 1900 + team_id, "clubColors": "Red / Black", "venue": "Estádio", "website": "https://example.com",
+    }
+
+
+def _match(match_id: int, home: int, away: int) -> dict:
+    return {
+        "id": match_id, "utcDate": f"2025-{(match_id % 12) + 1:02d}-{(match_id % 28) + 1:02d}T19:00:00Z",
+        "status": "FINISHED", "matchday": (match_id % 38) + 1, "stage": "REGULAR_SEASON", "group": None,
+        "lastUpdated": "2025-12-01T00:00:00Z",
+        "competition": {"id": 2013, "name": "Campeonato Brasileiro Série A", "code": "BSA", "type": "LEAGUE",
+                        "emblem": "https://crests.football-data.org/bsa.png"},
+        "homeTeam": {k: v for k, v in _team(home).items() if k in ("id", "name", "shortName", "tla", "crest")},
+        "awayTeam": {k: v for k, v in _team(away).items() if k in ("id", "name", "shortName", "tla", "crest")},
+        "score": {"winner": "HOME_TEAM", "duration": "REGULAR",
+                  "fullTime": {"home": 2, "away": 1}, "halfTime": {"home": 1, "away": 0}},
+    }
+
+
+async def seed(matches: int) -> None:
+    """Cria as tabelas e grava os times, o elenco e as partidas do time medido"""
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with SessionLocal() as db:
+        await TeamRepository.bulk_upsert(db, [_team(team_id) for team_id in range(1, 21)])
+        details = {
+            **_team(TEAM_ID),
+            "coach": {"id": 1, "name": "Técnico"},
+            "squad": [
+                {"id": n, "name": f"Jogador {n}", "position": "Midfield", "dateOfBirth": "2000-01-01",
+                 "nationality": "Brazil"}
+                for n in range(30)
+            ],
+        }
+        await TeamRepository.save_details(db, details)
+
+        payload = TeamMatchesResponse(count=matches, filters={}, matches=[
+            _match(n, TEAM_ID if n % 2 else 2 + n % 19, 2 + n % 19 if n % 2 else TEAM_ID)
+            for n in range(1, matches + 1)
+        ])
+        await MatchRepository.upsert_newer(db, payload.matches)
+        await SyncStateRepository.mark_synced(db, MatchService.sync_key(TEAM_ID))
+    await dispose_engine()
+
+
+def cpu_per_call(fn, repeat: int) -> float:
+    """Tempo médio de CPU do processo (todas as threads) por chamada, em ms"""
+    fn()  # aquecimento
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat * 1000
+
+
+def main(requests: int, matches: int) -> None:
+    asyncio.run(seed(matches))
+    url = f"/teams/{TEAM_ID}/matches"
+
+    with TestClient(app) as client:
+        body = client.get(url).json()
+        model = TeamMatchesResponse(**body)
+        cached = serialize(model)
+        print(f"partidas={matches} corpo={len(cached) / 1024:.1f} KiB requisições={requests}")
+
+        print("\nSerialização isolada (ms de CPU)")
+        results = {
+            "jsonable_encoder + json.dumps": cpu_per_call(
+                lambda: json.dumps(jsonable_encoder(model), ensure_ascii=False).encode(), requests
+            ),
+            "pydantic dump_json": cpu_per_call(lambda: serialize(model), requests),
+            "bytes em cache": cpu_per_call(lambda: cached, requests),
+        }
+        for name, value in results.items():
+            print(f"  {name:<32} {value:>8.3f}")
+
+        print("\nRequisição completa (ms de CPU)")
+        for path in (url, f"/teams/{TEAM_ID}"):
+            for label, encoding, use_cache in (
+                ("sem cache, identity", "identity", False),
+                ("sem cache, gzip", "gzip", False),
+                ("bytes em cache, identity", "identity", True),
+                ("bytes em cache, gzip", "gzip", True),
+            ):
+                def call():
+                    if not use_cache:
+                        response_cache.clear()
+                    client.get(path, headers={"Accept-Encoding": encoding})
+
+                print(f"  {path:<18} {label:<26} {cpu_per_call(call, requests):>8.3f}")
+
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--matches", type=int, default=380)
+    args = parser.parse_args()
+    main(args.requests, args.matches)
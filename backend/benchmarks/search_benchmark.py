@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark da busca aproximada de times (GET /teams/search).
+
+Gera N times sintéticos (nomes com acentos, prefixos e cidades repetidos,
+como nas ligas reais), grava em um SQLite temporário e mede:
+
+- montagem do índice de trigramas em memória
+- busca isolada no índice (consultas com erros de digitação e sem acentos)
+- requisição completa GET /teams/search (latência de parede por requisição)
+
+Uso (a partir de backend/):
+    python -m benchmarks.search_benchmark --teams 10000 --requests 500
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "search_benchmark.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["PREFETCH_ENABLED"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.database import Base, SessionLocal, dispose_engine, get_engine  # noqa: E402
+from app.core.search_index import TrigramIndex  # noqa: E402
+from app.main import app  # noqa: E402
+from app.repositories.team import TeamRepository  # noqa: E402
+from app.services.indicadores_services import IndicadoresService  # noqa: E402
+from app.services.search_services import SEARCH_FIELDS  # noqa: E402
+
+PREFIXES = ["", "CR", "SE", "EC", "SC", "CA", "AA", "FC", "Clube", "Associação", "Sport Club", "Grêmio"]
+CITIES = [
+    "São Paulo", "Flamengo", "Palmeiras", "Grêmio", "Fluminense", "Botafogo", "Cruzeiro", "Atlético",
+    "Bahia", "Vitória", "Fortaleza", "Ceará", "Goiás", "Coritiba", "Paraná", "Juventude", "Criciúma",
+    "Avaí", "Figueirense", "Náutico", "Sampaio Corrêa", "Ponte Preta", "Guarani", "Ituano", "Mirassol",
+    "Chapecoense", "Cuiabá", "Bragantino", "Santos", "Vasco da Gama", "Internacional", "Sport Recife",
+]
+SUFFIXES = ["", "FC", "EC", "SAF", "Futebol Clube", "Esporte Clube", "B", "Sub-20", "Feminino"]
+QUERIES = ["Sao Paulo", "flamngo", "gremio", "palmeras", "vasco gama", "atletico", "sampaio correa", "FLU"]
+
+
+def synthetic_teams(count: int) -> list:
+    names = (
+        " ".join(part for part in (prefix, city, suffix) if part)
+        for suffix, prefix, city in itertools.product(SUFFIXES, PREFIXES, CITIES)
+    )
+    teams = []
+    for team_id, name in zip(range(1, count + 1), itertools.cycle(names)):
+        teams.append({
+            "id": team_id,
+            "name": name if team_id <= len(SUFFIXES) * len(PREFIXES) * len(CITIES) else f"{name} {team_id}",
+            "shortName": name.split(" ")[-1],
+            "tla": "".join(word[0] for word in name.split())[:3].upper(),
+        })
+    return teams
+
+
+async def seed(count: int) -> None:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as db:
+        await TeamRepository.bulk_upsert(db, synthetic_teams(count))
+        await IndicadoresService.rebuild_snapshot(db)
+    await dispose_engine()
+
+
+def percentiles(samples: list) -> str:
+    samples = sorted(samples)
+    pick = lambda pct: samples[min(len(samples) - 1, int(len(samples) * pct / 100))] * 1000  # noqa: E731
+    return f"p50={pick(50):.3f}ms p95={pick(95):.3f}ms p99={pick(99):.3f}ms"
+
+
+def main(teams: int, requests: int) -> None:
+    asyncio.run(seed(teams))
+    documents = [
+        {"id": team["id"], "name": team["name"], "short_name": team["shortName"], "tla": team["tla"]}
+        for team in synthetic_teams(teams)
+    ]
+
+    start = time.perf_counter()
+    index = TrigramIndex(documents, SEARCH_FIELDS)
+    print(f"times={teams} montagem do índice={(time.perf_counter() - start) * 1000:.1f}ms")
+
+    samples = []
+    for query in itertools.islice(itertools.cycle(QUERIES), requests):
+        start = time.perf_counter()
+        index.search(query, 10, 0.5)
+        samples.append(time.perf_counter() - start)
+    print(f"  índice em memória        {percentiles(samples)}")
+
+    with TestClient(app) as client:
+        client.get("/teams/search", params={"q": "aquecimento"})
+        samples = []
+        for query in itertools.islice(itertools.cycle(QUERIES), requests):
+            start = time.perf_counter()
+            response = client.get("/teams/search", params={"q": query})
+            samples.append(time.perf_counter() - start)
+            response.raise_for_status()
+        print(f"  GET /teams/search        {percentiles(samples)}")
+        for query in QUERIES[:3]:
+            results = client.get("/teams/search", params={"q": query, "limit": 3}).json()["results"]
+            print(f"    {query!r}: {[(result['name'], result['score']) for result in results]}")
+
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    main(args.teams, args.requests)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark da classificação incremental (GET /competitions/{code}/standings).
+
+Grava N temporadas sintéticas da competição (benchmarks.fixtures) em um
+SQLite temporário, deixando as últimas rodadas da temporada atual como
+SCHEDULED. Depois encerra essas rodadas uma a uma, como o sync faria, e
+mede:
+
+- gravação de uma rodada (upsert das partidas + atualização incremental)
+- correção de um placar já aplicado (desconta o antigo, soma o novo)
+- recálculo completo de todas as temporadas (rebuild_standings.py --fix)
+
+Antes do recálculo confere que a tabela incremental é igual a ele.
+
+Uso (a partir de backend/):
+    python -m benchmarks.standings_benchmark --seasons 10 --teams 20 --pending-rounds 10
+"""
+import argparse
+import asyncio
+import copy
+import os
+import statistics
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "standings_benchmark.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+from app.core.database import Base, SessionLocal, dispose_engine, get_engine  # noqa: E402
+from app.repositories.match import MatchRepository  # noqa: E402
+from app.repositories.standings import StandingsRepository  # noqa: E402
+from app.schemas.team import Match as MatchSchema  # noqa: E402
+from app.services.standings_services import StandingsService  # noqa: E402
+from benchmarks.fixtures import SEASON_START, League  # noqa: E402
+
+
+def scheduled(match: dict) -> dict:
+    """A mesma partida antes de acontecer"""
+    pending = copy.deepcopy(match)
+    pending["status"] = "SCHEDULED"
+    pending["lastUpdated"] = match["utcDate"]
+    pending["score"] = {"winner": None, "duration": "REGULAR", "fullTime": {"home": None, "away": None}}
+    return pending
+
+
+def timings(samples: list) -> str:
+    samples = sorted(sample * 1000 for sample in samples)
+    return (
+        f"n={len(samples)} média={statistics.mean(samples):.2f}ms "
+        f"p50={samples[len(samples) // 2]:.2f}ms máx={samples[-1]:.2f}ms"
+    )
+
+
+async def main(seasons: int, teams: int, pending_rounds: int) -> bool:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    leagues = [League(teams, squad_size=0, season=SEASON_START.year - n) for n in reversed(range(seasons))]
+    current = leagues[-1]
+    rounds = 2 * (teams - 1)
+    first_pending = rounds - pending_rounds + 1
+    by_round = {}
+    for match in current.competition_matches()["matches"]:
+        by_round.setdefault(match["matchday"], []).append(match)
+
+    async with SessionLocal() as db:
+        start = time.perf_counter()
+        total = 0
+        for league in leagues[:-1]:
+            total += await MatchRepository.upsert_newer(
+                db, [MatchSchema(**match) for match in league.competition_matches()["matches"]]
+            )
+        total += await MatchRepository.upsert_newer(db, [
+            MatchSchema(**(scheduled(match) if match["matchday"] >= first_pending else match))
+            for match in current.competition_matches()["matches"]
+        ])
+        print(
+            f"temporadas={seasons} times={teams} partidas={total} "
+            f"carga inicial={(time.perf_counter() - start):.2f}s"
+        )
+
+        round_samples = []
+        for matchday in range(first_pending, rounds + 1):
+            finished = [MatchSchema(**match) for match in by_round[matchday]]
+            start = time.perf_counter()
+            await MatchRepository.upsert_newer(db, finished)
+            round_samples.append(time.perf_counter() - start)
+        print(f"  rodada encerrada ({teams // 2} partidas)   {timings(round_samples)}")
+
+        correction_samples = []
+        for match in by_round[rounds][:pending_rounds]:
+            corrected = copy.deepcopy(match)
+            corrected["lastUpdated"] = "2099-01-01T00:00:00Z"
+            corrected["score"]["fullTime"] = {"home": match["score"]["fullTime"]["home"] + 1, "away": 0}
+            start = time.perf_counter()
+            await MatchRepository.upsert_newer(db, [MatchSchema(**corrected)])
+            correction_samples.append(time.perf_counter() - start)
+        print(f"  placar corrigido (1 partida)    {timings(correction_samples)}")
+
+        report = await StandingsService.verify(db)
+        consistent = not report["linhas_divergentes"] and not report["partidas_divergentes"]
+
+        start = time.perf_counter()
+        _, results = await StandingsRepository.compute_full(db)
+        await StandingsRepository.replace_all(db, results)
+        print(f"  recálculo completo              {(time.perf_counter() - start) * 1000:.2f}ms")
+
+        start = time.perf_counter()
+        table = await StandingsRepository.get_table(db, "BSA", current.season)
+        print(f"  leitura da classificação        {(time.perf_counter() - start) * 1000:.2f}ms ({len(table)} times)")
+
+    await dispose_engine()
+    os.remove(DB_PATH)
+    print(f"  incremental == recálculo: {consistent} ({report['linhas']} linhas, {report['partidas']} partidas)")
+    return consistent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--pending-rounds", type=int, default=10)
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(main(args.seasons, args.teams, args.pending_rounds)) else 1)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark da inicialização da aplicação (cold start de um worker).
+
+Mede, em processos novos a cada rodada:
+
+- import: tempo de `import app.main` (o que todo worker e todo teste pagam)
+- pronto: do início do processo do uvicorn até a primeira resposta 200 em /status
+
+O banco (SQLite temporário) é preparado uma vez com reset_db.py antes das
+medições, como em um deploy em que o schema já está atualizado.
+
+Uso (a partir de backend/):
+    python -m benchmarks.startup_benchmark --runs 10
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_SNIPPET = "import time; start = time.perf_counter(); import app.main; print(time.perf_counter() - start)"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(env: dict) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET], env=env, cwd=BACKEND_DIR,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_ready(env: dict, timeout: float = 30.0) -> float:
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        with httpx.Client() as client:
+            while time.perf_counter() - start < timeout:
+                try:
+                    if client.get(f"http://127.0.0.1:{port}/status", timeout=1).status_code == 200:
+                        return time.perf_counter() - start
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+        raise TimeoutError("a aplicação não respondeu a tempo")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def describe(samples: list) -> str:
+    samples = sorted(sample * 1000 for sample in samples)
+    return (
+        f"mediana={statistics.median(samples):7.1f}ms "
+        f"mín={samples[0]:7.1f}ms máx={samples[-1]:7.1f}ms"
+    )
+
+
+def main(runs: int) -> None:
+    workdir = tempfile.mkdtemp(prefix="startup-benchmark-")
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'startup.db')}",
+        "PREFETCH_ENABLED": "false",
+        "PYTHONDONTWRITEBYTECODE": "0",
+    }
+    subprocess.run([sys.executable, "reset_db.py"], env=env, cwd=BACKEND_DIR, check=True, capture_output=True)
+    # Aquece o cache de bytecode para não medir a compilação dos módulos
+    measure_import(env)
+
+    imports = [measure_import(env) for _ in range(runs)]
+    ready = [measure_ready(env) for _ in range(runs)]
+    print(f"rodadas={runs}")
+    print(f"  import app.main       {describe(imports)}")
+    print(f"  processo -> /status   {describe(ready)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    main(args.runs)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Stub local da football-data.org para os benchmarks.
+
+Serve os dados de benchmarks.fixtures com latência configurável:
+
+- GET /v4/competitions/{code}/teams
+- GET /v4/competitions/{code}/matches
+- GET /v4/teams/{id}            (com ETag e If-None-Match -> 304)
+- GET /v4/teams/{id}/matches
+
+A latência é um atraso fixo mais um jitter uniforme, aplicado antes de
+cada resposta. Não há limite de requisições: a cota fica a cargo do
+agendador da aplicação (FOOTBALL_API_REQUESTS_PER_MINUTE).
+
+Uso (a partir de backend/):
+    python -m benchmarks.upstream_stub --port 8900 --latency-ms 80 --jitter-ms 40
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+
+import orjson
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from benchmarks.fixtures import League
+
+
+def _json(payload: dict, status_code: int = 200, headers: dict = None) -> Response:
+    return Response(orjson.dumps(payload), status_code=status_code, media_type="application/json", headers=headers)
+
+
+def create_app(league: League, latency_ms: float = 0.0, jitter_ms: float = 0.0) -> Starlette:
+    # Corpos serializados uma vez: o stub não deve ser o gargalo da medição
+    teams_body = orjson.dumps(league.competition_teams())
+    competition_matches_body = orjson.dumps(league.competition_matches())
+    details = {team_id: orjson.dumps(league.team_details(team_id)) for team_id in league.team_ids}
+    etags = {team_id: f'"{hashlib.sha1(body).hexdigest()}"' for team_id, body in details.items()}
+    matches = {team_id: orjson.dumps(league.team_matches(team_id)) for team_id in league.team_ids}
+    counters = {"requests": 0}
+
+    async def delay() -> None:
+        counters["requests"] += 1
+        seconds = (latency_ms + random.uniform(0, jitter_ms)) / 1000
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    def not_found(message: str) -> Response:
+        return _json({"message": message, "errorCode": 404}, status_code=404)
+
+    async def competition_teams(request: Request) -> Response:
+        await delay()
+        if request.path_params["code"].upper() != "BSA":
+            return not_found("The resource you are looking for does not exist.")
+        return Response(teams_body, media_type="application/json")
+
+    async def competition_matches(request: Request) -> Response:
+        await delay()
+        if request.path_params["code"].upper() != "BSA":
+            return not_found("The resource you are looking for does not exist.")
+        return Response(competition_matches_body, media_type="application/json")
+
+    async def team_details(request: Request) -> Response:
+        await delay()
+        team_id = request.path_params["team_id"]
+        if team_id not in details:
+            return not_found(f"Team {team_id} not found.")
+        etag = etags[team_id]
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(details[team_id], media_type="application/json", headers={"ETag": etag})
+
+    async def team_matches(request: Request) -> Response:
+        await delay()
+        team_id = request.path_params["team_id"]
+        if team_id not in matches:
+            return not_found(f"Team {team_id} not found.")
+        return Response(matches[team_id], media_type="application/json")
+
+    async def stats(request: Request) -> Response:
+        return _json(counters)
+
+    return Starlette(routes=[
+        Route("/v4/competitions/{code}/teams", competition_teams),
+        Route("/v4/competitions/{code}/matches", competition_matches),
+        Route("/v4/teams/{team_id:int}", team_details),
+        Route("/v4/teams/{team_id:int}/matches", team_matches),
+        Route("/_stub/stats", stats),
+    ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Atraso fixo por requisição")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Atraso extra aleatório (0 a N ms)")
+    parser.add_argument("--teams", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app(League(args.teams), args.latency_ms, args.jitter_ms)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
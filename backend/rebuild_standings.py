@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Recalcula a classificação do zero a partir das partidas gravadas e confere
+a tabela mantida de forma incremental.
+
+    python rebuild_standings.py         # só verifica (sai com código 1 se divergir)
+    python rebuild_standings.py --fix   # substitui a tabela pelo recálculo
+"""
+import argparse
+import asyncio
+import sys
+
+from app.core.database import SessionLocal, dispose_engine
+from app.services.standings_services import StandingsService
+
+
+async def rebuild_standings(fix: bool) -> bool:
+    async with SessionLocal() as db:
+        report = await StandingsService.verify(db, fix=fix)
+    await dispose_engine()
+
+    print(f"Partidas com resultado: {report['partidas']} | linhas da classificação: {report['linhas']}")
+    for row in report["linhas_divergentes"][:20]:
+        print(f"  {row['competicao']} {row['temporada']} time {row['time']}: esperado {row['esperado']}, atual {row['atual']}")
+    if report["partidas_divergentes"]:
+        print(f"Partidas divergentes: {len(report['partidas_divergentes'])}")
+
+    consistent = not report["linhas_divergentes"] and not report["partidas_divergentes"]
+    if consistent:
+        print("Classificação incremental confere com o recálculo completo.")
+    elif report["corrigido"]:
+        print("Classificação substituída pelo recálculo completo.")
+    return consistent or report["corrigido"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fix", action="store_true", help="Substitui a tabela pelo recálculo quando houver divergência")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(rebuild_standings(args.fix)) else 1)
@@ -1,19 +1,44 @@
 #!/usr/bin/env python3
 """
 Script para resetar o banco de dados (para testes ou desenvolvimento).
+
+Apaga todas as tabelas e recria o schema aplicando as migrações (alembic upgrade head).
 """
-from app.core.database import engine, Base
+import asyncio
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+from app.core.database import Base, dispose_engine, get_engine
 # IMPORTANTE: Importar todos os modelos para registrar no metadata
 from app.models.user import User
-from app.models.team import Team
+from app.models.team import Team, TeamDetail
+from app.models.competition import Competition, TeamCompetition
+from app.models.indicadores import IndicadoresSnapshot
+from app.models.match import Match
+from app.models.standing import Standing, StandingMatch
+from app.models.sync_state import SyncState
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
+
+async def drop_database():
+    async with get_engine().begin() as conn:
+        print("Deletando todas as tabelas...")
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    await dispose_engine()
+
 
 def reset_database():
-    print("Deletando todas as tabelas...")
-    Base.metadata.drop_all(bind=engine)
-    
-    print("Criando tabelas novamente...")
-    Base.metadata.create_all(bind=engine)
-    
+    asyncio.run(drop_database())
+
+    # O env.py das migrações abre o próprio event loop: roda fora do asyncio.run acima
+    print("Aplicando as migrações...")
+    command.upgrade(Config(ALEMBIC_INI), "head")
+
     print("Banco resetado com sucesso!")
 
 if __name__ == "__main__":
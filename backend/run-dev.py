@@ -28,6 +28,9 @@ def main():
 
         subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], check=True)
     
+    # Aplicar as migrações pendentes (a aplicação não cria tabelas no startup)
+    subprocess.run([sys.executable, '-m', 'alembic', 'upgrade', 'head'], check=True)
+    
     # Executar o servidor
     print("Iniciando servidor de desenvolvimento...")
     print("URL: http://localhost:8000/status")
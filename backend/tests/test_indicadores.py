@@ -0,0 +1,97 @@
+"""
+GET /indicadores deve executar um número fixo de queries, independente da
+quantidade de times no banco (tanto o recálculo do snapshot quanto a leitura).
+
+Uso (a partir de backend/):
+    python -m pytest -q
+"""
+import asyncio
+import os
+import tempfile
+
+# Recálculo: resumo, rankings, décadas, upsert do snapshot e a releitura dele
+REBUILD_QUERIES = 5
+# Leitura: versão do snapshot (ETag) e o snapshot em si
+READ_QUERIES = 2
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "test_indicadores.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["PREFETCH_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.database import Base, SessionLocal, dispose_engine, get_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.repositories.team import TeamRepository  # noqa: E402
+from app.services.indicadores_services import IndicadoresService  # noqa: E402
+
+
+def _teams(count: int) -> list:
+    return [
+        {
+            "id": team_id, "name": f"Time {team_id}", "shortName": f"T{team_id}", "tla": f"T{team_id:02d}",
+            "area": {"id": 2032, "name": "Brazil"}, "founded": 1880 + team_id % 140,
+        }
+        for team_id in range(1, count + 1)
+    ]
+
+
+class StatementCounter:
+    """Conta os statements enviados ao banco enquanto ativo"""
+
+    def __init__(self):
+        self.count = 0
+        self.active = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active:
+            self.count += 1
+
+    async def measure(self, operation) -> int:
+        self.count, self.active = 0, True
+        try:
+            await operation()
+        finally:
+            self.active = False
+        return self.count
+
+
+async def _query_counts(team_counts: list) -> list:
+    engine = get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    results = []
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            for count in team_counts:
+                async with SessionLocal() as db:
+                    await TeamRepository.bulk_upsert(db, _teams(count))
+
+                    async def rebuild():
+                        await IndicadoresService.rebuild_snapshot(db)
+
+                    rebuild_queries = await counter.measure(rebuild)
+
+                async def get_indicadores():
+                    response = await client.get("/indicadores")
+                    assert response.status_code == 200
+                    decades = response.json()["distribuicao_temporal"]["por_decada"]
+                    assert sum(decade["quantidade"] for decade in decades) == count
+
+                results.append((rebuild_queries, await counter.measure(get_indicadores)))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+        await dispose_engine()
+        os.remove(DB_PATH)
+    return results
+
+
+def test_indicadores_query_count_does_not_grow_with_teams():
+    small, large = asyncio.run(_query_counts([50, 100]))
+
+    assert small == large == (REBUILD_QUERIES, READ_QUERIES)
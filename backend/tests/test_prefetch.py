@@ -0,0 +1,38 @@
+"""
+O worker de prefetch deve sobreviver a falhas do banco entre os ciclos
+(ex.: Postgres ainda subindo no startup).
+
+Uso (a partir de backend/):
+    python -m pytest -q
+"""
+import asyncio
+
+from app.repositories.sync_state import SyncStateRepository
+from app.services.prefetch_services import PrefetchWorker
+
+
+def test_worker_survives_database_error_while_scheduling(monkeypatch):
+    calls = []
+
+    async def failing_get_synced_at(db, key):
+        calls.append(key)
+        raise ConnectionRefusedError("banco indisponível")
+
+    monkeypatch.setattr(SyncStateRepository, "get_synced_at", staticmethod(failing_get_synced_at))
+
+    async def scenario():
+        worker = PrefetchWorker()
+        worker.start()
+        for _ in range(100):
+            if calls:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+
+        # Falhou uma vez e seguiu para a espera padrão em vez de encerrar a task
+        assert len(calls) == 1
+        assert not worker._task.done()
+        assert worker._next_run_at is not None
+        await worker.stop()
+
+    asyncio.run(scenario())